@@ -18,6 +18,7 @@ import psutil
 from rich.console import Console
 from rich.table import Table
 
+from bec_lib import numpy_encoder
 from bec_lib._print_versions import print_versions
 from bec_lib.acl_login import BECAccess
 from bec_lib.endpoints import MessageEndpoints
@@ -213,6 +214,9 @@ class BECService:
         global SERVICE_CONFIG
         SERVICE_CONFIG = self._service_config
         self.bootstrap_server = self._service_config.redis
+        numpy_encoder.set_compression_threshold(
+            self._service_config.model.redis.compression_threshold
+        )
 
     def _check_services(self, timeout_time=8, sleep_time=0.5) -> None:
         if not self._unique_service:
@@ -4,7 +4,7 @@ import functools
 import keyword
 import traceback
 from abc import ABC, abstractmethod
-from typing import Annotated, Callable, ClassVar, Generic, Type, TypeVar, cast
+from typing import Annotated, Any, Callable, ClassVar, Generic, Type, TypeVar, cast
 
 from pydantic import BaseModel, field_validator, model_validator
 
@@ -217,10 +217,24 @@ class BeamlineState(ABC, Generic[C]):
         self.started = False
         self._last_state: messages.BeamlineStateMessage | None = None
         self._error_prefix = f"[BL State {self.config.name}]:"
+        # serialized config, together with the config object it was created from
+        self._config_dump: tuple[C, dict[str, Any]] | None = None
 
     def update_parameters(self, **kwargs) -> None:
         """Update the configuration parameters of the state."""
-        self.config = self.CONFIG_CLASS(**{**self.config.model_dump(), **kwargs})
+        self.config = self.CONFIG_CLASS(**{**self.get_config_dump(), **kwargs})
+
+    def get_config_dump(self) -> dict[str, Any]:
+        """
+        Get the serialized configuration of the state. The result is cached until the
+        configuration is replaced, e.g. by update_parameters.
+
+        Returns:
+            dict[str, Any]: The configuration as returned by model_dump. Must not be modified.
+        """
+        if self._config_dump is None or self._config_dump[0] is not self.config:
+            self._config_dump = (self.config, self.config.model_dump())
+        return self._config_dump[1]
 
     @abstractmethod
     def evaluate(self, *args, **kwargs) -> messages.BeamlineStateMessage | None:
@@ -360,7 +374,15 @@ class DeviceBeamlineState(BeamlineState[D], Generic[D]):
                     f"[BL State {self.config.name}] No signal specified for device '{self.config.device}' and no hints available."
                 )
 
-    def start(self) -> None:
+    def start(self, readback: messages.DeviceMessage | None = None) -> None:
+        """
+        Start monitoring the device readback.
+
+        Args:
+            readback (messages.DeviceMessage | None): The current readback of the device, e.g. if
+                it was fetched together with the readbacks of other states. If None, the readback
+                is read from redis.
+        """
         if self.started:
             return
         super().start()
@@ -374,7 +396,9 @@ class DeviceBeamlineState(BeamlineState[D], Generic[D]):
             self.started = False
             return
 
-        msg = self.connector.get(MessageEndpoints.device_readback(self.device_obj.root.name))
+        msg = readback
+        if msg is None:
+            msg = self.connector.get(MessageEndpoints.device_readback(self.device_obj.root.name))
         if msg is not None:
             self._update_device_state(
                 MessageObject(
@@ -435,10 +459,9 @@ class DeviceWithinLimitsState(DeviceBeamlineState[DeviceWithinLimitsStateConfig]
         return a warning state.
         """
 
-        if self.config.low_limit is None:
-            self.config.low_limit = float("-inf")
-        if self.config.high_limit is None:
-            self.config.high_limit = float("inf")
+        # missing limits are open; the config itself is left untouched
+        low_limit = self.config.low_limit if self.config.low_limit is not None else float("-inf")
+        high_limit = self.config.high_limit if self.config.high_limit is not None else float("inf")
 
         val = msg.signals.get(self.signal_name, {}).get("value", None)
         if val is None:
@@ -448,15 +471,15 @@ class DeviceWithinLimitsState(DeviceBeamlineState[DeviceWithinLimitsStateConfig]
                 label=f"Device {self.device_obj.name}: Value {self.signal_name} not found.",
             )
 
-        if val < self.config.low_limit or val > self.config.high_limit:
+        if val < low_limit or val > high_limit:
             return messages.BeamlineStateMessage(
                 name=self.config.name,
                 status="invalid",
                 label=f"Device {self.device_obj.dotted_name} out of limits",
             )
 
-        min_warning_threshold = self.config.low_limit + self.config.tolerance
-        max_warning_threshold = self.config.high_limit - self.config.tolerance
+        min_warning_threshold = low_limit + self.config.tolerance
+        max_warning_threshold = high_limit - self.config.tolerance
 
         if val < min_warning_threshold or val > max_warning_threshold:
             return messages.BeamlineStateMessage(
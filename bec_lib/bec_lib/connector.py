@@ -56,7 +56,7 @@ class StoreInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def pipeline(self):
+    def pipeline(self, transaction: bool = True):
         """Create a pipeline for batch operations"""
 
     @abc.abstractmethod
@@ -5,9 +5,25 @@ Modified from https://github.com/lebedov/msgpack-numpy
 
 import pickle
 import sys
+import zlib
 
 import numpy as np
 
+# Arrays with at least this many bytes are compressed before they are sent. Compression trades CPU
+# time for bandwidth, so it is disabled by default. Compressed arrays can always be decoded.
+_compression_threshold: int | None = None
+
+
+def set_compression_threshold(nbytes: int | None) -> None:
+    """
+    Compress the data of numpy arrays with at least nbytes bytes using zlib.
+
+    Args:
+        nbytes (int | None): Size threshold in bytes. None disables the compression.
+    """
+    global _compression_threshold
+    _compression_threshold = nbytes
+
 
 def ndarray_to_bytes(obj):
     if obj.dtype == "O":
@@ -38,13 +54,17 @@ def numpy_encode(obj, chain=None):
             kind = b""
             descr = obj.dtype.str
 
-        return {
+        encoded = {
             b"nd": True,
             b"type": descr,
             b"kind": kind,
             b"shape": obj.shape,
             b"data": ndarray_to_bytes(obj),
         }
+        if _compression_threshold is not None and not kind and obj.nbytes >= _compression_threshold:
+            encoded[b"data"] = zlib.compress(encoded[b"data"], 1)
+            encoded[b"compression"] = b"zlib"
+        return encoded
     elif isinstance(obj, (np.bool_, np.number)):
         return {b"nd": False, b"type": obj.dtype.str, b"data": obj.data}
     elif isinstance(obj, complex):
@@ -72,9 +92,10 @@ def numpy_decode(obj, chain=None):
                     return pickle.loads(obj[b"data"])
                 else:
                     descr = obj[b"type"]
-                return np.ndarray(
-                    buffer=obj[b"data"], dtype=_unpack_dtype(descr), shape=obj[b"shape"]
-                )
+                data = obj[b"data"]
+                if b"compression" in obj:
+                    data = zlib.decompress(data)
+                return np.ndarray(buffer=data, dtype=_unpack_dtype(descr), shape=obj[b"shape"])
             else:
                 descr = obj[b"type"]
                 return np.frombuffer(obj[b"data"], dtype=_unpack_dtype(descr))[0]
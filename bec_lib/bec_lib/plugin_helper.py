@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import importlib
 import importlib.metadata
+import importlib.util
 import inspect
 import json
 import pkgutil
@@ -39,19 +40,18 @@ def get_plugin_class(class_spec: str, additional_modules=None) -> type:
         ValueError: If the class specification is invalid.
         ModuleNotFoundError: If the module could not be found.
     """
-    class_specs = class_spec.split(".")
-    if len(class_specs) == 1:
+    full_module, _, class_name = class_spec.rpartition(".")
+    if not full_module:
         raise ValueError(
             f"Invalid specification {class_spec}: The class spec should follow the syntax <package>.<module>.<class>"
         )
 
-    parent_module = class_specs[0]
-    full_module = ".".join(class_specs[:-1])
-    class_name = class_specs[-1]
+    parent_module = full_module.partition(".")[0]
 
-    if parent_module not in [
-        plugins.__name__ for plugins in _get_available_modules("bec", additional_modules)
-    ]:
+    if not any(
+        plugins.__name__ == parent_module
+        for plugins in _get_available_modules("bec", additional_modules)
+    ):
         raise ModuleNotFoundError(f"Could not find module {parent_module}.")
 
     module = _import_module(full_module)
@@ -105,10 +105,10 @@ def get_scan_component_plugins() -> list[Type[ScanComponents]]:
     from bec_server.scan_server.scans.scan_components import ScanComponents
 
     package_name = plugin_package_name()
-    try:
-        customization_package = _import_module(f"{package_name}.scans.scan_customization")
-    except ModuleNotFoundError:
+    module_name = f"{package_name}.scans.scan_customization"
+    if not _module_exists(module_name):
         return []
+    customization_package = _import_module(module_name)
 
     modules = [customization_package]
     package_path = getattr(customization_package, "__path__", None)
@@ -285,6 +285,24 @@ def reload_plugin_modules() -> None:
             sys.modules.pop(module_name, None)
 
 
+def _module_exists(module_name: str) -> bool:
+    """
+    Check whether a module can be imported without importing it. Parent packages are probed one
+    level at a time, as find_spec raises for submodules of missing packages.
+
+    Args:
+        module_name(str): The fully qualified module name.
+
+    Returns:
+        bool: True if the module is available, False otherwise.
+    """
+    parts = module_name.split(".")
+    for idx in range(1, len(parts) + 1):
+        if importlib.util.find_spec(".".join(parts[:idx])) is None:
+            return False
+    return True
+
+
 def _filter_plugins(module) -> bool:
     """
     Filter out classes that are not plugins.
@@ -334,9 +352,10 @@ def _get_available_modules(plugin: str, additional_modules=None) -> list:
         list: A list of modules.
     """
 
+    # the plugin list is cached and must not be extended in place
     modules = _get_available_plugins(plugin)
     if additional_modules:
-        modules.extend(additional_modules)
+        return [*modules, *additional_modules]
     return modules
 
 
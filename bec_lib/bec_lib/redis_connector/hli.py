@@ -133,8 +133,8 @@ class RedisConnector:
     def unregister(self, topics=None, patterns=None, cb=None):
         return self._managed_connection.unregister(topics, patterns, cb)
 
-    def pipeline(self):
-        return self._managed_connection.pipeline()
+    def pipeline(self, transaction: bool = True):
+        return self._managed_connection.pipeline(transaction)
 
     def execute_pipeline(self, pipeline):
         return self._managed_connection.execute_pipeline(pipeline)
@@ -267,9 +267,17 @@ class ManagedRedisConnection:
         )
         self.xadd(MessageEndpoints.client_info(), msg_dict={"data": client_msg}, max_size=100)
 
-    def pipeline(self) -> redis.client.Pipeline:
-        """Create a new pipeline"""
-        return self._redis_conn.pipeline()
+    def pipeline(self, transaction: bool = True) -> redis.client.Pipeline:
+        """
+        Create a new pipeline
+
+        Args:
+            transaction (bool, optional): If True, the pipeline is executed atomically within
+                MULTI/EXEC. Batches that do not need atomicity can disable it to avoid the
+                transaction overhead and to not block other clients while the batch is
+                processed. Defaults to True.
+        """
+        return self._redis_conn.pipeline(transaction=transaction)
 
     def execute_pipeline(self, pipeline) -> list:
         """
@@ -897,7 +905,8 @@ class ManagedRedisConnection:
         self, topic: str, msg, pipe: Pipeline | None = None, expire: int | None = None
     ) -> None:
         """piped combination of self.publish and self.set"""
-        client = pipe if pipe is not None else self.pipeline()
+        # a single set and publish need no MULTI/EXEC; this keeps it at two commands per round trip
+        client = pipe if pipe is not None else self.pipeline(transaction=False)
         if isinstance(msg, BECMessage):
             msg = MsgpackSerialization.dumps(msg)
         client.set(topic, msg, ex=expire)
@@ -969,7 +978,8 @@ class ManagedRedisConnection:
         if pipe:
             client = pipe
         elif expire:
-            client = self.pipeline()
+            # the expire only has to follow the xadd, it needs no MULTI/EXEC
+            client = self.pipeline(transaction=False)
         else:
             client = self._redis_conn
 
@@ -26,6 +26,8 @@ class RedisConfig(BaseModel):
 
     host: str = Field(default_factory=lambda: os.environ.get("BEC_REDIS_HOST", "localhost"))
     port: int = 6379
+    # numpy arrays with at least this many bytes are compressed before they are sent
+    compression_threshold: int | None = None
 
     @property
     def url(self) -> str:
@@ -579,7 +579,7 @@ class ConnectorMock(RedisConnector):  # pragma: no cover
         self._get_buffer.pop(topic, None)
         return val
 
-    def pipeline(self):
+    def pipeline(self, transaction: bool = True):
         return PipelineMock(self)
 
     def delete(self, topic, pipe=None):
@@ -2,16 +2,14 @@
 RPC utility functions for the bec_lib package.
 """
 
-from functools import reduce
-
 
 def rgetattr(obj, attr, *args):
     """See https://stackoverflow.com/questions/31174295/getattr-and-setattr-on-nested-objects"""
-
-    def _getattr(obj, attr):
+    if "." not in attr:
         return getattr(obj, attr, *args)
-
-    return reduce(_getattr, [obj] + attr.split("."))
+    for part in attr.split("."):
+        obj = getattr(obj, part, *args)
+    return obj
 
 
 class user_access:
@@ -245,6 +245,41 @@ class TestConcreteStates:
         assert state.signal_name == "bpm4i"
         assert state.evaluate(msg).status == "valid"
 
+    def test_device_within_limits_state_open_limits_keep_config(
+        self, connected_connector, dm_with_devices
+    ):
+        state = bl_states.DeviceWithinLimitsState(
+            name="bpm4i_above_limit",
+            device="bpm4i",
+            signal="bpm4i",
+            low_limit=1.0,
+            redis_connector=connected_connector,
+            device_manager=dm_with_devices,
+        )
+        state.start()
+
+        msg = messages.DeviceMessage(
+            signals={"bpm4i": {"value": 1e6, "timestamp": 1.0}}, metadata={"stream": "primary"}
+        )
+
+        assert state.evaluate(msg).status == "valid"
+        assert state.config.high_limit is None
+
+    def test_config_dump_cached_until_parameters_change(self):
+        state = bl_states.DeviceWithinLimitsState(
+            name="samx_within_limits", device="samx", low_limit=0.0, high_limit=10.0
+        )
+
+        with mock.patch.object(
+            type(state.config), "model_dump", autospec=True, side_effect=BaseModel.model_dump
+        ) as model_dump:
+            dump = state.get_config_dump()
+            assert state.get_config_dump() is dump
+            assert model_dump.call_count == 1
+
+            state.update_parameters(high_limit=5.0)
+            assert state.get_config_dump()["high_limit"] == 5.0
+
 
 class TestBeamlineStateManager:
     def test_manager_registers_for_state_updates(self, connected_connector):
@@ -1,5 +1,6 @@
 import csv
 import os
+from types import SimpleNamespace
 from unittest import mock
 
 import pytest
@@ -8,7 +9,7 @@ from bec_lib import messages
 from bec_lib.live_scan_data import LiveScanData
 from bec_lib.scan_items import ScanItem
 from bec_lib.scan_report import ScanReport
-from bec_lib.utils.rpc_utils import user_access
+from bec_lib.utils.rpc_utils import rgetattr, user_access
 from bec_lib.utils.scan_utils import (
     _extract_scan_data,
     _render_scan_cli_value,
@@ -84,6 +85,17 @@ def test_user_access(class_factory):
     ]
 
 
+def test_rgetattr():
+    """Test rgetattr function."""
+    obj = SimpleNamespace(child=SimpleNamespace(value=5), value=3)
+    assert rgetattr(obj, "value") == 3
+    assert rgetattr(obj, "child.value") == 5
+    assert rgetattr(obj, "missing", None) is None
+    assert rgetattr(obj, "child.missing", None) is None
+    with pytest.raises(AttributeError):
+        rgetattr(obj, "child.missing")
+
+
 def test__write_csv():
     """Test _write_csv function."""
 
@@ -25,6 +25,19 @@ def test_get_plugin_class_module_not_found(class_spec):
         plugin_helper.get_plugin_class(class_spec, [bec_lib])
 
 
+def test_get_plugin_class_does_not_grow_cached_plugins():
+    plugin_helper._get_available_plugins.cache_clear()
+    num_plugins = len(plugin_helper._get_available_plugins("bec"))
+    for _ in range(3):
+        plugin_helper.get_plugin_class("bec_lib.messages.BECMessage", [bec_lib])
+    assert len(plugin_helper._get_available_plugins("bec")) == num_plugins
+
+
+def test_get_plugin_class_invalid_spec():
+    with pytest.raises(ValueError):
+        plugin_helper.get_plugin_class("BECMessage", [bec_lib])
+
+
 def test_module_dist_info():
     result = plugin_helper.module_dist_info("bec_lib")
     assert result["dir_info"] == {"editable": True}
@@ -109,6 +122,7 @@ def test_get_scan_component_plugins(monkeypatch):
     module.PluginComponents = plugin_components
 
     monkeypatch.setattr(plugin_helper, "plugin_package_name", lambda: "example_plugin")
+    monkeypatch.setattr(plugin_helper, "_module_exists", lambda name: True)
     monkeypatch.setattr(
         plugin_helper,
         "_import_module",
@@ -125,6 +139,21 @@ def test_get_scan_component_plugins(monkeypatch):
     assert result == [plugin_components]
 
 
+def test_get_scan_component_plugins_without_customization(monkeypatch):
+    import_module = mock.Mock()
+    monkeypatch.setattr(plugin_helper, "plugin_package_name", lambda: "example_plugin")
+    monkeypatch.setattr(plugin_helper, "_import_module", import_module)
+
+    assert plugin_helper.get_scan_component_plugins() == []
+    import_module.assert_not_called()
+
+
+def test_module_exists():
+    assert plugin_helper._module_exists("bec_lib.plugin_helper")
+    assert not plugin_helper._module_exists("bec_lib.does_not_exist")
+    assert not plugin_helper._module_exists("does_not_exist.scans.scan_customization")
+
+
 def test_get_file_writer_storage_copy_plugin(monkeypatch):
     handler = mock.Mock()
 
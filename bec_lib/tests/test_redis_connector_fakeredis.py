@@ -5,6 +5,7 @@ from typing import Generator
 from unittest import mock
 
 import fakeredis
+import numpy as np
 import pytest
 import redis
 from redis.client import Pipeline
@@ -334,6 +335,33 @@ def test_redis_connector_execute_pipeline_returns_list(connected_connector):
     assert isinstance(res, list) and len(res) == 2
 
 
+def test_redis_connector_pipeline_without_transaction(connected_connector):
+    connector = connected_connector
+    pipe = connector.pipeline(transaction=False)
+    assert pipe.transaction is False
+    connector.set_and_publish("test", messages.VariableMessage(value=1), pipe=pipe)
+    connector.execute_pipeline(pipe)
+    assert connector.get("test") == messages.VariableMessage(value=1)
+
+
+def test_redis_connector_set_and_publish_without_transaction(connected_connector):
+    connector = connected_connector
+    with mock.patch.object(connector, "pipeline", wraps=connector.pipeline) as pipeline:
+        connector.set_and_publish("test", messages.VariableMessage(value=1))
+    pipeline.assert_called_once_with(transaction=False)
+    assert connector.get("test") == messages.VariableMessage(value=1)
+
+
+def test_redis_connector_xadd_with_expire_without_transaction(connected_connector):
+    connector = connected_connector
+    msg = messages.DevicePreviewMessage(device="eiger", signal="preview", data=np.zeros((4, 4)))
+    with mock.patch.object(connector, "pipeline", wraps=connector.pipeline) as pipeline:
+        connector.xadd("test", {"data": msg}, max_size=2, expire=10)
+    pipeline.assert_called_once_with(transaction=False)
+    assert 0 < connector._redis_conn.ttl("test") <= 10
+    assert np.array_equal(connector.get_last("test", "data").data, msg.data)
+
+
 def test_redis_connector_lpush(connected_connector):
     connector = connected_connector
     connector.lpush("test", "test_msg")
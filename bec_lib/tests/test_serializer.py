@@ -5,7 +5,7 @@ import numpy as np
 import pytest
 from pydantic import BaseModel
 
-from bec_lib import messages
+from bec_lib import messages, numpy_encoder
 from bec_lib.codecs import BECCodec
 from bec_lib.device import DeviceBase
 from bec_lib.devicemanager import DeviceManagerBase
@@ -70,6 +70,31 @@ def test_serialize(serializer, data):
     assert all(res) if isinstance(data, np.ndarray) else res
 
 
+@pytest.fixture
+def compression_threshold():
+    numpy_encoder.set_compression_threshold(1024)
+    yield
+    numpy_encoder.set_compression_threshold(None)
+
+
+def test_serialize_compresses_large_arrays(compression_threshold):
+    image = np.zeros((256, 256), dtype=np.uint16)
+    image[10:20, 10:20] = 5
+    small = np.arange(10)
+    data = messages.DeviceMonitor2DMessage(device="eiger", data=image, metadata={})
+
+    raw = MsgpackSerialization.dumps(data)
+    assert len(raw) < image.nbytes
+    assert np.array_equal(MsgpackSerialization.loads(raw).data, image)
+    assert b"compression" not in numpy_encoder.numpy_encode(small)
+    assert np.array_equal(msgpack.loads(msgpack.dumps(small)), small)
+
+    numpy_encoder.set_compression_threshold(None)
+    # compressed arrays can still be decoded after the compression is disabled
+    assert np.array_equal(MsgpackSerialization.loads(raw).data, image)
+    assert len(MsgpackSerialization.dumps(data)) > image.nbytes
+
+
 def test_serialize_model(serializer):
 
     class DummyModel(BaseModel):
@@ -158,3 +158,9 @@ class DAPServiceBase(abc.ABC):
         Process the data and return the result. Ensure that the return value
         is a tuple of (stream_output, metadata) and that it is serializable.
         """
+
+    def shutdown(self):
+        """
+        Release resources held by the service, e.g. worker threads. Called by
+        the service manager when a continuous service is replaced or stopped.
+        """
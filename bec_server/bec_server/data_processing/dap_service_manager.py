@@ -85,6 +85,8 @@ class DAPServiceManager:
             return
         if self.continuous_dap is not None:
             self.client.callbacks.remove(self.continuous_dap["id"])
+            self.continuous_dap["instance"].shutdown()
+            self.continuous_dap = None
 
         dap_config = dap_request_msg.content["config"]
         if not dap_config.get("auto_run"):
@@ -271,6 +273,9 @@ class DAPServiceManager:
 
     def shutdown(self) -> None:
         self.threadpool.shutdown()
+        if self.continuous_dap is not None:
+            self.continuous_dap["instance"].shutdown()
+            self.continuous_dap = None
         if not self._started:
             return
         self.connector.shutdown()
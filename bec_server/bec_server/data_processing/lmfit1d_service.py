@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import inspect
 from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 
 import lmfit
@@ -58,6 +59,13 @@ class LmfitService1D(DAPServiceBase):
         self.data = None
         self.continuous = continuous
         self.oversample = 1
+        # continuous fits are pipelined: the next data fetch overlaps with the previous fit/publish
+        self._executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="lmfit_fit")
+            if continuous
+            else None
+        )
+        self._pending_fit: Future | None = None
 
     def _build_model(self, model: str | list[str] | tuple[str, ...]) -> lmfit.Model:
         if isinstance(model, (list, tuple)):
@@ -366,7 +374,25 @@ class LmfitService1D(DAPServiceBase):
         data = self.get_data_from_current_scan(scan_item=self.current_scan_item)
         if not data:
             return
+        if self._executor is None:
+            self.data = data
+            self._fit_and_publish()
+            return
+        # only one fit may be in flight; wait for it before swapping the data
+        self._wait_for_pending_fit()
         self.data = data
+        self._pending_fit = self._executor.submit(self._fit_and_publish)
+
+    def _wait_for_pending_fit(self) -> None:
+        if self._pending_fit is None:
+            return
+        try:
+            self._pending_fit.result()
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning(f"Continuous lmfit fit failed: {exc}")
+        self._pending_fit = None
+
+    def _fit_and_publish(self) -> None:
         out = self.process()
         if not out:
             return
@@ -378,6 +404,15 @@ class LmfitService1D(DAPServiceBase):
             expire=60,
         )
 
+    def shutdown(self) -> None:
+        """
+        Wait for a pending continuous fit and stop the fit worker.
+        """
+        if self._executor is None:
+            return
+        self._wait_for_pending_fit()
+        self._executor.shutdown()
+
     def configure(
         self,
         scan_item: ScanItem | str = None,
@@ -116,7 +116,7 @@ class BECMessageHandler:
 
         data = message.data
         # Convert sizes from bytes to MB
-        dsize = len(data.tobytes()) / 1e6
+        dsize = data.nbytes / 1e6
         max_size = 1000
         if dsize > max_size:
             logger.warning(
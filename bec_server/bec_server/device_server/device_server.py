@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import enum
+import functools
 import inspect
 import threading
 import time
 import traceback
+import weakref
 from collections import deque
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 import ophyd
@@ -18,10 +21,10 @@ from bec_lib.alarm_handler import Alarms
 from bec_lib.bec_errors import ExceptionWithErrorInfo
 from bec_lib.bec_service import BECService
 from bec_lib.device import OnFailure
-from bec_lib.endpoints import MessageEndpoints
+from bec_lib.endpoints import EndpointInfo, MessageEndpoints
 from bec_lib.logger import bec_logger
 from bec_lib.messages import BECStatus
-from bec_lib.serialization import json_ext
+from bec_lib.serialization import MsgpackSerialization, json_ext
 from bec_lib.utils.rpc_utils import rgetattr
 from bec_server.device_server.devices.devicemanager import DeviceManagerDS
 from bec_server.device_server.friendly_device_exceptions import reformat_known_device_exceptions
@@ -44,6 +47,15 @@ class InvalidDeviceError(Exception):
     """Exception raised when an invalid device is accessed"""
 
 
+@dataclass(slots=True)
+class _StagedStatusContext:
+    """Context of a stage/unstage status object, bound to its staged callback."""
+
+    instr: messages.DeviceInstructionMessage
+    obj: OphydObject
+    state: int
+
+
 class ResponseState(str, enum.Enum):
     """Enum for the state of the response message"""
 
@@ -58,12 +70,81 @@ class RequestHandler:
     status objects and sending the appropriate responses back to redis.
     """
 
+    RUNNING_FLUSH_INTERVAL = 0.05
+    NUM_LOCK_SHARDS = 16
+
     def __init__(self, parent: DeviceServer):
         self.parent = parent
         self.connector = parent.connector
         self._storage = {}
-        self._lock = threading.Lock()
+        # requests are guarded per instruction ID; unrelated instructions rarely share a shard
+        self._locks = [threading.RLock() for _ in range(self.NUM_LOCK_SHARDS)]
         self._stopped_requests = deque(maxlen=50)
+        # instruction info attached to status objects; entries vanish with the status objects
+        self._status_meta: weakref.WeakKeyDictionary[StatusBase, dict] = weakref.WeakKeyDictionary()
+        # running responses are only built when they are actually sent: instr_id -> (instr, is_status_obj)
+        self._pending_running: dict[str, tuple[messages.DeviceInstructionMessage, bool | None]] = {}
+        self._pending_lock = threading.Lock()
+        # held from taking pending responses until they are sent, so that a terminal response
+        # can never be sent while an older running response for it is still in flight
+        self._send_lock = threading.Lock()
+        self._shutdown_event = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._flush_running_loop, name="device_instr_response_flush", daemon=True
+        )
+        self._flush_thread.start()
+
+    def shutdown(self):
+        """
+        Stop the background flush of running responses and send any pending ones.
+        """
+        self._shutdown_event.set()
+        self._flush_thread.join()
+        self.flush_running_responses()
+
+    def _flush_running_loop(self):
+        while not self._shutdown_event.wait(self.RUNNING_FLUSH_INTERVAL):
+            self.flush_running_responses()
+
+    def flush_running_responses(self):
+        """
+        Send all buffered 'running' responses in a single pipeline. Only the latest
+        running response per instruction is kept.
+        """
+        with self._send_lock:
+            with self._pending_lock:
+                if not self._pending_running:
+                    return
+                pending = self._pending_running
+                self._pending_running = {}
+            pipe = self.connector.pipeline()
+            for instr_id, (instr, is_status_obj) in pending.items():
+                if self._is_stopped(instr.metadata):
+                    continue
+                response_msg = self._running_response(instr_id, instr, is_status_obj)
+                self.connector.send(
+                    MessageEndpoints.device_instructions_response(), response_msg, pipe
+                )
+            pipe.execute()
+
+    @staticmethod
+    def _running_response(
+        instr_id: str, instr: messages.DeviceInstructionMessage, is_status_obj: bool | None
+    ) -> messages.DeviceInstructionResponse:
+        # All fields stem from the already validated instruction, so validation is skipped.
+        # This also lets the response share the instruction's metadata dict instead of copying it.
+        return messages.DeviceInstructionResponse.model_construct(
+            device=instr.device,
+            status=ResponseState.RUNNING.value,
+            instruction_id=instr_id,
+            instruction=instr,
+            result_is_status=is_status_obj,
+            metadata=instr.metadata,
+        )
+
+    def _is_stopped(self, metadata: dict) -> bool:
+        stop_keys = ["RID", "scan_id", "queue_id"]
+        return any(metadata.get(key) in self._stopped_requests for key in stop_keys)
 
     def add_request(
         self,
@@ -71,29 +152,85 @@ class RequestHandler:
         num_status_objects: int,
         done: bool = False,
         success: bool | None = None,
+        result: Any = None,
     ):
         """
         Add a new device instruction to the storage and the expected number of status objects.
-        If the instruction is done, the success status must be set.
+        If the instruction is done, the success status must be set. Instructions that are already
+        done are not stored; only their final response is sent.
 
         Args:
             instr(messages.DeviceInstructionMessage): The instruction to add to the storage.
             num_status_objects(int): The number of status objects that are expected to be generated by the instruction.
             done(bool): Whether the instruction is done. Defaults to False.
             success(bool): Whether the instruction was successful. Defaults to None.
+            result(Any): The result of the instruction if it is done. Defaults to None.
         """
         instr_id = instr.metadata["device_instr_id"]
+        if done:
+            if success is None:
+                raise ValueError("If the instruction is done, the success status must be set.")
+            self._send_response(instr_id, instr, success, done=True, result=result)
+            return
         self._storage[instr_id] = {
             "instr": instr,
             "status_objects": [],
             "num_status_objects": num_status_objects,
             "done": done,
             "is_status_obj": None,
+            # number of finished status objects and the first error, see on_status_object_update
+            "done_count": 0,
+            "first_exception": None,
+            # redis updates that are written together once the request is finished
+            "deferred_sets": [],
         }
-        if done and success is None:
-            raise ValueError("If the instruction is done, the success status must be set.")
         self.send_device_instruction_response(instr_id, success, done)
 
+    def _lock_for(self, instr_id: str) -> threading.RLock:
+        return self._locks[hash(instr_id) % self.NUM_LOCK_SHARDS]
+
+    def set_status_info(
+        self,
+        status_obj: ophyd.StatusBase,
+        instruction: messages.DeviceInstructionMessage,
+        obj: OphydObject,
+        **kwargs,
+    ) -> None:
+        """
+        Attach the instruction and the device object to a status object.
+
+        Args:
+            status_obj(ophyd.StatusBase): The status object.
+            instruction(messages.DeviceInstructionMessage): The instruction that created the status object.
+            obj(OphydObject): The ophyd object that created the status object.
+            **kwargs: Additional information to store, e.g. a subscription ID.
+        """
+        # resolve the device reported by the status once instead of on every status callback
+        if hasattr(status_obj, "device"):
+            status_device = status_obj.device
+        elif hasattr(status_obj, "obj"):
+            status_device = status_obj.obj
+        else:
+            status_device = None
+        self._status_meta[status_obj] = {
+            "instruction": instruction,
+            "obj": obj,
+            "status_device": status_device if status_device is not None else obj,
+            **kwargs,
+        }
+
+    def get_status_info(self, status_obj: ophyd.StatusBase) -> dict | None:
+        """
+        Get the information attached to a status object.
+
+        Args:
+            status_obj(ophyd.StatusBase): The status object.
+
+        Returns:
+            dict | None: The status information or None if nothing was attached.
+        """
+        return self._status_meta.get(status_obj)
+
     def get_request(self, instr_id: str) -> dict | None:
         """
         Get a request from the storage.
@@ -114,12 +251,43 @@ class RequestHandler:
             num_status_objects(int): The new number of status objects.
         """
         instr_id = instr.metadata["device_instr_id"]
-        request_info = self.get_request(instr_id)
-        if request_info is None:
-            return
-        request_info["num_status_objects"] = num_status_objects
+        with self._lock_for(instr_id):
+            request_info = self.get_request(instr_id)
+            if request_info is None:
+                return
+            request_info["num_status_objects"] = num_status_objects
 
-        self._update_instruction(instr_id)
+            self._update_instruction(instr_id)
+
+    def defer_set(self, instr_id: str, topic: EndpointInfo, msg: messages.BECMessage) -> bool:
+        """
+        Defer a redis set until the request is finished. All deferred updates of a request
+        are written in a single pipeline right before its final response is sent.
+
+        Args:
+            instr_id(str): The ID of the instruction.
+            topic(EndpointInfo): The endpoint to set.
+            msg(messages.BECMessage): The message to set.
+
+        Returns:
+            bool: False if the request is unknown and the update was not deferred.
+        """
+        with self._lock_for(instr_id):
+            request_info = self.get_request(instr_id)
+            if request_info is None:
+                return False
+            request_info["deferred_sets"].append((topic, msg))
+            return True
+
+    def _write_deferred_sets(self, request_info: dict) -> None:
+        deferred_sets = request_info["deferred_sets"]
+        if not deferred_sets:
+            return
+        pipe = self.connector.pipeline()
+        for topic, msg in deferred_sets:
+            self.connector.set(topic, msg, pipe)
+        pipe.execute()
+        deferred_sets.clear()
 
     def remove_request(self, instr_id: str):
         """
@@ -128,7 +296,8 @@ class RequestHandler:
         Args:
             instr_id(str): The ID of the instruction.
         """
-        self._storage.pop(instr_id, None)
+        with self._lock_for(instr_id):
+            self._storage.pop(instr_id, None)
 
     def clear(self):
         """
@@ -144,7 +313,8 @@ class RequestHandler:
             instr_id(str): The ID of the instruction.
             status_obj(ophyd.StatusBase): The status object to add.
         """
-        self._storage[instr_id]["status_objects"].append(status_obj)
+        with self._lock_for(instr_id):
+            self._storage[instr_id]["status_objects"].append(status_obj)
         status_obj.add_callback(self.on_status_object_update)
         self._update_instruction(instr_id, is_status_obj=True)
 
@@ -164,18 +334,18 @@ class RequestHandler:
             error_info(messages.ErrorInfo, optional): Error information. Defaults to None.
             result(Any): The result of the instruction. Defaults to None. Only relevant for RPC calls.
         """
-        with self._lock:
+        with self._lock_for(instr_id):
             request_info = self.get_request(instr_id)
             if request_info is None:
                 return
             if success is None:
                 if request_info["num_status_objects"] > 0:
                     success = all(
-                        status_obj.success
-                        for status_obj in self._storage[instr_id]["status_objects"]
+                        status_obj.success for status_obj in request_info["status_objects"]
                     )
                 else:
                     success = True
+            self._write_deferred_sets(request_info)
             self.send_device_instruction_response(
                 instr_id,
                 success,
@@ -194,7 +364,15 @@ class RequestHandler:
             status_obj(ophyd.StatusBase): The status object that was updated.
         """
         self.parent.status_callback(status_obj)
-        instr_id = status_obj.instruction.metadata["device_instr_id"]
+        instr_id = self._status_meta[status_obj]["instruction"].metadata["device_instr_id"]
+        with self._lock_for(instr_id):
+            request_info = self.get_request(instr_id)
+            if request_info is not None:
+                request_info["done_count"] += 1
+                if request_info["first_exception"] is None and isinstance(status_obj, StatusBase):
+                    error = status_obj.exception()
+                    if error:
+                        request_info["first_exception"] = (error, status_obj)
         self._update_instruction(instr_id, is_status_obj=True)
 
     def _update_instruction(self, instr_id: str, is_status_obj: bool = False) -> None:
@@ -205,32 +383,29 @@ class RequestHandler:
             instr_id(str): The ID of the instruction.
             is_status_obj(bool): Whether we are working with an ophyd status object as result.
         """
-        request_info = self.get_request(instr_id)
-        if request_info is None:
-            return
+        with self._lock_for(instr_id):
+            request_info = self.get_request(instr_id)
+            if request_info is None:
+                return
 
-        if not request_info["is_status_obj"] and is_status_obj:
-            request_info["is_status_obj"] = True
-            self.send_device_instruction_response(
-                instr_id, success=False, done=False, is_status_obj=True, result=None
-            )
+            if not request_info["is_status_obj"] and is_status_obj:
+                request_info["is_status_obj"] = True
+                self.send_device_instruction_response(
+                    instr_id, success=False, done=False, is_status_obj=True, result=None
+                )
 
-        if len(request_info["status_objects"]) != request_info["num_status_objects"]:
-            return
+            num_status_objects = len(request_info["status_objects"])
+            if num_status_objects != request_info["num_status_objects"]:
+                return
 
-        status_objects = request_info["status_objects"]
+            # the status callbacks keep count, so no need to walk all status objects here
+            if request_info["done_count"] < num_status_objects:
+                return
 
-        if all(status_obj.done for status_obj in status_objects):
-            exceptions = [
-                (status_obj.exception(), status_obj)
-                for status_obj in status_objects
-                if isinstance(status_obj, StatusBase)
-            ]
-            if any(val for val, _ in exceptions):
-                error, obj = next((val, obj) for val, obj in exceptions if val)
+            if request_info["first_exception"] is not None:
+                error, obj = request_info["first_exception"]
                 error_info = self.get_error_info(error, obj)
                 self.set_finished(instr_id, success=False, error_info=error_info)
-
             else:
                 self.set_finished(instr_id, success=True)
 
@@ -255,15 +430,16 @@ class RequestHandler:
         else:
             device_name = None
 
+        instruction = self._status_meta[obj]["instruction"]
         msg = (
             f"{error.__class__.__name__}: {error}\n"
             f"The status {obj.__class__.__name__} from device {device_name} failed during the execution "
             f"of the following instruction:\n"
-            f"{json_ext.dumps(obj.instruction, indent=2)}\n"
+            f"{json_ext.dumps(instruction, indent=2)}\n"
         )
-        if obj.instruction.action:
+        if instruction.action:
             compact_msg = (
-                f"An error occurred during '{obj.instruction.action}' on device '{device_name}'.\n\n"
+                f"An error occurred during '{instruction.action}' on device '{device_name}'.\n\n"
                 f"{error.__class__.__name__}: {str(error)}"
             )
         else:
@@ -296,30 +472,67 @@ class RequestHandler:
             result(Any): The result of the instruction. Defaults to None.
             is_status_obj(bool | None): Whether the result is a status object. Defaults to None.
         """
-        metadata = self._storage[instr_id]["instr"].metadata
-        stop_keys = ["RID", "scan_id", "queue_id"]
-        if any(metadata.get(key) in self._stopped_requests for key in stop_keys):
+        request_info = self._storage.get(instr_id)
+        if request_info is None:
+            return
+        self._send_response(
+            instr_id,
+            request_info["instr"],
+            success,
+            done,
+            error_info=error_info,
+            result=result,
+            is_status_obj=is_status_obj,
+        )
+
+    def _send_response(
+        self,
+        instr_id: str,
+        instr: messages.DeviceInstructionMessage,
+        success: bool,
+        done: bool,
+        error_info: messages.ErrorInfo | None = None,
+        result: Any = None,
+        is_status_obj: bool | None = None,
+    ):
+        metadata = instr.metadata
+        if self._is_stopped(metadata):
             logger.info(
                 f"Instruction with metadata {metadata} is in stopped requests, skipping response."
             )
+            with self._pending_lock:
+                self._pending_running.pop(instr_id, None)
             return
 
-        if success:
-            status = ResponseState.COMPLETED
-        else:
-            status = ResponseState.ERROR if done else ResponseState.RUNNING
+        if not success and not done:
+            # intermediate updates are coalesced and sent by the flush thread; a superseded
+            # running update never gets a message object
+            with self._pending_lock:
+                self._pending_running[instr_id] = (instr, is_status_obj)
+            return
 
+        status = ResponseState.COMPLETED if success else ResponseState.ERROR
         response_msg = messages.DeviceInstructionResponse(
-            device=self._storage[instr_id]["instr"].content["device"],
+            device=instr.device,
             status=status.value,
             error_info=error_info,
             instruction_id=instr_id,
-            instruction=self._storage[instr_id]["instr"],
+            instruction=instr,
             result=result,
             result_is_status=is_status_obj,
             metadata=metadata,
         )
-        self.connector.send(MessageEndpoints.device_instructions_response(), response_msg)
+        # a terminal response must not overtake a pending running response, including one the
+        # flush thread has already taken but not yet sent
+        with self._send_lock:
+            with self._pending_lock:
+                pending = self._pending_running.pop(instr_id, None)
+            if pending is not None:
+                self.connector.send(
+                    MessageEndpoints.device_instructions_response(),
+                    self._running_response(instr_id, *pending),
+                )
+            self.connector.send(MessageEndpoints.device_instructions_response(), response_msg)
 
 
 class DeviceServer(BECService):
@@ -327,11 +540,30 @@ class DeviceServer(BECService):
     This class is intended to provide a thin wrapper around ophyd and the devicemanager. It acts as the entry point for other services
     """
 
+    # maps instruction actions to the name of their handler method
+    _ACTION_HANDLERS = {
+        "set": "_set_device",
+        "read": "_read_device",
+        "rpc": "_run_rpc",
+        "kickoff": "_kickoff_device",
+        "complete": "_complete_device",
+        "trigger": "_trigger_device",
+        "stage": "_stage_device",
+        "unstage": "_unstage_device",
+        "pre_scan": "_pre_scan",
+    }
+
     def __init__(self, config, connector_cls: type[RedisConnector]) -> None:
         super().__init__(config, connector_cls, unique_service=True)
         self._tasks = []
         self.connector.register(MessageEndpoints.stop_devices(), cb=self.on_stop_devices)
         self.executor = ThreadPoolExecutor(max_workers=4)
+        # separate pool so that a stop request never waits for busy instruction workers
+        self._stop_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="stop_devices")
+        # kickoff signatures do not change at runtime; keyed by the underlying function
+        self._kickoff_takes_args: dict[Any, bool] = {}
+        # whether a device type supports staging, i.e. its instances carry a _staged attribute
+        self._supports_staging_cache: dict[type, bool] = {}
         self._start_device_manager()
         self.requests_handler = RequestHandler(self)
         self.rpc_handler = RPCHandler(self)
@@ -364,18 +596,51 @@ class DeviceServer(BECService):
 
     def shutdown(self) -> None:
         """shutdown the device server"""
+        self.requests_handler.shutdown()
         super().shutdown()
         self.stop()
+        self._stop_executor.shutdown(wait=False)
         if self.device_manager:
             self.device_manager.shutdown()
 
-    def _update_device_metadata(self, instr) -> None:
-        devices = instr.content["device"]
+    @staticmethod
+    def _get_instruction_devices(instr: messages.DeviceInstructionMessage) -> list[str]:
+        """
+        Get the device(s) of an instruction as a list. The field is accessed directly
+        as instr.content creates a copy of the message content on every access.
+
+        Args:
+            instr (messages.DeviceInstructionMessage): The device instruction message.
+
+        Returns:
+            list[str]: List of device names.
+        """
+        devices = instr.device
         if not isinstance(devices, list):
             devices = [devices]
-        for dev in devices:
-            device_root = dev.split(".")[0]
-            self.device_manager.devices.get(device_root).metadata = instr.metadata
+        return devices
+
+    @classmethod
+    def _get_instruction_device_roots(cls, instr: messages.DeviceInstructionMessage) -> list[str]:
+        """
+        Get the unique root device names of an instruction, e.g. "samx" for "samx.velocity".
+
+        Args:
+            instr (messages.DeviceInstructionMessage): The device instruction message.
+
+        Returns:
+            list[str]: List of root device names in the order of their first occurrence.
+        """
+        return list(
+            dict.fromkeys(dev.partition(".")[0] for dev in cls._get_instruction_devices(instr))
+        )
+
+    def _update_device_metadata(self, instr, device_roots: list[str] | None = None) -> None:
+        if device_roots is None:
+            device_roots = self._get_instruction_device_roots(instr)
+        container = self.device_manager.devices
+        for device_root in device_roots:
+            container.get(device_root).metadata = instr.metadata
 
     def on_stop_devices(self, msg: MessageObject, **_kwargs) -> None:
         """
@@ -423,66 +688,72 @@ class DeviceServer(BECService):
             devices_to_stop = [
                 dev for dev in self.device_manager.devices.enabled_devices if dev.name in devices
             ]
-        for dev in devices_to_stop:
-            if dev.read_only:
-                # don't stop devices that we haven't set
-                continue
-            if hasattr(dev.obj, "stop"):
-                try:
-                    dev.obj.stop()
-                except Exception as exc:  # pylint: disable=broad-except
-                    content = traceback.format_exc()
-                    error_info = messages.ErrorInfo(
-                        error_message=content,
-                        compact_error_message=traceback.format_exc(limit=0),
-                        exception_type=exc.__class__.__name__,
-                        device=dev.obj.name,
-                    )
-                    self.connector.raise_alarm(
-                        severity=Alarms.WARNING,
-                        info=error_info,
-                        metadata=self._get_metadata_for_alarm(None),
-                    )
+        # don't stop devices that we haven't set
+        futures = [
+            self._stop_executor.submit(self._stop_device, dev)
+            for dev in devices_to_stop
+            if not dev.read_only and hasattr(dev.obj, "stop")
+        ]
+        wait(futures)
         self.status = BECStatus.RUNNING
 
-    def assert_device_is_enabled(self, instructions: messages.DeviceInstructionMessage) -> None:
+    def _stop_device(self, dev) -> None:
+        try:
+            dev.obj.stop()
+        except Exception as exc:  # pylint: disable=broad-except
+            content = traceback.format_exc()
+            error_info = messages.ErrorInfo(
+                error_message=content,
+                compact_error_message=traceback.format_exc(limit=0),
+                exception_type=exc.__class__.__name__,
+                device=dev.obj.name,
+            )
+            self.connector.raise_alarm(
+                severity=Alarms.WARNING,
+                info=error_info,
+                metadata=self._get_metadata_for_alarm(None),
+            )
+
+    def assert_device_is_enabled(
+        self, instructions: messages.DeviceInstructionMessage, device_roots: list[str] | None = None
+    ) -> None:
         """
         Assert that the device(s) in the instructions are enabled.
 
         Args:
             instructions (messages.DeviceInstructionMessage): The device instruction message.
+            device_roots (list[str], optional): Precomputed root device names of the instruction.
 
         Raises:
             DisabledDeviceError: If any of the devices are disabled.
         """
-        devices = instructions.content["device"]
-
-        if isinstance(devices, str):
-            devices = [devices]
-
-        for dev in devices:
-            dev = dev.split(".")[0]
-            if not self.device_manager.devices[dev].enabled:
+        if device_roots is None:
+            device_roots = self._get_instruction_device_roots(instructions)
+        container = self.device_manager.devices
+        for dev in device_roots:
+            if not container[dev].enabled:
                 raise DisabledDeviceError(f"Cannot access disabled device {dev}.")
 
-    def assert_device_is_valid(self, instructions: messages.DeviceInstructionMessage) -> None:
+    def assert_device_is_valid(
+        self, instructions: messages.DeviceInstructionMessage, device_roots: list[str] | None = None
+    ) -> None:
         """
         Assert that the device(s) in the instructions are valid.
 
         Args:
             instructions (messages.DeviceInstructionMessage): The device instruction message.
+            device_roots (list[str], optional): Precomputed root device names of the instruction.
 
         Raises:
             InvalidDeviceError: If any of the devices are invalid.
         """
-        devices = instructions.content["device"]
-        if not devices:
+        if not instructions.device:
             raise InvalidDeviceError("At least one device must be specified.")
-        if isinstance(devices, str):
-            devices = [devices]
-        for dev in devices:
-            dev = dev.split(".")[0]
-            if dev not in self.device_manager.devices:
+        if device_roots is None:
+            device_roots = self._get_instruction_device_roots(instructions)
+        container = self.device_manager.devices
+        for dev in device_roots:
+            if dev not in container:
                 raise InvalidDeviceError(f"There is no device with the name {dev}.")
 
     def _get_metadata_for_alarm(
@@ -536,35 +807,22 @@ class DeviceServer(BECService):
         action = None
         try:
             instructions = msg
-            if not instructions.content["device"]:
+            if not instructions.device:
                 return
-            action = instructions.content["action"]
-            self.assert_device_is_valid(instructions)
+            action = instructions.action
+            # resolve the root devices once for all checks below
+            device_roots = self._get_instruction_device_roots(instructions)
+            self.assert_device_is_valid(instructions, device_roots)
             if action != "rpc":
                 # rpc has its own error handling
-                self.assert_device_is_enabled(instructions)
-            self._update_device_metadata(instructions)
-
-            if action == "set":
-                self._set_device(instructions)
-            elif action == "read":
-                self._read_device(instructions)
-            elif action == "rpc":
-                self.rpc_handler.run_rpc(instructions)
-            elif action == "kickoff":
-                self._kickoff_device(instructions)
-            elif action == "complete":
-                self._complete_device(instructions)
-            elif action == "trigger":
-                self._trigger_device(instructions)
-            elif action == "stage":
-                self._stage_device(instructions)
-            elif action == "unstage":
-                self._unstage_device(instructions)
-            elif action == "pre_scan":
-                self._pre_scan(instructions)
-            else:
+                self.assert_device_is_enabled(instructions, device_roots)
+            self._update_device_metadata(instructions, device_roots)
+
+            handler_name = self._ACTION_HANDLERS.get(action)
+            if handler_name is None:
                 logger.warning(f"Received unknown device instruction: {instructions}")
+            else:
+                getattr(self, handler_name)(instructions)
         except ophyd_errors.LimitError as limit_error:
             content = traceback.format_exc()
             compact_msg = traceback.format_exc(limit=0)
@@ -581,12 +839,14 @@ class DeviceServer(BECService):
 
             logger.error(content)
         except Exception as exc:  # pylint: disable=broad-except
-            content = traceback.format_exc()
+            # the traceback is only formatted if it is needed for the error info or the log
+            content = None
             if isinstance(exc, ExceptionWithErrorInfo):
                 error_info = exc.error_info
                 if not error_info.device:
                     error_info.device = self.get_device_from_exception(exc)
             else:
+                content = traceback.format_exc()
                 compact_msg = traceback.format_exc(limit=0)
                 error_info = messages.ErrorInfo(
                     error_message=content,
@@ -598,7 +858,7 @@ class DeviceServer(BECService):
             if action == "rpc":
                 self.rpc_handler.send_rpc_exception(exc, instructions)
             else:
-                logger.error(content)
+                logger.error(content if content is not None else traceback.format_exc())
             self.requests_handler.set_finished(
                 instructions.metadata["device_instr_id"], success=False, error_info=error_info
             )
@@ -629,26 +889,24 @@ class DeviceServer(BECService):
         """callback for handling device instructions"""
         self.executor.submit(self.handle_device_instructions, msg.value)
 
+    def _run_rpc(self, instr: messages.DeviceInstructionMessage) -> None:
+        self.rpc_handler.run_rpc(instr)
+
     def _add_status_object_info(
         self,
         status: StatusBase,
         instruction: messages.DeviceInstructionMessage,
         device: ophyd.Device,
+        **kwargs,
     ) -> None:
-        status.__dict__["instruction"] = instruction
-        if hasattr(status, "obj_ref"):
-            raise RuntimeError(
-                f"The 'obj_ref' attribute is reserved and cannot be used by the status object {status}."
-            )
-        status.__dict__["obj_ref"] = device
+        self.requests_handler.set_status_info(status, instruction, device, **kwargs)
 
     def _trigger_device(self, instr: messages.DeviceInstructionMessage) -> None:
         logger.trace(f"Trigger device: {instr}")
-        devices = instr.content["device"]
-        if not isinstance(devices, list):
-            devices = [devices]
+        devices = self._get_instruction_devices(instr)
         devices = self.device_manager.get_device_order(devices)
         self.requests_handler.add_request(instr, num_status_objects=len(devices))
+        instr_id = instr.metadata["device_instr_id"]
         for dev in devices:
             obj = self.device_manager.devices.get(dev)
             obj.metadata = instr.metadata
@@ -656,15 +914,14 @@ class DeviceServer(BECService):
             status = obj.trigger()
 
             self._add_status_object_info(status, instr, obj)
-            self.requests_handler.add_status_object(instr.metadata["device_instr_id"], status)
+            self.requests_handler.add_status_object(instr_id, status)
 
     def _kickoff_device(self, instr: messages.DeviceInstructionMessage) -> None:
         logger.trace(f"Kickoff device: {instr}")
 
-        obj = self.device_manager.devices.get(instr.content["device"]).obj
-        kickoff_args = inspect.getfullargspec(obj.kickoff).args
+        obj = self.device_manager.devices.get(instr.device).obj
         kickoff_parameter = instr.content["parameter"].get("configure", {})
-        if len(kickoff_args) > 1:
+        if self._kickoff_accepts_args(obj):
             obj.kickoff(metadata=instr.metadata, **kickoff_parameter)
             self.requests_handler.add_request(instr, num_status_objects=0, done=True, success=True)
             return
@@ -676,18 +933,35 @@ class DeviceServer(BECService):
         self._add_status_object_info(status, instr, obj)
         self.requests_handler.add_status_object(instr.metadata["device_instr_id"], status)
 
+    def _kickoff_accepts_args(self, obj) -> bool:
+        """Check whether the device's kickoff method accepts arguments besides self"""
+        kickoff = obj.kickoff
+        key = getattr(kickoff, "__func__", kickoff)
+        takes_args = self._kickoff_takes_args.get(key)
+        if takes_args is None:
+            takes_args = len(inspect.getfullargspec(kickoff).args) > 1
+            self._kickoff_takes_args[key] = takes_args
+        return takes_args
+
+    def _supports_staging(self, obj) -> bool:
+        """Check whether the device supports staging, cached per device type"""
+        supports_staging = self._supports_staging_cache.get(type(obj))
+        if supports_staging is None:
+            supports_staging = hasattr(obj, "_staged")
+            self._supports_staging_cache[type(obj)] = supports_staging
+        return supports_staging
+
     def _complete_device(self, instr: messages.DeviceInstructionMessage) -> None:
-        if instr.content["device"] is None:
+        if instr.device is None:
             devices = [dev.name for dev in self.device_manager.devices.enabled_devices]
         else:
-            devices = instr.content["device"]
-            if not isinstance(devices, list):
-                devices = [devices]
+            devices = self._get_instruction_devices(instr)
 
         devices = self.device_manager.get_device_order(devices)
 
         self.requests_handler.add_request(instr, num_status_objects=len(devices))
         num_status_objects = 0
+        instr_id = instr.metadata["device_instr_id"]
         for dev in devices:
             obj = self.device_manager.devices.get(dev).obj
             if not hasattr(obj, "complete"):
@@ -701,13 +975,13 @@ class DeviceServer(BECService):
                 )
 
             self._add_status_object_info(status, instr, obj)
-            self.requests_handler.add_status_object(instr.metadata["device_instr_id"], status)
+            self.requests_handler.add_status_object(instr_id, status)
 
         self.requests_handler.patch_num_status_objects(instr, num_status_objects)
 
     def _set_device(self, instr: messages.DeviceInstructionMessage) -> None:
         self.requests_handler.add_request(instr, num_status_objects=1)
-        device_name = instr.content["device"]
+        device_name = instr.device
         child_access = None
         if "." in device_name:
             device_name, child_access = device_name.split(".", 1)
@@ -735,8 +1009,7 @@ class DeviceServer(BECService):
             )
             status = DeviceStatus(device=obj)
             status.set_exception(exc)
-        self._add_status_object_info(status, instr, obj)
-        status.__dict__["sub_id"] = sub_id
+        self._add_status_object_info(status, instr, obj, sub_id=sub_id)
         self.requests_handler.add_status_object(instr.metadata["device_instr_id"], status)
 
     @staticmethod
@@ -762,14 +1035,13 @@ class DeviceServer(BECService):
         return val
 
     def _pre_scan(self, instr: messages.DeviceInstructionMessage) -> None:
-        devices = instr.content["device"]
-        if not isinstance(devices, list):
-            devices = [devices]
+        devices = self._get_instruction_devices(instr)
 
         devices = self.device_manager.get_device_order(devices)
 
         self.requests_handler.add_request(instr, num_status_objects=len(devices))
         num_status_objects = 0
+        instr_id = instr.metadata["device_instr_id"]
         for dev in devices:
             status = None
             obj = self.device_manager.devices[dev].obj
@@ -784,26 +1056,22 @@ class DeviceServer(BECService):
 
             num_status_objects += 1
             self._add_status_object_info(status, instr, obj)
-            self.requests_handler.add_status_object(instr.metadata["device_instr_id"], status)
+            self.requests_handler.add_status_object(instr_id, status)
 
         self.requests_handler.patch_num_status_objects(instr, num_status_objects)
 
     def status_callback(self, status):
         pipe = self.connector.pipeline()
-        obj = None
-        if hasattr(status, "device"):
-            obj = status.device
-        elif hasattr(status, "obj"):
-            obj = status.obj
-        if obj is None:
-            obj = status.__dict__.get("obj_ref", None)
+        status_info = self.requests_handler.get_status_info(status) or {}
+        obj = status_info.get("status_device")
 
         # if we've started a subscription, we need to unsubscribe now
         # this is typically the case for operations on nested devices.
         # For normal devices, we don't need to unsubscribe, as the
         # subscription is handled by the device manager
-        if getattr(status, "sub_id", None):
-            obj.unsubscribe(status.sub_id)
+        sub_id = status_info.get("sub_id")
+        if sub_id:
+            obj.unsubscribe(sub_id)
 
         if obj is None:
             logger.error(
@@ -813,24 +1081,26 @@ class DeviceServer(BECService):
         device_name = (
             ".".join([obj.root.name, obj.dotted_name]) if obj.dotted_name else obj.root.name
         )
-        metadata = {"action": status.instruction.content["action"]}
-        metadata.update(status.instruction.metadata)
+        instruction = status_info["instruction"]
+        metadata = {"action": instruction.action}
+        metadata.update(instruction.metadata)
 
-        content = status.instruction.content
+        content = instruction.content
         is_config_set = content["action"] == "set"
         rpc_func = content["parameter"].get("func", "")
         is_rpc_set = content["action"] == "rpc" and (rpc_func == "set" or ".set" in rpc_func)
 
         if is_config_set or is_rpc_set:
             if obj.kind == Kind.config:
-                self._update_read_configuration(obj, status.instruction.metadata, pipe)
+                self._update_read_configuration(obj, instruction.metadata, pipe)
             elif obj.kind in [Kind.normal, Kind.hinted]:
-                self._read_device(status.instruction)
+                # the set instruction is resolved by the status object, not by the read
+                self._read_device(instruction, new_status=False, pipe=pipe)
 
-        if status.instruction.metadata.get("response"):
+        if instruction.metadata.get("response"):
             # if the user requested a response on a single status object, we need to send it
             # to the device_req_status_container
-            request_id = status.instruction.metadata["RID"]
+            request_id = instruction.metadata["RID"]
             metadata["error_info"] = (
                 self.requests_handler.get_error_info(status.exception(), status)
                 if status.exception()
@@ -857,34 +1127,41 @@ class DeviceServer(BECService):
             MessageEndpoints.device_read_configuration(obj.root.name), dev_config_msg, pipe
         )
 
-    def _read_device(self, instr: messages.DeviceInstructionMessage, new_status=True) -> None:
+    def _read_device(
+        self, instr: messages.DeviceInstructionMessage, new_status=True, pipe=None
+    ) -> None:
         # check performance -- we might have to change it to a background thread
-        devices = instr.content["device"]
-        if not isinstance(devices, list):
-            devices = [devices]
+        devices = self._get_instruction_devices(instr)
 
         devices = self.device_manager.get_device_order(devices)
 
         if not new_status:
-            self._read_and_update_devices(devices, instr.metadata)
+            # if a pipeline is given, the caller is responsible for executing it
+            self._read_and_update_devices(devices, instr.metadata, pipe=pipe)
             return
 
-        self.requests_handler.add_request(instr, num_status_objects=0)
         result = self._read_and_update_devices(devices, instr.metadata)
         response_result = result if instr.parameter.get("return_result", False) else None
-        self.requests_handler.set_finished(
-            instr.metadata["device_instr_id"], success=True, result=response_result
+        # the read is synchronous, so a single final response is sufficient
+        self.requests_handler.add_request(
+            instr, num_status_objects=0, done=True, success=True, result=response_result
         )
 
-    def _read_and_update_devices(self, devices: list[str], metadata: dict) -> list:
+    def _read_and_update_devices(self, devices: list[str], metadata: dict, pipe=None) -> list:
         start = time.time()
-        pipe = self.connector.pipeline()
+        execute_pipe = pipe is None
+        if execute_pipe:
+            # the reads are independent, so there is no need for a MULTI/EXEC transaction
+            pipe = self.connector.pipeline(transaction=False)
         signal_container = []
         devices = self.device_manager.get_device_order(devices)
+        device_container = self.device_manager.devices
+        set_and_publish = self.connector.set_and_publish
         for dev in devices:
-            device_root = dev.split(".")[0]
-            self.device_manager.devices.get(device_root).metadata = metadata
-            obj = self.device_manager.devices.get(device_root).obj
+            device_root = dev.partition(".")[0]
+            ds_dev = device_container.get(device_root)
+            ds_dev.metadata = metadata
+            obj = ds_dev.obj
             try:
                 signals = obj.read()
                 signal_container.append(signals)
@@ -892,17 +1169,14 @@ class DeviceServer(BECService):
             except Exception as exc:
                 signals = self._retry_obj_method(dev, obj, "read", exc)
 
-            self.connector.set_and_publish(
-                MessageEndpoints.device_read(device_root),
-                messages.DeviceMessage(signals=signals, metadata=metadata),
-                pipe,
+            # serialize once and reuse the payload for both the read and the readback endpoint
+            payload = MsgpackSerialization.dumps(
+                messages.DeviceMessage(signals=signals, metadata=metadata)
             )
-            self.connector.set_and_publish(
-                MessageEndpoints.device_readback(device_root),
-                messages.DeviceMessage(signals=signals, metadata=metadata),
-                pipe,
-            )
-        pipe.execute()
+            set_and_publish(MessageEndpoints.device_read(device_root), payload, pipe)
+            set_and_publish(MessageEndpoints.device_readback(device_root), payload, pipe)
+        if execute_pipe:
+            pipe.execute()
         logger.trace(
             f"Elapsed time for reading and updating status info: {(time.time() - start) * 1000} ms"
         )
@@ -910,19 +1184,22 @@ class DeviceServer(BECService):
 
     def _read_config_and_update_devices(self, devices: list[str], metadata: dict) -> list:
         start = time.time()
-        pipe = self.connector.pipeline()
+        pipe = self.connector.pipeline(transaction=False)
         signal_container = []
         devices = self.device_manager.get_device_order(devices)
+        device_container = self.device_manager.devices
+        set_and_publish = self.connector.set_and_publish
         for dev in devices:
-            self.device_manager.devices.get(dev).metadata = metadata
-            obj = self.device_manager.devices.get(dev).obj
+            ds_dev = device_container.get(dev)
+            ds_dev.metadata = metadata
+            obj = ds_dev.obj
             try:
                 signals = obj.read_configuration()
                 signal_container.append(signals)
             # pylint: disable=broad-except
             except Exception as exc:
                 signals = self._retry_obj_method(dev, obj, "read_configuration", exc)
-            self.connector.set_and_publish(
+            set_and_publish(
                 MessageEndpoints.device_read_configuration(dev),
                 messages.DeviceMessage(signals=signals, metadata=metadata),
                 pipe,
@@ -943,7 +1220,7 @@ class DeviceServer(BECService):
         self.device_manager.connector.raise_alarm(
             severity=Alarms.WARNING, info=error_info, metadata=self._get_metadata_for_alarm()
         )
-        device_root = device.split(".")[0]
+        device_root = device.partition(".")[0]
         ds_dev = self.device_manager.devices.get(device_root)
 
         if ds_dev.on_failure == OnFailure.RETRY:
@@ -974,80 +1251,132 @@ class DeviceServer(BECService):
     def _stage_device(
         self, instr: messages.DeviceInstructionMessage, timeout_on_unstage: int = 10
     ) -> None:
-        devices = instr.content["device"]
-        if not isinstance(devices, list):
-            devices = [devices]
+        devices = self._get_instruction_devices(instr)
 
         devices = self.device_manager.get_device_order(devices)
 
         self.requests_handler.add_request(instr, num_status_objects=len(devices))
 
         num_status_objects = 0
+        instr_id = instr.metadata["device_instr_id"]
         for dev in devices:
             status = None
             obj = self.device_manager.devices[dev].obj
 
-            if not hasattr(obj, "_staged"):
+            if not self._supports_staging(obj):
                 continue
 
             # pylint: disable=protected-access
             if obj._staged == Staged.yes:
                 logger.info(f"Device {obj.name} was already staged and will be first unstaged.")
-                status = self.device_manager.devices[dev].obj.unstage()
-                if isinstance(status, StatusBase):
-                    for ii in range(3):
-                        try:
-                            status.wait(timeout=timeout_on_unstage)
-                            status = None  # Set status None and break the loop since unstage is successful
-                            break
-                        except ophyd_errors.WaitTimeoutError:
-                            logger.warning(
-                                f"Unstaging device {dev} still running, {timeout_on_unstage * (ii + 1)} seconds passed."
-                            )
-                    if status is not None:
-                        raise ValueError(f"Unstaging device {dev} failed to finish in 30 seconds")
-            status = self.device_manager.devices[dev].obj.stage()
+                unstage_status = obj.unstage()
+                if isinstance(unstage_status, StatusBase):
+                    # stage from the unstage callback instead of blocking this thread
+                    status = self._stage_after_unstage(
+                        dev, obj, unstage_status, timeout=3 * timeout_on_unstage
+                    )
+            if status is None:
+                status = obj.stage()
             if status is None or isinstance(status, list):
                 continue
             if not isinstance(status, StatusBase):
                 raise ValueError(f"The stage method of {dev} does not return a StatusBase object.")
             num_status_objects += 1
             self._add_status_object_info(status, instr, obj)
-            status.__dict__["status"] = 1
-            status.add_callback(self._device_staged_callback)
-            self.requests_handler.add_status_object(instr.metadata["device_instr_id"], status)
+            ctx = _StagedStatusContext(instr=instr, obj=obj, state=1)
+            status.add_callback(functools.partial(self._device_staged_callback, ctx=ctx))
+            self.requests_handler.add_status_object(instr_id, status)
 
         self.requests_handler.patch_num_status_objects(instr, num_status_objects)
 
-    def _device_staged_callback(self, status: StatusBase) -> None:
+    def _stage_after_unstage(
+        self, dev: str, obj: OphydObject, unstage_status: StatusBase, timeout: float
+    ) -> DeviceStatus:
+        """
+        Stage a device once its unstage status has finished.
+
+        Args:
+            dev(str): The name of the device.
+            obj(OphydObject): The device object.
+            unstage_status(StatusBase): The status object returned by the unstage call.
+            timeout(float): Time in seconds for the unstage to finish.
+
+        Returns:
+            DeviceStatus: Status object that finishes once the device is staged again. It fails
+                if the unstage does not finish within the timeout.
+        """
+        stage_status = DeviceStatus(obj)
+
+        def _finish(exc: Exception | None = None):
+            try:
+                if exc is None:
+                    stage_status.set_finished()
+                else:
+                    stage_status.set_exception(exc)
+            except ophyd_errors.InvalidState:
+                # the timeout raced with the unstage callback; the first one wins
+                pass
+
+        def _on_timeout():
+            _finish(ValueError(f"Unstaging device {dev} failed to finish in {timeout} seconds"))
+
+        def _on_unstaged(status: StatusBase):
+            timer.cancel()
+            if stage_status.done:
+                return
+            if not status.success:
+                _finish(status.exception() or ValueError(f"Failed to unstage device {dev}."))
+                return
+            try:
+                status = obj.stage()
+            except Exception as exc:  # pylint: disable=broad-except
+                _finish(exc)
+                return
+            if isinstance(status, StatusBase):
+                status.add_callback(lambda st: _finish(st.exception()))
+            elif status is None or isinstance(status, list):
+                _finish()
+            else:
+                _finish(
+                    ValueError(f"The stage method of {dev} does not return a StatusBase object.")
+                )
+
+        timer = threading.Timer(timeout, _on_timeout)
+        timer.daemon = True
+        timer.start()
+        unstage_status.add_callback(_on_unstaged)
+        return stage_status
+
+    def _device_staged_callback(self, _status: StatusBase, ctx: _StagedStatusContext) -> None:
         """Set the device status to staged"""
-        obj = status.__dict__["obj_ref"]
+        obj = ctx.obj
         dev_name = obj.name
-        instr = status.__dict__["instruction"]
-        state = status.__dict__["status"]
-        self.connector.set(
-            MessageEndpoints.device_staged(dev_name),
-            messages.DeviceStatusMessage(device=dev_name, status=state, metadata=instr.metadata),
-        )
+        instr = ctx.instr
+        state = ctx.state
+        # The staged states of all devices of the instruction are written in one pipeline
+        # once the instruction is finished, but before it is reported as done.
+        endpoint = MessageEndpoints.device_staged(dev_name)
+        msg = messages.DeviceStatusMessage(device=dev_name, status=state, metadata=instr.metadata)
+        if not self.requests_handler.defer_set(instr.metadata["device_instr_id"], endpoint, msg):
+            self.connector.set(endpoint, msg)
         if state == 1:  # Device was/is staged
-            obj = self.device_manager.devices[dev_name].obj
+            # obj is the staged root device itself, no need to look it up again
             # pylint: disable=protected-access
-            if hasattr(obj, "_staged") and obj._staged != Staged.yes:
+            if self._supports_staging(obj) and obj._staged != Staged.yes:
                 raise ValueError(f"Failed to stage device {dev_name}.")
 
     def _unstage_device(self, instr: messages.DeviceInstructionMessage) -> None:
-        devices = instr.content["device"]
-        if not isinstance(devices, list):
-            devices = [devices]
+        devices = self._get_instruction_devices(instr)
 
         devices = self.device_manager.get_device_order(devices)
 
         self.requests_handler.add_request(instr, num_status_objects=len(devices))
         num_status_objects = 0
+        instr_id = instr.metadata["device_instr_id"]
         for dev in devices:
             status = None
             obj = self.device_manager.devices[dev].obj
-            if hasattr(obj, "_staged"):
+            if self._supports_staging(obj):
                 # pylint: disable=protected-access
                 if obj._staged == Staged.yes:
                     status = self.device_manager.devices[dev].obj.unstage()
@@ -1061,8 +1390,8 @@ class DeviceServer(BECService):
                 )
             num_status_objects += 1
             self._add_status_object_info(status, instr, obj)
-            status.__dict__["status"] = 0
-            status.add_callback(self._device_staged_callback)
-            self.requests_handler.add_status_object(instr.metadata["device_instr_id"], status)
+            ctx = _StagedStatusContext(instr=instr, obj=obj, state=0)
+            status.add_callback(functools.partial(self._device_staged_callback, ctx=ctx))
+            self.requests_handler.add_status_object(instr_id, status)
 
         self.requests_handler.patch_num_status_objects(instr, num_status_objects)
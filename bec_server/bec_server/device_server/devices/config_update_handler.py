@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import concurrent.futures
-import copy
 import threading
 import traceback
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, Iterable, TypedDict
 
 from bec_lib import messages
 from bec_lib.alarm_handler import Alarms
@@ -34,6 +33,8 @@ class ConfigUpdateHandler:
         )
         self._active_request: RequestInfo | None = None
         self._lock = threading.Lock()
+        # device configs as published to redis, keyed by device name; rebuilt on reload
+        self._config_snapshot: dict[str, dict] = {}
         self.connector.register(
             MessageEndpoints.device_server_config_request(), cb=self._device_config_callback
         )
@@ -51,11 +52,11 @@ class ConfigUpdateHandler:
         cancel_event = threading.Event()
 
         # Submit to executor and store both future and cancel_event
-        future = self.executor.submit(self.parse_config_request, msg.value, cancel_event)
+        future = self.executor.submit(self.parse_config_request, config_msg, cancel_event)
 
         with self._lock:
             self._active_request = RequestInfo(
-                future=future, cancel_event=cancel_event, request_id=msg.value.metadata.get("RID")
+                future=future, cancel_event=cancel_event, request_id=config_msg.metadata.get("RID")
             )
             # Add callback to clean up when done
             future.add_done_callback(lambda f: self._remove_active_request())
@@ -185,64 +186,96 @@ class ConfigUpdateHandler:
     def _update_config(
         self, msg: messages.DeviceConfigMessage, cancel_event: threading.Event
     ) -> None:
-        for dev, dev_config in msg.content["config"].items():
-            if cancel_event.is_set():
-                raise CancelledError("Config update cancelled")
-            device = self.device_manager.devices[dev]
-            if "deviceConfig" in dev_config:
-                if not device.enabled:
-                    raise DeviceConfigError(
-                        f"Cannot update deviceConfig for disabled device {dev}. Enable the device first."
-                    )
-                new_config = dev_config["deviceConfig"] or {}
-                # store old config
-                old_config = device._config["deviceConfig"].copy()
-
-                # apply config
-                try:
-                    self.device_manager.update_config(device.obj, new_config)
-                except Exception as exc:
-                    self.device_manager.update_config(device.obj, old_config)
-                    raise DeviceConfigError(f"Error during object update. {exc}")
-
-                if "limits" in dev_config["deviceConfig"]:
-                    limits = {
-                        "low": {"value": device.obj.low_limit_travel.get()},
-                        "high": {"value": device.obj.high_limit_travel.get()},
-                    }
-                    self.device_manager.connector.set_and_publish(
-                        MessageEndpoints.device_limits(device.name),
-                        messages.DeviceMessage(signals=limits),
-                    )
-
-            if "enabled" in dev_config:
-                # pylint: disable=protected-access
-                was_enabled = device._config.get("enabled", True)
-                device._config["enabled"] = dev_config["enabled"]
-                if was_enabled and not dev_config["enabled"]:
-                    # It was enabled and we want to disable it. Disconnect and reset the device.
-                    self.device_manager.disconnect_device(device.obj)
-                    self.device_manager.reset_device(device)
-                elif not was_enabled and dev_config["enabled"]:
-                    # It was disabled and we want to enable it. Construct and initialize the device.
-                    obj, config = self.device_manager.construct_device_obj(
-                        device._config, device_manager=self.device_manager
-                    )
-                    self.device_manager.initialize_device(device._config, config, obj)
+        # limit updates of all devices are sent in a single round trip
+        pipe = self.device_manager.connector.pipeline()
+        try:
+            for dev, dev_config in msg.config.items():
+                if cancel_event.is_set():
+                    raise CancelledError("Config update cancelled")
+                device = self.device_manager.devices[dev]
+                if "deviceConfig" in dev_config:
+                    if not device.enabled:
+                        raise DeviceConfigError(
+                            f"Cannot update deviceConfig for disabled device {dev}. Enable the device first."
+                        )
+                    new_config = dev_config["deviceConfig"] or {}
+                    current_config = device._config["deviceConfig"]
+
+                    # apply config
+                    try:
+                        self.device_manager.update_config(device.obj, new_config)
+                    except Exception as exc:
+                        # the active config is only updated on success, so it can be used
+                        # to restore the entries that were submitted
+                        old_config = {
+                            key: current_config[key] for key in new_config if key in current_config
+                        }
+                        self.device_manager.update_config(device.obj, old_config)
+                        raise DeviceConfigError(f"Error during object update. {exc}")
+
+                    if "limits" in new_config:
+                        limits = {
+                            "low": {"value": device.obj.low_limit_travel.get()},
+                            "high": {"value": device.obj.high_limit_travel.get()},
+                        }
+                        self.device_manager.connector.set_and_publish(
+                            MessageEndpoints.device_limits(device.name),
+                            messages.DeviceMessage(signals=limits),
+                            pipe=pipe,
+                        )
+
+                if "enabled" in dev_config:
+                    # pylint: disable=protected-access
+                    was_enabled = device._config.get("enabled", True)
+                    device._config["enabled"] = dev_config["enabled"]
+                    if was_enabled and not dev_config["enabled"]:
+                        # It was enabled and we want to disable it. Disconnect and reset the device.
+                        self.device_manager.disconnect_device(device.obj)
+                        self.device_manager.reset_device(device)
+                    elif not was_enabled and dev_config["enabled"]:
+                        # It was disabled and we want to enable it. Construct and initialize the device.
+                        obj, config = self.device_manager.construct_device_obj(
+                            device._config, device_manager=self.device_manager
+                        )
+                        self.device_manager.initialize_device(device._config, config, obj)
+        except CancelledError:
+            # the config is flushed after a cancelled request, no need to publish its limits
+            raise
+        except Exception:
+            # publish the limits of the devices updated before the failure, without hiding
+            # the original error if that fails as well
+            try:
+                pipe.execute()
+            except Exception:
+                logger.error(f"Failed to publish the updated limits: {traceback.format_exc()}")
+            raise
+        else:
+            pipe.execute()
+        finally:
+            self._update_config_snapshot(msg.config)
 
     def _flush_config(self) -> None:
         """Flush all devices from the device manager."""
-        for _, obj in self.device_manager.devices.items():
-            try:
-                obj.obj.destroy()
-            except Exception:
-                logger.warning(f"Failed to destroy {obj.obj.name}")
+        devices = list(self.device_manager.devices.values())
+        if devices:
+            # destroying a device may block on disconnects, so all devices are destroyed concurrently
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(32, len(devices)), thread_name_prefix="flush_config"
+            ) as executor:
+                futures = {executor.submit(device.obj.destroy): device for device in devices}
+            failed = [device for future, device in futures.items() if future.exception()]
+            for device in failed:
+                logger.warning(f"Failed to destroy {device.obj.name}")
+            if failed:
                 raise RuntimeError("Failed to flush config")
         self.device_manager.devices.flush()
+        self._config_snapshot.clear()
 
     def _reload_config(self, cancel_event: threading.Event) -> None:
         self._flush_config()
         reload_plugin_modules()
+        # pylint: disable=protected-access
+        self.device_manager._get_device_class.cache_clear()
 
         self.device_manager._get_config(cancel_event=cancel_event)
         if self.device_manager.failed_devices:
@@ -261,7 +294,7 @@ class ConfigUpdateHandler:
         # pylint:disable=protected-access
         self.device_manager.failed_devices = {}
         dm: DeviceManagerDS = self.device_manager
-        for dev, dev_config in msg.content["config"].items():
+        for dev, dev_config in msg.config.items():
             if cancel_event.is_set():
                 raise CancelledError("Config add cancelled")
             name = dev_config["name"]
@@ -276,6 +309,7 @@ class ConfigUpdateHandler:
                 msg = traceback.format_exc()
                 dm.failed_devices[name] = msg
                 logger.error(f"Failed to initialize device {name}: {msg}")
+            self._update_config_snapshot([name])
 
     def _remove_config(
         self, msg: messages.DeviceConfigMessage, cancel_event: threading.Event
@@ -288,7 +322,7 @@ class ConfigUpdateHandler:
             cancel_event: Event to check for cancellation
 
         """
-        for dev in msg.content["config"]:
+        for dev in msg.config:
             if cancel_event.is_set():
                 raise CancelledError("Config remove cancelled")
             logger.info(f"Removing device {dev}")
@@ -298,6 +332,7 @@ class ConfigUpdateHandler:
             self.device_manager.disconnect_device(device)
             self.device_manager.reset_device(device)
             self.device_manager.devices.pop(dev)
+            self._update_config_snapshot([dev])
 
     def update_session_config(self, msg: messages.DeviceConfigMessage) -> None:
         """
@@ -311,7 +346,7 @@ class ConfigUpdateHandler:
         match action:
             case "update":
                 # Update the session config
-                for dev in msg.content["config"]:
+                for dev in msg.config:
                     dev_config = self.device_manager.devices[dev]._config
                     session_device_config = next(
                         (
@@ -325,11 +360,11 @@ class ConfigUpdateHandler:
                         session_device_config.update(dev_config)
             case "add":
                 # Add new devices to the session config
-                for dev, dev_config in msg.content["config"].items():
+                for dev, dev_config in msg.config.items():
                     self.device_manager.current_session["devices"].append(dev_config)
             case "remove":
                 # Remove devices from the session config
-                for dev in msg.content["config"]:
+                for dev in msg.config:
                     self.device_manager.current_session["devices"] = [
                         d
                         for d in self.device_manager.current_session["devices"]
@@ -348,13 +383,37 @@ class ConfigUpdateHandler:
             self.force_update_config_in_redis()
         return
 
+    def _update_config_snapshot(self, device_names: Iterable[str]) -> None:
+        """
+        Refresh the snapshot entries of the given devices. Devices that are no longer
+        available are dropped. Nothing is done as long as no snapshot was built.
+
+        Args:
+            device_names (Iterable[str]): Names of the devices whose config changed
+        """
+        if not self._config_snapshot:
+            return
+        devices = self.device_manager.devices
+        for name in device_names:
+            if name in devices:
+                # pylint: disable=protected-access
+                self._config_snapshot[name] = {**devices[name]._config, "name": name}
+            else:
+                self._config_snapshot.pop(name, None)
+
     def force_update_config_in_redis(self):
-        config = []
-        for name, device in self.device_manager.devices.items():
-            device_config = copy.deepcopy(device._config)
-            device_config["name"] = name
-            config.append(device_config)
-        msg = messages.AvailableResourceMessage(resource=config)
+        """
+        Publish the config of all devices to redis. The snapshot is only rebuilt if it is
+        out of sync with the available devices, e.g. after a reload.
+        """
+        devices = self.device_manager.devices
+        if self._config_snapshot.keys() != devices.keys():
+            # the message is serialized right away, so a shallow copy of each config is sufficient
+            # pylint: disable=protected-access
+            self._config_snapshot = {
+                name: {**device._config, "name": name} for name, device in devices.items()
+            }
+        msg = messages.AvailableResourceMessage(resource=list(self._config_snapshot.values()))
         self.device_manager.connector.set(MessageEndpoints.device_config(), msg)
 
     def shutdown(self) -> None:
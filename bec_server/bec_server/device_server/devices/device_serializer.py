@@ -57,6 +57,12 @@ def disable_lazy_wait_for_connection(
             dev.lazy_wait_for_connection = initial_value
 
 
+_SERIALIZABLE_SCALAR_TYPES = frozenset({float, str, bool, bytes, type(None)})
+# msgpack integers are limited to the int64 / uint64 range
+_MSGPACK_INT_MIN = -(2**63)
+_MSGPACK_INT_MAX = 2**64 - 1
+
+
 def is_serializable(var: Any) -> bool:
     """
     Check if a variable is serializable
@@ -67,6 +73,12 @@ def is_serializable(var: Any) -> bool:
     Returns:
         bool: True if the variable is serializable, False otherwise
     """
+    # most USER_ACCESS attributes are plain scalars; no need to encode them
+    var_type = type(var)
+    if var_type in _SERIALIZABLE_SCALAR_TYPES:
+        return True
+    if var_type is int:
+        return _MSGPACK_INT_MIN <= var <= _MSGPACK_INT_MAX
     try:
         msgpack.dumps(var, default=numpy_encode)
         return True
@@ -87,7 +99,8 @@ def get_custom_user_access_info(obj: Any, obj_interface: dict) -> dict:
     """
     # user_funcs = get_user_functions(obj)
     if hasattr(obj, "USER_ACCESS"):
-        for var in [func for func in dir(obj) if func in obj.USER_ACCESS]:
+        user_access = set(obj.USER_ACCESS)
+        for var in [func for func in dir(obj) if func in user_access]:
             obj_member = getattr(obj, var)
             if not callable(obj_member):
                 if is_serializable(obj_member):
@@ -108,10 +121,21 @@ def get_custom_user_access_info(obj: Any, obj_interface: dict) -> dict:
     return obj_interface
 
 
-@functools.lru_cache(maxsize=2)
-def get_protected_class_methods():
+@functools.lru_cache(maxsize=1)
+def get_protected_class_methods() -> frozenset[str]:
     """get protected methods of the DeviceBase class"""
-    return [func for func in dir(DeviceBaseWithConfig) if not func.startswith("__")]
+    return frozenset(func for func in dir(DeviceBaseWithConfig) if not func.startswith("__"))
+
+
+# checked in order; e.g. positioners are also devices
+_DEVICE_BASE_CLASSES = (
+    (PositionerBase, "positioner"),
+    (ComputedSignal, "computed_signal"),
+    (Signal, "signal"),
+    (Device, "device"),
+    (BECDeviceBase, "device"),
+)
+_device_base_class_cache: dict[type, str] = {}
 
 
 def get_device_base_class(obj: Any) -> str:
@@ -124,18 +148,50 @@ def get_device_base_class(obj: Any) -> str:
     Returns:
         str: base class of the object
     """
-    if isinstance(obj, PositionerBase):
-        return "positioner"
-    if isinstance(obj, ComputedSignal):
-        return "computed_signal"
-    if isinstance(obj, Signal):
-        return "signal"
-    if isinstance(obj, Device):
-        return "device"
-    if isinstance(obj, BECDeviceBase):
-        return "device"
+    # __class__ instead of type() so that spec'ed mocks resolve like isinstance does
+    cls = obj.__class__
+    base_class = _device_base_class_cache.get(cls)
+    if base_class is None:
+        base_class = next(
+            (name for base, name in _DEVICE_BASE_CLASSES if issubclass(cls, base)), "unknown"
+        )
+        _device_base_class_cache[cls] = base_class
+    return base_class
+
+
+_component_docs_cache: dict[type, tuple[tuple[str, str], ...]] = {}
+
+
+def _get_component_docs(obj: Any) -> tuple[tuple[str, str], ...]:
+    """
+    Get the dotted names and docs of all components of the object. The components of ophyd
+    devices are defined on the class, so they are only walked once per device class.
+
+    Args:
+        obj (Any): object to get the components from
 
-    return "unknown"
+    Returns:
+        tuple[tuple[str, str], ...]: dotted component names and their docs
+    """
+    cacheable = isinstance(obj, Device)
+    if cacheable:
+        component_docs = _component_docs_cache.get(obj.__class__)
+        if component_docs is not None:
+            return component_docs
+    component_docs = tuple(
+        (
+            component_name,
+            (
+                comp.doc
+                if isinstance(comp.doc, str) and not comp.doc.startswith("Component attribute\n::")
+                else ""
+            ),
+        )
+        for _ancestor, component_name, comp in obj.walk_components()
+    )
+    if cacheable:
+        _component_docs_cache[obj.__class__] = component_docs
+    return component_docs
 
 
 def get_ownership_mode(
@@ -176,52 +232,73 @@ def get_ownership_mode(
 
 
 def get_device_info(
-    obj: PositionerBase | ComputedSignal | Signal | Device | BECDeviceBase, connect=True
+    obj: PositionerBase | ComputedSignal | Signal | Device | BECDeviceBase,
+    connect=True,
+    cache: dict[int, dict] | None = None,
+    sub_device_walk: list[tuple[str, Device]] | None = None,
+    signal_describes: dict[int, dict] | None = None,
 ) -> dict:
     """
     Get the device info from the object
 
     Args:
         obj (PositionerBase | ComputedSignal | Signal | Device | BECDeviceBase): object to get the device info from
-        device_info (dict): device info
+        connect (bool): Whether the device is connected and can be introspected. Defaults to True.
+        cache (dict[int, dict] | None): Device infos already computed during the current traversal,
+            keyed by the object id. walk_subdevices yields nested sub-devices for every ancestor,
+            so without it the info of deeply nested devices is computed repeatedly.
+        sub_device_walk (list[tuple[str, Device]] | None): Result of obj.walk_subdevices(), if
+            already known. Only the top-level device walks its tree; sub-devices receive their
+            slice of that walk.
+        signal_describes (dict[int, dict] | None): Signal descriptions already fetched during the
+            current traversal, keyed by the signal id. walk_components includes the signals of
+            sub-devices, so every signal would otherwise be described once per ancestor.
 
     Returns:
         dict: updated device info
     """
+    if cache is None:
+        cache = {}
+    if signal_describes is None:
+        signal_describes = {}
+    cached_info = cache.get(id(obj))
+    if cached_info is not None:
+        return cached_info
+
     # Check if the object namespace is valid
 
     protected_names = get_protected_class_methods()
     user_access = get_custom_user_access_info(obj, {})
-    if set(user_access.keys()) & set(protected_names):
+    protected_user_access = user_access.keys() & protected_names
+    if protected_user_access:
         raise DeviceConfigError(
-            f"User access method name {set(user_access.keys()) & set(protected_names)} is protected and cannot be used. Please rename the method."
+            f"User access method name {protected_user_access} is protected and cannot be used. Please rename the method."
         )
     # Collect signals and their metadata
     signals = {}  # []
 
     if hasattr(obj, "component_names") and connect:
         signal_names = []
-        walk = obj.walk_components()
-        for _ancestor, component_name, comp in walk:
-            if get_device_base_class(getattr(obj, component_name)) == "signal":
+        for component_name, doc in _get_component_docs(obj):
+            signal_obj = getattr(obj, component_name)
+            if get_device_base_class(signal_obj) == "signal":
 
                 if component_name in protected_names:
                     raise DeviceConfigError(
                         f"Signal name {component_name} is protected and cannot be used. Please rename the signal."
                     )
-                signal_obj = getattr(obj, component_name)
-                doc = (
-                    comp.doc
-                    if isinstance(comp.doc, str)
-                    and not comp.doc.startswith("Component attribute\n::")
-                    else ""
-                )
+                signal_describe = signal_describes.get(id(signal_obj))
+                if signal_describe is None:
+                    signal_describe = signal_describes[id(signal_obj)] = signal_obj.describe().get(
+                        signal_obj.name, {}
+                    )
                 if isinstance(signal_obj, BECMessageSignal):
-                    info = signal_obj.describe().get(signal_obj.name, {}).get("signal_info", {})
+                    info = signal_describe.get("signal_info", {})
                     if not info:
                         continue
-                    for signal_name, kind in info.get("signals", []):
-                        if len(info.get("signals")) == 1:
+                    sub_signals = info.get("signals", [])
+                    for signal_name, kind in sub_signals:
+                        if len(sub_signals) == 1:
                             obj_name = signal_obj.name
                             comp_name = component_name
                             storage_name = obj_name  # device + component name
@@ -241,7 +318,7 @@ def get_device_info(
                                     "kind_int": kind,
                                     "kind_str": Kind(kind).name,
                                     "doc": doc,
-                                    "describe": signal_obj.describe().get(signal_obj.name, {}),
+                                    "describe": signal_describe,
                                     # pylint: disable=protected-access
                                     "metadata": signal_obj._metadata,
                                     "labels": sorted(signal_obj._ophyd_labels_),
@@ -259,7 +336,7 @@ def get_device_info(
                                 "kind_int": signal_obj.kind.value,
                                 "kind_str": signal_obj.kind.name,
                                 "doc": doc,
-                                "describe": signal_obj.describe().get(signal_obj.name, {}),
+                                "describe": signal_describe,
                                 # pylint: disable=protected-access
                                 "metadata": signal_obj._metadata,
                                 "labels": sorted(signal_obj._ophyd_labels_),
@@ -286,8 +363,29 @@ def get_device_info(
     sub_devices = []
 
     if hasattr(obj, "walk_subdevices") and connect:
-        for _, dev in obj.walk_subdevices():
-            sub_devices.append(get_device_info(dev, connect=connect))
+        if sub_device_walk is None:
+            sub_device_walk = list(obj.walk_subdevices())
+        for index, (dotted_name, dev) in enumerate(sub_device_walk):
+            info = cache.get(id(dev))
+            if info is None:
+                # the walk is depth-first, so the sub-devices of dev directly follow it
+                prefix = dotted_name + "."
+                nested_walk = []
+                nested_index = index + 1
+                while nested_index < len(sub_device_walk):
+                    name, nested_dev = sub_device_walk[nested_index]
+                    if not name.startswith(prefix):
+                        break
+                    nested_walk.append((name[len(prefix) :], nested_dev))
+                    nested_index += 1
+                info = get_device_info(
+                    dev,
+                    connect=connect,
+                    cache=cache,
+                    sub_device_walk=nested_walk,
+                    signal_describes=signal_describes,
+                )
+            sub_devices.append(info)
     if obj.name in protected_names or getattr(obj, "dotted_name", None) in protected_names:
         raise DeviceConfigError(
             f"Device name {obj.name} is protected and cannot be used. Please rename the device."
@@ -307,7 +405,7 @@ def get_device_info(
     else:
         describe = {}
         describe_configuration = {}
-    return {
+    info = cache[id(obj)] = {
         "device_attr_name": getattr(obj, "attr_name", ""),
         "device_base_class": get_device_base_class(obj),
         "device_class": obj.__class__.__name__,
@@ -321,6 +419,7 @@ def get_device_info(
         "sub_devices": sub_devices,
         "custom_user_access": user_access,
     }
+    return info
 
 
 def get_lazy_wait_for_connection(
@@ -6,6 +6,8 @@ in BEC. It is the only place where devices are initialized and managed.
 
 from __future__ import annotations
 
+import concurrent.futures
+import functools
 import inspect
 import threading
 import time
@@ -19,7 +21,6 @@ import ophyd_devices as opd
 from ophyd.ophydobj import OphydObject
 from ophyd.signal import EpicsSignalBase
 from ophyd_devices.utils.bec_signals import BECMessageSignal
-from typeguard import typechecked
 
 from bec_lib import messages, plugin_helper
 from bec_lib.alarm_handler import Alarms
@@ -29,7 +30,6 @@ from bec_lib.device import DeviceBaseWithConfig
 from bec_lib.devicemanager import CancelledError, DeviceManagerBase
 from bec_lib.endpoints import MessageEndpoints
 from bec_lib.logger import bec_logger
-from bec_lib.utils.rpc_utils import rgetattr
 from bec_server.device_server.bec_message_handler import BECMessageHandler
 from bec_server.device_server.devices.config_update_handler import ConfigUpdateHandler
 from bec_server.device_server.devices.device_serializer import (
@@ -45,6 +45,31 @@ if TYPE_CHECKING:  # pragma: no cover
 
 logger = bec_logger.logger
 
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_init_params(cls: type) -> frozenset[str]:
+    """Get the names of the init parameters of a class. Signatures do not change at runtime."""
+    return frozenset(inspect.signature(cls).parameters)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_class_attributes(cls: type) -> frozenset[str]:
+    """
+    Get the attribute names of a class, including its methods and ophyd components. Checking
+    them is cheaper than probing an instance with hasattr, which may access a signal.
+    """
+    return frozenset(dir(cls))
+
+
+def _has_attribute(obj: object, name: str) -> bool:
+    """
+    Check if an object has an attribute. The cached attributes of its class are checked first;
+    hasattr is only used for attributes that are set per instance, e.g. in __init__.
+    """
+    return name in _get_class_attributes(type(obj)) or hasattr(obj, name)
+
 
 class DeviceProgress:
     """
@@ -63,6 +88,8 @@ class DeviceProgress:
         self.all_devices = all_devices
         self.total_devices = len(all_devices)
         self.initialized_devices = 0
+        # devices are initialized concurrently
+        self._lock = threading.Lock()
 
     def update_progress(self, device_name: str, finished: bool, success: bool) -> None:
         """
@@ -73,13 +100,15 @@ class DeviceProgress:
             finished (bool): Whether the device initialization is finished.
             success (bool): Whether the device initialization was successful.
         """
-        if finished:
-            self.initialized_devices += 1
+        with self._lock:
+            if finished:
+                self.initialized_devices += 1
+            index = self.initialized_devices
 
         progress_msg = messages.DeviceInitializationProgressMessage(
             device=device_name,
             finished=finished,
-            index=self.initialized_devices,
+            index=index,
             total=self.total_devices,
             success=success,
         )
@@ -94,37 +123,44 @@ class DSDevice(DeviceBaseWithConfig):
         self.obj = obj
         self.metadata = {}
         self.initialized = False
+        # number of points emitted by the flyer callback, per scan_id
+        self.emitted_points = {}
+        # endpoints of the device event callbacks, resolved once per device
+        self.readback_endpoint = MessageEndpoints.device_readback(name)
+        self.read_endpoint = MessageEndpoints.device_read(name)
+        self.read_configuration_endpoint = MessageEndpoints.device_read_configuration(name)
+        self.status_endpoint = MessageEndpoints.device_status(name)
 
     def __getattr__(self, name: str) -> inspect.Any:
-        if hasattr(self.obj, name):
-            # compatibility with ophyd devices accessed on the client side
-            return rgetattr(self.obj, name)
+        # compatibility with ophyd devices accessed on the client side
+        attr = getattr(self.obj, name, _MISSING)
+        if attr is not _MISSING:
+            return attr
         return super().__getattr__(name)
 
     def initialize_device_buffer(self, connector):
         """initialize the device read and readback buffer on redis with a new reading"""
         dev_msg = messages.DeviceMessage(signals=self.obj.read(), metadata={})
 
-        if hasattr(self.obj, "low_limit_travel") and hasattr(self.obj, "high_limit_travel"):
+        if _has_attribute(self.obj, "low_limit_travel") and _has_attribute(
+            self.obj, "high_limit_travel"
+        ):
             limits = {
                 "low": {"value": self.obj.low_limit_travel.get()},
                 "high": {"value": self.obj.high_limit_travel.get()},
             }
         else:
             limits = None
-        pipe = connector.pipeline()
-        connector.set_and_publish(MessageEndpoints.device_readback(self.name), dev_msg, pipe=pipe)
-        connector.set_and_publish(
-            topic=MessageEndpoints.device_read(self.name), msg=dev_msg, pipe=pipe
-        )
+        # the replies are not needed, so there is no need to wrap the writes in a transaction
+        pipe = connector.pipeline(transaction=False)
+        connector.set_and_publish(self.readback_endpoint, dev_msg, pipe=pipe)
+        connector.set_and_publish(topic=self.read_endpoint, msg=dev_msg, pipe=pipe)
         if not isinstance(self.obj, ophyd.Signal):
             # signals have the same read and read_configuration values; no need to publish twice
             dev_config_msg = messages.DeviceMessage(
                 signals=self.obj.read_configuration(), metadata={}
             )
-            connector.set_and_publish(
-                MessageEndpoints.device_read_configuration(self.name), dev_config_msg, pipe=pipe
-            )
+            connector.set_and_publish(self.read_configuration_endpoint, dev_config_msg, pipe=pipe)
         if limits is not None:
             connector.set_and_publish(
                 MessageEndpoints.device_limits(self.name),
@@ -136,6 +172,12 @@ class DSDevice(DeviceBaseWithConfig):
 
 
 class DeviceManagerDS(DeviceManagerBase):
+    # maximum number of devices that are initialized concurrently. By default, the devices are
+    # initialized one by one in config order. With more workers, the devices of each dependency
+    # level are initialized concurrently, so every device that is accessed during the
+    # initialization of another device must be listed in the "needs" of that device.
+    INIT_WORKERS = 1
+
     def __init__(
         self,
         service: BECService,
@@ -151,10 +193,12 @@ class DeviceManagerDS(DeviceManagerBase):
         self.failed_devices = {}
         self._bec_message_handler = BECMessageHandler(self)
         self._device_order_map = {}
+        self._event_types_cache: dict[type, frozenset[str]] = {}
         self._auto_monitor_readback_updates = set()
         self._auto_monitor_configuration_updates = set()
         self._limit_change_updates = set()
         self._auto_monitor_update_lock = threading.Lock()
+        self._auto_monitor_thread_lock = threading.Lock()
         self._shutdown_event = threading.Event()
         self._auto_monitor_update_thread = self._create_auto_monitor_update_thread()
 
@@ -164,16 +208,18 @@ class DeviceManagerDS(DeviceManagerBase):
         )
 
     def _ensure_auto_monitor_update_thread(self) -> None:
-        if self._auto_monitor_update_thread is None:
-            self._auto_monitor_update_thread = self._create_auto_monitor_update_thread()
-        elif (
-            not self._auto_monitor_update_thread.is_alive()
-            and self._auto_monitor_update_thread.ident is not None
-        ):
-            self._auto_monitor_update_thread = self._create_auto_monitor_update_thread()
-
-        if not self._auto_monitor_update_thread.is_alive():
-            self._auto_monitor_update_thread.start()
+        # devices are initialized concurrently, so only one of them may start the thread
+        with self._auto_monitor_thread_lock:
+            if self._auto_monitor_update_thread is None:
+                self._auto_monitor_update_thread = self._create_auto_monitor_update_thread()
+            elif (
+                not self._auto_monitor_update_thread.is_alive()
+                and self._auto_monitor_update_thread.ident is not None
+            ):
+                self._auto_monitor_update_thread = self._create_auto_monitor_update_thread()
+
+            if not self._auto_monitor_update_thread.is_alive():
+                self._auto_monitor_update_thread.start()
 
     def initialize(self, bootstrap_server) -> None:
         self.config_update_handler = (
@@ -193,8 +239,9 @@ class DeviceManagerDS(DeviceManagerBase):
         return self._session
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _get_device_class(dev_type: str) -> type:
-        """Get the device class from the device type"""
+        """Get the device class from the device type. Cleared when the plugins are reloaded."""
         return plugin_helper.get_plugin_class(dev_type, [opd, ophyd])
 
     def _init_device(self, device_info: dict, delayed: bool, progress: DeviceProgress) -> None:
@@ -239,6 +286,7 @@ class DeviceManagerDS(DeviceManagerBase):
         try:
             devices = self.resolve_device_dependencies(self.current_session["devices"])
             self.failed_devices = {}
+            immediate_init = []
             for dev in devices:
                 name = dev.get("name")
                 enabled = dev.get("enabled")
@@ -252,9 +300,40 @@ class DeviceManagerDS(DeviceManagerBase):
                 if issubclass(dev_cls, (opd.DeviceProxy, opd.ComputedSignal)):
                     delayed_init.append(dev)
                     continue
-
-                self._init_device(dev, delayed=False, progress=progress)
+                immediate_init.append(dev)
+            current_device_name = None
+
+            if self.INIT_WORKERS > 1:
+
+                def init_device(dev: dict) -> None:
+                    if cancel_event and cancel_event.is_set():
+                        raise CancelledError("Device initialization cancelled.")
+                    self._init_device(dev, delayed=False, progress=progress)
+
+                # connecting to devices mostly waits for IO, so the devices of each dependency
+                # level are initialized concurrently
+                for level in self._get_init_levels(immediate_init):
+                    with concurrent.futures.ThreadPoolExecutor(
+                        max_workers=min(self.INIT_WORKERS, len(level)),
+                        thread_name_prefix="device_init",
+                    ) as executor:
+                        futures = {
+                            executor.submit(init_device, dev): dev.get("name") for dev in level
+                        }
+                        for future in concurrent.futures.as_completed(futures):
+                            if future.exception() is not None:
+                                current_device_name = futures[future]
+                                executor.shutdown(wait=True, cancel_futures=True)
+                                raise future.exception()
                 current_device_name = None
+                self._restore_device_order(immediate_init)
+            else:
+                for dev in immediate_init:
+                    if cancel_event and cancel_event.is_set():
+                        raise CancelledError("Device initialization cancelled.")
+                    current_device_name = dev.get("name")
+                    self._init_device(dev, delayed=False, progress=progress)
+                    current_device_name = None
 
             for dev in delayed_init:
                 name = dev.get("name")
@@ -278,6 +357,46 @@ class DeviceManagerDS(DeviceManagerBase):
                 f"Failed to initialize device: {current_device_name}: {content}. The config will be reset."
             ) from exc
 
+    def _restore_device_order(self, devices: list[dict]) -> None:
+        """
+        Re-add the given devices in the given order, which is the order a serial initialization
+        adds them in. Concurrently initialized devices are added in the order their
+        initialization started.
+
+        Args:
+            devices (list[dict]): Device config dictionaries, sorted by their dependencies
+        """
+        for dev in devices:
+            name = dev.get("name")
+            if name in self.devices:
+                # pylint: disable=protected-access
+                self.devices._add_device(name, self.devices.pop(name))
+
+    @staticmethod
+    def _get_init_levels(devices: list[dict]) -> list[list[dict]]:
+        """
+        Group devices into levels that can be initialized concurrently. A device is placed
+        one level after the last of the devices it needs; needs outside the given devices
+        are ignored.
+
+        Args:
+            devices (list[dict]): Device config dictionaries, sorted by their dependencies
+        Returns:
+            list[list[dict]]: Device config dictionaries per level, in initialization order
+        """
+        device_levels = {}
+        levels = []
+        for dev in devices:
+            level = max(
+                (device_levels[dep] + 1 for dep in dev.get("needs") or [] if dep in device_levels),
+                default=0,
+            )
+            device_levels[dev["name"]] = level
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(dev)
+        return levels
+
     def resolve_device_dependencies(self, devices: list[dict]) -> list[dict]:
         """
         Resolve device dependencies and return a sorted list of devices. It uses
@@ -394,18 +513,20 @@ class DeviceManagerDS(DeviceManagerBase):
         Reset the device config in redis and add the current config to the history.
         """
         current_config = self._session["devices"]
+        pipe = self.connector.pipeline(transaction=False)
         if current_config:
             # store the current config in the history
             current_config_msg = messages.AvailableResourceMessage(
                 resource=current_config, metadata={"removed_at": time.time()}
             )
             self.connector.lpush(
-                MessageEndpoints.device_config_history(), current_config_msg, max_size=50
+                MessageEndpoints.device_config_history(), current_config_msg, pipe=pipe, max_size=50
             )
         msg = messages.AvailableResourceMessage(resource=[])
-        self.connector.set(MessageEndpoints.device_config(), msg)
+        self.connector.set(MessageEndpoints.device_config(), msg, pipe=pipe)
         reload_msg = messages.DeviceConfigMessage(action="reload", config={})
-        self.connector.send(MessageEndpoints.device_config_update(), reload_msg)
+        self.connector.send(MessageEndpoints.device_config_update(), reload_msg, pipe=pipe)
+        pipe.execute()
 
     def update_config(self, obj: OphydObject, config: dict) -> None:
         """Update an ophyd device's config
@@ -415,7 +536,7 @@ class DeviceManagerDS(DeviceManagerBase):
             config (dict): Config dictionary
 
         """
-        if hasattr(obj, "_update_device_config"):
+        if _has_attribute(obj, "_update_device_config"):
             # If the device has implemented its own config update method, use it
             # pylint: disable=protected-access
             obj._update_device_config(config)  # type: ignore
@@ -425,7 +546,9 @@ class DeviceManagerDS(DeviceManagerBase):
         for config_key, config_value in config.items():
             # first handle the ophyd exceptions...
             if config_key == "limits":
-                if hasattr(obj, "low_limit_travel") and hasattr(obj, "high_limit_travel"):
+                if _has_attribute(obj, "low_limit_travel") and _has_attribute(
+                    obj, "high_limit_travel"
+                ):
                     low_limit_status = obj.low_limit_travel.set(config_value[0])  # type: ignore
                     high_limit_status = obj.high_limit_travel.set(config_value[1])  # type: ignore
                     # Respect Timeout to avoid blocking the device server indefinitely
@@ -438,7 +561,7 @@ class DeviceManagerDS(DeviceManagerBase):
                 # pylint: disable=protected-access
                 obj._ophyd_labels_ = set(config_value)
                 continue
-            if not hasattr(obj, config_key):
+            if not _has_attribute(obj, config_key):
                 raise DeviceConfigError(
                     f"Unknown config parameter {config_key} for device of type"
                     f" {obj.__class__.__name__}."
@@ -493,9 +616,7 @@ class DeviceManagerDS(DeviceManagerBase):
             device_classes.append(ophyd.OphydObject)
 
         # get all init parameters of the device class and its parents
-        class_params = set()
-        for device_class in device_classes:
-            class_params.update(inspect.signature(device_class)._parameters)
+        class_params = frozenset().union(*map(_get_init_params, device_classes))
         class_params_and_config_keys = class_params & config.keys()
 
         init_kwargs = {key: config.pop(key) for key in class_params_and_config_keys}
@@ -503,10 +624,10 @@ class DeviceManagerDS(DeviceManagerBase):
         if device_access or (device_access is None and config.get("device_mapping")):
             init_kwargs["device_manager"] = device_manager
 
-        signature = inspect.signature(dev_cls)
-        if "device_manager" in signature.parameters:
+        dev_cls_params = _get_init_params(dev_cls)
+        if "device_manager" in dev_cls_params:
             init_kwargs["device_manager"] = device_manager
-        if "scan_info" in signature.parameters:
+        if "scan_info" in dev_cls_params:
             # Additional device_manager != None is needed for static_device_test which
             # uses the static method with device_manager=None
             init_kwargs["scan_info"] = device_manager.scan_info if device_manager else None
@@ -534,7 +655,7 @@ class DeviceManagerDS(DeviceManagerBase):
         enabled = dev.get("enabled")
 
         # refresh the device info
-        pipe = self.connector.pipeline()
+        pipe = self.connector.pipeline(transaction=False)
         self.reset_device_data(obj, pipe)
         raised_exc = None
         connect = False
@@ -573,8 +694,9 @@ class DeviceManagerDS(DeviceManagerBase):
 
         # Add subscriptions to device events and signal if supported by the device
         if hasattr(obj, "event_types"):
-            self._subscribe_to_device_events(obj, opaas_obj)
-            self._subscribe_to_bec_device_events(obj)
+            event_types = self._get_event_types(obj)
+            self._subscribe_to_device_events(obj, opaas_obj, event_types)
+            self._subscribe_to_bec_device_events(obj, event_types)
             self._subscribe_to_auto_monitors(obj)
             self._subscribe_to_limit_updates(obj)
             self._subscribe_to_bec_signals(obj)
@@ -598,17 +720,43 @@ class DeviceManagerDS(DeviceManagerBase):
             self._ensure_auto_monitor_update_thread()
             obj.high_limit_travel.subscribe(self._obj_callback_auto_monitor_limits, run=False)
 
-    def _subscribe_to_device_events(self, obj: OphydObject, opaas_obj: DSDevice):
-        """Subscribe to device events"""
+    def _get_event_types(self, obj: OphydObject) -> frozenset[str]:
+        """
+        Get the event types of a device. The event types are defined by the device class and
+        ophyd builds a new tuple on every access, so they are cached per device type.
+        """
+        event_types = self._event_types_cache.get(type(obj))
+        if event_types is None:
+            event_types = frozenset(obj.event_types)
+            self._event_types_cache[type(obj)] = event_types
+        return event_types
 
-        if "readback" in obj.event_types:
-            obj.subscribe(self._obj_callback_readback, event_type="readback", run=opaas_obj.enabled)
-        elif "value" in obj.event_types:
-            obj.subscribe(self._obj_callback_readback, event_type="value", run=opaas_obj.enabled)
-        if hasattr(obj, "motor_is_moving"):
-            obj.motor_is_moving.subscribe(self._obj_callback_is_moving, run=opaas_obj.enabled)  # type: ignore
+    def _subscribe_to_device_events(
+        self,
+        obj: OphydObject,
+        opaas_obj: DSDevice,
+        event_types: frozenset[str] | tuple[str, ...] | None = None,
+    ):
+        """Subscribe to device events"""
+        if event_types is None:
+            event_types = obj.event_types
+
+        # bind the device to the high-rate callbacks to spare them the lookup by name
+        readback_callback = functools.partial(self._obj_callback_readback, ds_obj=opaas_obj)
+        if "readback" in event_types:
+            obj.subscribe(readback_callback, event_type="readback", run=opaas_obj.enabled)
+        elif "value" in event_types:
+            obj.subscribe(readback_callback, event_type="value", run=opaas_obj.enabled)
+        motor_is_moving = getattr(obj, "motor_is_moving", None)
+        if motor_is_moving is not None:
+            motor_is_moving.subscribe(
+                functools.partial(self._obj_callback_is_moving, ds_obj=opaas_obj),
+                run=opaas_obj.enabled,
+            )
 
-    def _subscribe_to_bec_device_events(self, obj: OphydObject):
+    def _subscribe_to_bec_device_events(
+        self, obj: OphydObject, event_types: frozenset[str] | tuple[str, ...] | None = None
+    ):
         """
         Subscribe to BEC device events, such as device_monitor_2d, device_monitor_1d,
         file_event, done_moving, flyer, and progress.
@@ -618,23 +766,27 @@ class DeviceManagerDS(DeviceManagerBase):
 
         Args:
             obj (OphydObject): Ophyd object to subscribe to BEC device events
+            event_types (frozenset[str] | tuple[str, ...], optional): Event types of the device.
+                Defaults to obj.event_types.
 
         """
-        if "device_monitor_2d" in obj.event_types:
+        if event_types is None:
+            event_types = obj.event_types
+        if "device_monitor_2d" in event_types:
             obj.subscribe(
                 self._obj_callback_device_monitor_2d, event_type="device_monitor_2d", run=False
             )
-        if "device_monitor_1d" in obj.event_types:
+        if "device_monitor_1d" in event_types:
             obj.subscribe(
                 self._obj_callback_device_monitor_1d, event_type="device_monitor_1d", run=False
             )
-        if "file_event" in obj.event_types:
+        if "file_event" in event_types:
             obj.subscribe(self._obj_callback_file_event, event_type="file_event", run=False)
-        if "done_moving" in obj.event_types:
+        if "done_moving" in event_types:
             obj.subscribe(self._obj_callback_done_moving, event_type="done_moving", run=False)
-        if "flyer" in obj.event_types:
+        if "flyer" in event_types:
             obj.subscribe(self._obj_flyer_callback, event_type="flyer", run=False)
-        if "progress" in obj.event_types:
+        if "progress" in event_types:
             obj.subscribe(self._obj_callback_progress, event_type="progress", run=False)
 
     def _subscribe_to_auto_monitors(self, obj: OphydObject):
@@ -714,7 +866,7 @@ class DeviceManagerDS(DeviceManagerBase):
         """
 
         try:
-            if hasattr(obj, "wait_for_connection"):
+            if _has_attribute(obj, "wait_for_connection"):
                 try:
                     with disable_lazy_wait_for_connection(obj):
                         obj.wait_for_connection(all_signals=wait_for_all, timeout=timeout)  # type: ignore
@@ -792,35 +944,43 @@ class DeviceManagerDS(DeviceManagerBase):
             _pipe.execute()
 
     def _obj_callback_readback(
-        self, *_args, obj: OphydObject, pipe: Pipeline | None = None, **kwargs
+        self,
+        *_args,
+        obj: OphydObject,
+        pipe: Pipeline | None = None,
+        ds_obj: DSDevice | None = None,
+        **kwargs,
     ):
         if not obj.connected:
             return
-        name = obj.root.name
-        signals = obj.root.read()
-        metadata = self.devices.get(obj.root.name).metadata
-        dev_msg = messages.DeviceMessage(signals=signals, metadata=metadata)
+        if ds_obj is None:
+            ds_obj = self.devices.get(obj.root.name)
+        signals = ds_obj.obj.read()
+        dev_msg = messages.DeviceMessage(signals=signals, metadata=ds_obj.metadata)
         _pipe = pipe if pipe is not None else self.connector.pipeline()
-        self.connector.set_and_publish(MessageEndpoints.device_readback(name), dev_msg, pipe=_pipe)
+        self.connector.set_and_publish(ds_obj.readback_endpoint, dev_msg, pipe=_pipe)
         if pipe is None:
             _pipe.execute()
 
     def _obj_callback_configuration(
-        self, *_args, obj: OphydObject, pipe: Pipeline | None = None, **kwargs
+        self,
+        *_args,
+        obj: OphydObject,
+        pipe: Pipeline | None = None,
+        ds_obj: DSDevice | None = None,
+        **kwargs,
     ):
         if not obj.connected:
             return
-        if isinstance(obj.root, ophyd.Signal):
+        if ds_obj is None:
+            ds_obj = self.devices.get(obj.root.name)
+        if isinstance(ds_obj.obj, ophyd.Signal):
             # we don't need to publish the configuration of a signal
             return
-        name = obj.root.name
-        signals = obj.root.read_configuration()
-        metadata = self.devices.get(obj.root.name).metadata
-        dev_msg = messages.DeviceMessage(signals=signals, metadata=metadata)
+        signals = ds_obj.obj.read_configuration()
+        dev_msg = messages.DeviceMessage(signals=signals, metadata=ds_obj.metadata)
         _pipe = pipe if pipe is not None else self.connector.pipeline()
-        self.connector.set_and_publish(
-            MessageEndpoints.device_read_configuration(name), dev_msg, pipe=_pipe
-        )
+        self.connector.set_and_publish(ds_obj.read_configuration_endpoint, dev_msg, pipe=_pipe)
         if pipe is None:
             _pipe.execute()
 
@@ -862,18 +1022,19 @@ class DeviceManagerDS(DeviceManagerBase):
                     self._auto_monitor_configuration_updates.clear()
                     self._limit_change_updates.clear()
 
-                pipe = self.connector.pipeline()
+                # the updates are independent of each other, no need for MULTI/EXEC
+                pipe = self.connector.pipeline(transaction=False)
                 for name in readback_updates:
-                    if name not in self.devices:
+                    ds_obj = self.devices.get(name)
+                    if ds_obj is None:
                         continue
-                    obj = self.devices[name].obj
-                    self._obj_callback_readback(obj=obj, pipe=pipe)
+                    self._obj_callback_readback(obj=ds_obj.obj, pipe=pipe, ds_obj=ds_obj)
 
                 for name in configuration_updates:
-                    if name not in self.devices:
+                    ds_obj = self.devices.get(name)
+                    if ds_obj is None:
                         continue
-                    obj = self.devices[name].obj
-                    self._obj_callback_configuration(obj=obj, pipe=pipe)
+                    self._obj_callback_configuration(obj=ds_obj.obj, pipe=pipe, ds_obj=ds_obj)
 
                 for name in limits_updates:
                     if name not in self.devices:
@@ -886,7 +1047,6 @@ class DeviceManagerDS(DeviceManagerBase):
                 logger.error(f"Error in auto monitor update loop: {exc}")
                 logger.error(traceback.format_exc())
 
-    @typechecked
     def _obj_callback_device_monitor_2d(
         self, *_args, obj: OphydObject, value: np.ndarray, timestamp: float | None = None, **kwargs
     ):
@@ -902,7 +1062,7 @@ class DeviceManagerDS(DeviceManagerBase):
 
         """
         # Convert sizes from bytes to MB
-        dsize = len(value.tobytes()) / 1e6
+        dsize = value.nbytes / 1e6
         max_size = 1000
         if dsize > max_size:
             logger.warning(
@@ -941,7 +1101,7 @@ class DeviceManagerDS(DeviceManagerBase):
 
         """
         # Convert sizes from bytes to MB
-        dsize = len(value.tobytes()) / 1e6
+        dsize = value.nbytes / 1e6
         max_size = 1000
         if dsize > max_size:
             logger.warning(
@@ -978,13 +1138,14 @@ class DeviceManagerDS(DeviceManagerBase):
         self._obj_callback_readback(*args, **kwargs)
         # self._obj_callback_acq_done(*args, **kwargs)
 
-    def _obj_callback_is_moving(self, *_args, **kwargs):
-        device = kwargs["obj"].root.name
+    def _obj_callback_is_moving(self, *_args, ds_obj: DSDevice | None = None, **kwargs):
+        if ds_obj is None:
+            ds_obj = self.devices[kwargs["obj"].root.name]
+        device = ds_obj.name
         status = int(kwargs.get("value"))
-        metadata = self.devices[device].metadata
         self.connector.set(
-            MessageEndpoints.device_status(device),
-            messages.DeviceStatusMessage(device=device, status=status, metadata=metadata),
+            ds_obj.status_endpoint,
+            messages.DeviceStatusMessage(device=device, status=status, metadata=ds_obj.metadata),
         )
 
     def _obj_flyer_callback(self, *_args, **kwargs):
@@ -998,30 +1159,29 @@ class DeviceManagerDS(DeviceManagerBase):
         if "scan_id" not in metadata:
             return
 
-        if not hasattr(ds_obj, "emitted_points"):
-            ds_obj.emitted_points = {}
-
         emitted_points = ds_obj.emitted_points.get(metadata["scan_id"], 0)
 
+        endpoint = ds_obj.read_endpoint
+        keys = list(data)
+        columns = [data[key] for key in keys]
         # make sure all arrays are of equal length
-        max_points = min(len(d) for d in data.values())
+        max_points = min(map(len, columns))
 
-        pipe = self.connector.pipeline()
+        # all points of an event are emitted at the same time
+        timestamp = time.time()
+        pipe = self.connector.pipeline(transaction=False)
         for ii in range(emitted_points, max_points):
-            timestamp = time.time()
-            signals = {}
-            for key, val in data.items():
-                signals[key] = {"value": val[ii], "timestamp": timestamp}
+            signals = {
+                key: {"value": col[ii], "timestamp": timestamp} for key, col in zip(keys, columns)
+            }
             msg = messages.DeviceMessage(signals=signals, metadata={"point_id": ii, **metadata})
-            self.connector.set_and_publish(
-                MessageEndpoints.device_read(obj.root.name), msg, pipe=pipe
-            )
+            self.connector.set_and_publish(endpoint, msg, pipe=pipe)
 
         ds_obj.emitted_points[metadata["scan_id"]] = max_points
         msg = messages.DeviceStatusMessage(
             device=obj.root.name, status=max_points, metadata=metadata
         )
-        self.connector.set(MessageEndpoints.device_status(obj.root.name), msg, pipe=pipe)
+        self.connector.set(ds_obj.status_endpoint, msg, pipe=pipe)
         pipe.execute()
 
     def _obj_callback_progress(self, *_args, obj, value, max_value, done, **kwargs):
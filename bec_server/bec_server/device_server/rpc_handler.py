@@ -383,8 +383,7 @@ class RPCHandler:
         """
         if not isinstance(res, ophyd.StatusBase):
             return
-        res.__dict__["instruction"] = instr
-        res.__dict__["obj_ref"] = obj
+        self.requests_handler.set_status_info(res, instr, obj)
         self.requests_handler.add_status_object(instr.metadata["device_instr_id"], res)
 
     def _serialize_rpc_response(self, instr: messages.DeviceInstructionMessage, res: Any) -> Any:
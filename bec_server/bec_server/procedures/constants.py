@@ -50,6 +50,9 @@ class _WORKER:
     MAX_WORKERS = 10
     QUEUE_TIMEOUT_S = 10
     DEFAULT_QUEUE = "primary"
+    STATUS_POLL_MIN_S = 0.2
+    STATUS_POLL_MAX_S = 0.4
+    LIVENESS_POLL_EVERY_N = 10
 
 
 @dataclass(frozen=True)
@@ -2,15 +2,17 @@
 
 import json
 import subprocess
+import threading
 import traceback
 from http import HTTPStatus
 from itertools import chain
 from pathlib import Path
-from typing import Iterator, Literal, cast
+from typing import Callable, Iterator, Literal, TypeVar, cast
 
 from podman import PodmanClient
 from podman.domain.containers import Container
 from podman.errors import APIError
+from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from bec_lib.logger import bec_logger
 from bec_server.procedures.constants import (
@@ -28,6 +30,8 @@ from bec_server.procedures.protocol import (
 
 logger = bec_logger.logger
 
+_T = TypeVar("_T")
+
 
 def get_backend() -> ContainerCommandBackend:
     """Get the currently selected backend for executing podman commands"""
@@ -61,6 +65,15 @@ class _PodmanUtilsBase(ContainerCommandBackend):
         if not podman_available():
             raise NoPodman()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        """Release the resources held by the backend"""
+
     def build_requirements_image(self):  # pragma: no cover
         """Build the procedure worker requirements image"""
         return self._build_image(
@@ -98,20 +111,49 @@ class PodmanApiUtils(_PodmanUtilsBase):
         super().__init__()
         self.uri = uri
         self._container: Container | None = None
+        # a single client is reused for all calls, rather than opening a new connection each time.
+        # Its session is not thread safe, so calls from different threads take turns.
+        self._client: PodmanClient | None = None
+        self._client_lock = threading.RLock()
+
+    def close(self):
+        """Close the connection to the podman service, if one is open"""
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def _get_client(self) -> PodmanClient:
+        if self._client is None:
+            self._client = PodmanClient(base_url=self.uri)
+        return self._client
+
+    def _with_client(self, func: Callable[[PodmanClient], _T]) -> _T:
+        """Call func with the shared client. If the connection was dropped (e.g. the podman socket
+        closed it after being idle), reconnect once and retry. Errors returned by the podman
+        service are not retried, since the calls are not all idempotent."""
+        with self._client_lock:
+            try:
+                return func(self._get_client())
+            except (ConnectionError, RequestsConnectionError) as e:
+                logger.warning(f"Lost connection to podman service ({e}), reconnecting...")
+                self.close()
+                return func(self._get_client())
 
     def _build_image(
         self, buildargs: dict, path: str, file: str, volume: str, tag: str
     ):  # pragma: no cover
-        with PodmanClient(base_url=self.uri) as client:
-            build_kwargs = {
-                "buildargs": buildargs,
-                "path": path,
-                "dockerfile": file,
-                "volume": [volume],
-                "tag": tag,
-            }
-            logger.info(f"Building container: {build_kwargs}")
-            return PodmanApiOutput(client.images.build(**build_kwargs)[1])
+        build_kwargs = {
+            "buildargs": buildargs,
+            "path": path,
+            "dockerfile": file,
+            "volume": [volume],
+            "tag": tag,
+        }
+        logger.info(f"Building container: {build_kwargs}")
+        return PodmanApiOutput(
+            self._with_client(lambda client: client.images.build(**build_kwargs))[1]
+        )
 
     def run(
         self,
@@ -122,9 +164,9 @@ class PodmanApiUtils(_PodmanUtilsBase):
         pod_name: str | None = None,
         container_name: str | None = None,
     ) -> str:
-        with PodmanClient(base_url=self.uri) as client:
-            try:
-                self._container = client.containers.run(
+        try:
+            self._container = self._with_client(
+                lambda client: client.containers.run(
                     image_tag,
                     command,
                     detach=True,
@@ -133,41 +175,48 @@ class PodmanApiUtils(_PodmanUtilsBase):
                     pod=pod_name,
                     name=container_name,
                 )  # type: ignore # running with detach returns container object
-            except APIError as e:
-                if e.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-                    raise ProcedureWorkerError(
-                        f"Got an internal server error from Podman service: {traceback.print_exception(e)}"
-                    ) from e
-                # TODO handle a few more categories
-                raise NoPodman(
-                    f"Could not connect to podman socket at {PROCEDURE.CONTAINER.PODMAN_URI} - is the systemd service running? Try `systemctl --user start podman.socket`."
+            )
+        except APIError as e:
+            if e.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
+                raise ProcedureWorkerError(
+                    f"Got an internal server error from Podman service: {traceback.print_exception(e)}"
                 ) from e
+            # TODO handle a few more categories
+            raise NoPodman(
+                f"Could not connect to podman socket at {PROCEDURE.CONTAINER.PODMAN_URI} - is the systemd service running? Try `systemctl --user start podman.socket`."
+            ) from e
         return cast(str, self._container.id)  # type: ignore # _container is set above or we raise before here
 
     def image_exists(self, image_tag) -> bool:
-        with PodmanClient(base_url=self.uri) as client:
-            return client.images.exists(image_tag)
+        return self._with_client(lambda client: client.images.exists(image_tag))
 
     def interrupt(self, id: str):
         raise NotImplemented
 
     def kill(self, id: str):
-        with PodmanClient(base_url=self.uri) as client:
-            client.containers.get(id).kill()
+        self._with_client(lambda client: client.containers.get(id).kill())
 
     def state(self, id: str) -> PodmanContainerStates | None:
+        status = self._with_client(lambda client: client.containers.get(id).status)
+        if status == "unknown":
+            return None
+        return PodmanContainerStates(status)
+
+    def wait(self, id: str):
+        # waiting blocks until the container exits, so it gets its own client rather than holding
+        # the shared one
         with PodmanClient(base_url=self.uri) as client:
-            status = client.containers.get(id).status
-            if status == "unknown":
-                return None
-            return PodmanContainerStates(status)
+            client.containers.get(id).wait()
 
     def logs(self, id: str) -> list[str]:
         return NotImplemented
 
 
 def _multi_args_from_dict(argname: str, args: dict[str, str]) -> list[str]:
-    return list(chain(*((argname, f"{k}={v}") for k, v in args.items())))
+    # fill every even slot with argname, then the odd slots with the values
+    out = [argname] * (2 * len(args))
+    out[1::2] = [f"{k}={v}" for k, v in args.items()]
+    return out
 
 
 class PodmanCliOutput(ContainerCommandOutput):
@@ -218,24 +267,27 @@ class PodmanCliUtils(_PodmanUtilsBase):
         _environment = _multi_args_from_dict("-e", environment)  # type: ignore # this is actually a dict[str, str]
         _pod_arg = ["--pod", pod_name] if pod_name else []
         _name_arg = ["--replace", "--name", container_name] if container_name else []
-        if container_name:
-            # in case of incomplete cleanup previously, even with --replace it is possible to get an error
-            _run_and_capture_error("podman", "rm", "-f", container_name)
-        return (
-            _run_and_capture_error(
-                "podman",
-                "run",
-                *_environment,
-                "-d",
-                *_name_arg,
-                *_volume_args,
-                *_pod_arg,
-                image_tag,
-                command,
-            )
-            .stdout.decode()
-            .strip()
+        _run_args = (
+            "podman",
+            "run",
+            *_environment,
+            "-d",
+            *_name_arg,
+            *_volume_args,
+            *_pod_arg,
+            image_tag,
+            command,
         )
+        try:
+            output = _run_and_capture_error(*_run_args)
+        except ProcedureWorkerError:
+            if not container_name:
+                raise
+            # in case of incomplete cleanup previously, even with --replace it is possible to get
+            # an error - only then pay for a separate removal before trying again
+            _run_and_capture_error("podman", "rm", "-f", container_name)
+            output = _run_and_capture_error(*_run_args)
+        return output.stdout.decode().strip()
 
     def interrupt(self, id: str):
         try:
@@ -256,6 +308,9 @@ class PodmanCliUtils(_PodmanUtilsBase):
             logger.error(e)
             return [f"No logs found for container {id}\n"]
 
+    def wait(self, id: str):
+        _run_and_capture_error("podman", "wait", id)
+
     def state(self, id: str) -> PodmanContainerStates | None:
         for container in self._podman_ls_json():
             if container["Id"] == id or container["Id"].startswith(id):
@@ -1,7 +1,7 @@
-import time
+from threading import Event, Lock, Thread
 
 from bec_lib.logger import bec_logger
-from bec_server.procedures.constants import PROCEDURE, PodmanContainerStates
+from bec_server.procedures.constants import PROCEDURE, ProcedureWorkerError
 from bec_server.procedures.container_utils import get_backend
 from bec_server.procedures.oop_worker_base import (
     main,  # temporarily needed before update of base image on release
@@ -11,6 +11,9 @@ from bec_server.procedures.protocol import ContainerCommandBackend
 
 logger = bec_logger.logger
 
+# stops a worker from starting a second build of the image while warm_up() is building it
+_image_lock = Lock()
+
 
 class ContainerProcedureWorker(OutOfProcessWorkerBase):
     """A worker which runs scripts in a container with a full BEC environment,
@@ -20,12 +23,31 @@ class ContainerProcedureWorker(OutOfProcessWorkerBase):
     # documented at https://docs.podman.io/en/latest/_static/api.html
     # which is more detailed than the podman-py documentation
 
+    @staticmethod
+    def _ensure_image(backend: ContainerCommandBackend) -> str:
+        image_tag = f"{PROCEDURE.CONTAINER.IMAGE_NAME}:v{PROCEDURE.BEC_VERSION}"
+        with _image_lock:
+            if not backend.image_exists(image_tag):
+                backend.build_worker_image()
+        return image_tag
+
+    @classmethod
+    def warm_up(cls):
+        """Build the worker image now if it is missing, rather than when the first procedure is
+        requested."""
+        try:
+            backend = get_backend()
+            try:
+                cls._ensure_image(backend)
+            finally:
+                backend.close()
+        except ProcedureWorkerError as e:
+            logger.error(f"Failed to prepare the procedure worker image: {e}")
+
     def _setup_execution_environment(self):
         self._backend: ContainerCommandBackend = get_backend()
-        image_tag = f"{PROCEDURE.CONTAINER.IMAGE_NAME}:v{PROCEDURE.BEC_VERSION}"
         self.container_name = f"bec_procedure_{PROCEDURE.BEC_VERSION}_{self._queue}"
-        if not self._backend.image_exists(image_tag):
-            self._backend.build_worker_image()
+        image_tag = self._ensure_image(self._backend)
         self._container_id = self._backend.run(
             image_tag,
             self._worker_environment(),
@@ -41,26 +63,39 @@ class ContainerProcedureWorker(OutOfProcessWorkerBase):
             pod_name=PROCEDURE.CONTAINER.POD_NAME,
             container_name=self.container_name,
         )
+        # Rather than polling the container state, block on `podman wait` in the background and
+        # get told when the container exits. A new event is made for each container, so that the
+        # watcher of a container replaced in abort_execution() can't mark the new one as exited.
+        self._container_exited = Event()
+        self._exit_watcher = Thread(
+            target=self._watch_for_exit,
+            args=(self._container_id, self._container_exited),
+            name=f"ContainerExitWatcher-{self._queue}",
+            daemon=True,
+        )
+        self._exit_watcher.start()
+
+    def _watch_for_exit(self, container_id: str, exited: Event):
+        try:
+            self._backend.wait(container_id)
+        except ProcedureWorkerError as e:
+            logger.error(f"Failed to wait for container {container_id}, assuming it exited: {e}")
+        finally:
+            exited.set()
 
     def _ending_or_ended(self):
-        return self._backend.state(self._container_id) in [
-            PodmanContainerStates.EXITED,
-            PodmanContainerStates.STOPPED,
-            PodmanContainerStates.STOPPING,
-        ]
+        return self._container_exited.is_set()
 
     def _kill_process(self):
         if not self._ending_or_ended():
             self._backend.interrupt(self.container_name)
-            start = time.monotonic()
-            while time.monotonic() < start + PROCESS_TIMEOUT:
-                if self._ending_or_ended():
-                    return
-                time.sleep(0.2)
-            logger.warning(
-                f"Procedure worker {self._container_id} for queue {self._queue} failed to shut down, killing."
-            )
-            self._backend.kill(self.container_name)
+            if not self._container_exited.wait(PROCESS_TIMEOUT):
+                logger.warning(
+                    f"Procedure worker {self._container_id} for queue {self._queue} failed to shut down, killing."
+                )
+                self._backend.kill(self.container_name)
+        self._exit_watcher.join(PROCESS_TIMEOUT)
+        self._backend.close()
 
     def abort_execution(self, execution_id: str):
         """Abort the execution with the given id. Has no effect if the given ID is not the current job"""
@@ -70,6 +105,8 @@ class ContainerProcedureWorker(OutOfProcessWorkerBase):
             logger.info(
                 f"Aborting execution {execution_id}, restarting worker for queue: {self._queue}"
             )
+            # a new backend is set up for the new container
+            self._backend.close()
             self._setup_execution_environment()
 
     def logs(self):
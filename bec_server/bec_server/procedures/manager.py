@@ -102,6 +102,9 @@ class ProcedureManagerBase(ABC, Generic[_ReqMsgT, _ExecMsgT]):
             )
 
         self._active_workers: dict[str, ProcedureWorkerEntry] = {}
+        # Immutable copy of the _active_workers items, replaced whenever workers are added or
+        # removed, so that the status methods can be polled without waiting for the lock
+        self._workers_snapshot: tuple[tuple[str, ProcedureWorkerEntry], ...] = ()
         self.executor = ThreadPoolExecutor(
             max_workers=PROCEDURE.WORKER.MAX_WORKERS, thread_name_prefix=thread_prefix
         )
@@ -144,8 +147,13 @@ class ProcedureManagerBase(ABC, Generic[_ReqMsgT, _ExecMsgT]):
                 new_worker.add_done_callback(_log_on_end)
                 new_worker.add_done_callback(self._cleanup_worker_function(queue))
                 self._active_workers[queue] = {"worker": None, "future": new_worker}
+                self._update_workers_snapshot()
         return exec_msg
 
+    def _update_workers_snapshot(self):
+        """Must be called with the lock held, after any change to _active_workers."""
+        self._workers_snapshot = tuple(self._active_workers.items())
+
     def spawn(self, queue: str, env: dict[str, str]):
         """Spawn a procedure worker future which listens to a given queue, i.e. procedure queue list in Redis.
 
@@ -168,24 +176,21 @@ class ProcedureManagerBase(ABC, Generic[_ReqMsgT, _ExecMsgT]):
         futures.wait(futs, timeout=PROCEDURE.MANAGER_SHUTDOWN_TIMEOUT_S)
 
     def active_workers(self) -> list[str]:
-        with self.lock:
-            return list(self._active_workers.keys())
+        return [q for q, _ in self._workers_snapshot]
 
     def worker_status(self, queue):
-        with self.lock:
-            worker = self._active_workers.get(queue)
-            return (
-                ProcedureWorkerStatus.NONE
-                if worker is None or worker["worker"] is None
-                else worker["worker"].status
-            )
+        worker = dict(self._workers_snapshot).get(queue)
+        return (
+            ProcedureWorkerStatus.NONE
+            if worker is None or worker["worker"] is None
+            else worker["worker"].status
+        )
 
     def worker_statuses(self) -> dict[str, ProcedureWorkerStatus]:
-        with self.lock:
-            return {
-                q: (w["worker"].status if w["worker"] is not None else ProcedureWorkerStatus.NONE)
-                for q, w in self._active_workers.items()
-            }
+        return {
+            q: (w["worker"].status if w["worker"] is not None else ProcedureWorkerStatus.NONE)
+            for q, w in self._workers_snapshot
+        }
 
     def shutdown(self):
         """Shutdown the procedure manager. Unregisters from the request endpoint, cancel any
@@ -253,6 +258,7 @@ class ProcedureManager(ProcedureManagerBase[ProcedureRequestMessage, ProcedureEx
         self._messages_by_ids: dict[str, ProcedureExecutionMessage] = {}
         self._helper = BackendProcedureHelper(self._conn, monitor_responses=False)
         self._startup()
+        self.executor.submit(self._worker_cls.warm_up)
 
     def _define_endpoints(self):
         self._reply_ep = MessageEndpoints.procedure_request_response()
@@ -274,10 +280,14 @@ class ProcedureManager(ProcedureManagerBase[ProcedureRequestMessage, ProcedureEx
         )
 
     def _register_endpoints(self):
-        self._conn.register(self._abort_ep, None, self._process_abort)
-        self._conn.register(self._clear_uh_ep, None, self._process_clear_unhandled)
-        self._conn.register(self._request_ep, None, self._process_queue_request)
-        self._conn.register(self._q_notif_ep, None, self._publish_metrics)
+        # subscribe to all topics at once, and route the messages in _dispatch()
+        self._dispatch_table: dict[str, Callable[[MessageObject], Any]] = {
+            self._abort_ep.endpoint: self._process_abort,
+            self._clear_uh_ep.endpoint: self._process_clear_unhandled,
+            self._request_ep.endpoint: self._process_queue_request,
+            self._q_notif_ep.endpoint: self._publish_metrics,
+        }
+        self._conn.register(list(self._dispatch_table), None, self._dispatch)
         self._conn.set(
             MessageEndpoints.available_procedures(),
             AvailableResourceMessage(
@@ -288,6 +298,9 @@ class ProcedureManager(ProcedureManagerBase[ProcedureRequestMessage, ProcedureEx
             ),
         )
 
+    def _dispatch(self, msg: MessageObject):
+        self._dispatch_table[msg.topic](msg)
+
     def _cleanup_worker_function(self, queue: str):
         def cleanup_worker(fut):
             with self.lock:
@@ -296,6 +309,7 @@ class ProcedureManager(ProcedureManagerBase[ProcedureRequestMessage, ProcedureEx
                 self._run_callbacks(queue)
                 self._helper.notify_watchers(queue, "execution")
                 del self._active_workers[queue]
+                self._update_workers_snapshot()
 
         return cleanup_worker
 
@@ -389,10 +403,11 @@ class ProcedureManager(ProcedureManagerBase[ProcedureRequestMessage, ProcedureEx
         if self._conn.lrem(MessageEndpoints.procedure_execution(msg.queue), 0, msg) > 0:
             logger.debug(f"Removed execution {msg} from queue.")
             self._helper.notify_watchers(msg.queue, "execution")
-        # Otherwise try to remove it from whichever worker has it
-        for entry in self._active_workers.values():
-            if (worker := entry["worker"]) is not None and worker:
-                worker.abort_execution(execution_id)
+        # Otherwise it can only be running on the worker for its own queue
+        elif (entry := self._active_workers.get(msg.queue)) is not None and (
+            worker := entry["worker"]
+        ) is not None:
+            worker.abort_execution(execution_id)
         # Move it to unhandled and stop tracking
         self._helper.push.unhandled(msg.queue, msg)
         del self._messages_by_ids[execution_id]
@@ -431,6 +446,4 @@ class ProcedureManager(ProcedureManagerBase[ProcedureRequestMessage, ProcedureEx
 
     def _unregister_endpoints(self):
         """Remove any callbacks from any Redis endpoints"""
-        self._conn.unregister(self._abort_ep, None, self._process_abort)
-        self._conn.unregister(self._clear_uh_ep, None, self._process_clear_unhandled)
-        self._conn.unregister(self._request_ep, None, self._process_queue_request)
+        self._conn.unregister(list(self._dispatch_table), None, self._dispatch)
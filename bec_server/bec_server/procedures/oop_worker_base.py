@@ -70,18 +70,35 @@ class OutOfProcessWorkerBase(ProcedureWorker):
         # on timeout check if container is still running
 
         status_update = None
-        while not self._ending_or_ended():
+        poll_timeout_s = PROCEDURE.WORKER.STATUS_POLL_MIN_S
+        updates_since_liveness_check = 0
+        while True:
+            # Status updates are handled as fast as they arrive, but the external process is only
+            # checked on when the pop times out or after every LIVENESS_POLL_EVERY_N updates
+            if updates_since_liveness_check == 0 and self._ending_or_ended():
+                break
             status_update = self._conn.blocking_list_pop(
-                MessageEndpoints.procedure_worker_status_update(self._queue), timeout_s=0.2
+                MessageEndpoints.procedure_worker_status_update(self._queue),
+                timeout_s=poll_timeout_s,
+            )
+            if status_update is None:
+                # The pop returns as soon as an update arrives, so the timeout only sets how often
+                # we check on the external process. Back off while it is quiet, but only a little:
+                # the timeout is also how late we notice that the process has exited.
+                poll_timeout_s = min(2 * poll_timeout_s, PROCEDURE.WORKER.STATUS_POLL_MAX_S)
+                updates_since_liveness_check = 0
+                continue
+            poll_timeout_s = PROCEDURE.WORKER.STATUS_POLL_MIN_S
+            updates_since_liveness_check = (
+                updates_since_liveness_check + 1
+            ) % PROCEDURE.WORKER.LIVENESS_POLL_EVERY_N
+            if not isinstance(status_update, messages.ProcedureWorkerStatusMessage):
+                raise ProcedureWorkerError(f"Received unexpected message {status_update}")
+            self.status = status_update.status
+            self._current_execution_id = status_update.current_execution_id
+            logger.info(
+                f"Procedure worker '{self._queue}' status update: {status_update.status.name}"
             )
-            if status_update is not None:
-                if not isinstance(status_update, messages.ProcedureWorkerStatusMessage):
-                    raise ProcedureWorkerError(f"Received unexpected message {status_update}")
-                self.status = status_update.status
-                self._current_execution_id = status_update.current_execution_id
-                logger.info(
-                    f"Procedure worker '{self._queue}' status update: {status_update.status.name}"
-                )
             # TODO: we probably do want to handle some kind of timeout here but we don't know how
             # long a running procedure should actually take - it could theoretically be infinite
         if self.status != ProcedureWorkerStatus.FINISHED:
@@ -152,7 +169,8 @@ def setup(env: OopWorkerEnv):
         exit(1)
 
     logger.success(f"Procedure worker started container for queue {env['queue']}")
-    conn = RedisConnector(env["redis_server"])
+    # reuse the client's connection rather than opening another one to the same server
+    conn = client.connector
     logger.debug(f"Procedure worker {env['queue']} connected to Redis at {conn.host}:{conn.port}")
     helper = BackendProcedureHelper(conn)
 
@@ -225,9 +243,10 @@ def _main(
     finally:
         logger.success("Procedure runner shutting down")
         push_status(conn, queue, ProcedureWorkerStatus.FINISHED)
-        client.shutdown(per_thread_timeout_s=1)
         if item is not None:  # in this case we are here due to an exception, not a timeout
             helper.remove_from_active.by_exec_id(item.execution_id)
+        # conn belongs to the client, so this has to come last
+        client.shutdown(per_thread_timeout_s=1)
 
 
 def main():
@@ -244,5 +263,4 @@ def main():
             filter=bec_logger.filter(),
         )
         _main(env, helper, client, conn)
-    conn.shutdown()
     logger_connector.shutdown()
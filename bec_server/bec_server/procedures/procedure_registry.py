@@ -31,13 +31,16 @@ def available() -> Iterable[str]:
 
 def check_builtin_procedure(msg: ProcedureExecutionMessage) -> bool:
     """Return true if the given msg references a builtin procedure"""
-    return msg.identifier in available()
+    return msg.identifier in _PROCEDURE_REGISTRY
 
 
 def callable_from_name(name: str) -> BecProcedure:
-    if not is_registered(name):
-        raise ProcedureRegistryError(f"No registered procedure {name}. Available: {available()}")
-    return _PROCEDURE_REGISTRY[name]
+    try:
+        return _PROCEDURE_REGISTRY[name]
+    except KeyError:
+        raise ProcedureRegistryError(
+            f"No registered procedure {name}. Available: {available()}"
+        ) from None
 
 
 def callable_from_execution_message(msg: ProcedureExecutionMessage) -> BecProcedure:
@@ -55,7 +58,7 @@ def get_info(name: str) -> tuple[str, str | None]:
 
 def is_registered(identifier: str) -> bool:
     """Return true if there is a registered procedure with the given identifier"""
-    return identifier in available()
+    return identifier in _PROCEDURE_REGISTRY
 
 
 def register(identifier: str, proc: BecProcedure):
@@ -34,3 +34,5 @@ class ContainerCommandBackend(Protocol):
     def kill(self, id: str): ...
     def logs(self, id: str) -> list[str]: ...
     def state(self, id: str) -> PodmanContainerStates | None: ...
+    def wait(self, id: str): ...
+    def close(self): ...
@@ -62,6 +62,11 @@ class ProcedureWorker(ABC):
         self._conn.shutdown()
         self._kill_process()
 
+    @classmethod
+    def warm_up(cls):
+        """Called once in the background when a manager using this worker type starts, to get
+        anything slow to set up (e.g. images) ready before the first procedure is requested."""
+
     @abstractmethod
     def _kill_process(self):
         """Clean up the execution environment, e.g. kill container or running subprocess.
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import concurrent.futures
+import threading
 import traceback
 
 from bec_lib import bl_states, messages
@@ -18,6 +20,18 @@ class BeamlineStateManager:
         self.connector = connector
         self.device_manager = device_manager
         self._states: dict[str, bl_states.BeamlineState] = {}
+        # state configs of the last successfully applied update
+        self._last_state_configs: list[messages.BeamlineStateConfig] | None = None
+        # state configs of the last update handed to the executor
+        self._last_submitted_configs: list[messages.BeamlineStateConfig] | None = None
+        # starting and restarting states reads from redis; keep that work off the connector's
+        # callback threads. A single worker applies the updates in the order they arrive.
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="BeamlineStateManager"
+        )
+        # guards the executor against submits after shutdown
+        self._executor_lock = threading.Lock()
+        self._is_shutdown = False
         self.connector.register(
             MessageEndpoints.available_beamline_states(),
             cb=self._handle_state_update,
@@ -28,9 +42,18 @@ class BeamlineStateManager:
     def _handle_state_update(self, msg_dict: dict, **_kwargs) -> None:
 
         msg: messages.AvailableBeamlineStatesMessage = msg_dict["data"]  # type: ignore ; we know it's a AvailableBeamlineStatesMessage
+        if msg.states == self._last_submitted_configs:
+            # repeated update; it is either applied already or still pending
+            return
+        self._last_submitted_configs = msg.states
+        self._submit(self._apply_state_update, msg)
+
+    def _apply_state_update(self, msg: messages.AvailableBeamlineStatesMessage) -> None:
         try:
             self.update_states(msg)
         except Exception as exc:
+            # let the next update retry, even if it repeats this one
+            self._last_submitted_configs = None
             content = traceback.format_exc()
             info = ErrorInfo(
                 exception_type=type(exc).__name__,
@@ -40,8 +63,63 @@ class BeamlineStateManager:
             self.connector.raise_alarm(severity=Alarms.WARNING, info=info)
 
     def restart_all(self, *_):
-        for state in self._states.values():
-            state.restart()
+        self._submit(self._restart_states)
+
+    def _submit(self, fn, *args) -> None:
+        with self._executor_lock:
+            if self._is_shutdown:
+                return
+            self.executor.submit(fn, *args)
+
+    def _restart_states(self) -> None:
+        try:
+            for state in list(self._states.values()):
+                state.restart()
+        except Exception as exc:
+            content = traceback.format_exc()
+            info = ErrorInfo(
+                exception_type=type(exc).__name__,
+                error_message=content,
+                compact_error_message="Error restarting beamline states.",
+            )
+            self.connector.raise_alarm(severity=Alarms.WARNING, info=info)
+
+    def shutdown(self) -> None:
+        """Stop applying state updates."""
+        self.connector.unregister(
+            MessageEndpoints.available_beamline_states(), cb=self._handle_state_update
+        )
+        self.connector.unregister(MessageEndpoints.device_config_update(), cb=self.restart_all)
+        with self._executor_lock:
+            self._is_shutdown = True
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def _get_device_readbacks(
+        self, states: list[bl_states.BeamlineState]
+    ) -> dict[str, messages.DeviceMessage | None]:
+        """
+        Fetch the current readbacks of the devices monitored by the given states in one request.
+
+        Args:
+            states (list[bl_states.BeamlineState]): The states that are about to be started.
+
+        Returns:
+            dict[str, messages.DeviceMessage | None]: The readbacks by device name. Empty if
+                there is nothing to gain from fetching them together.
+        """
+        devices = list(
+            dict.fromkeys(
+                state.config.device
+                for state in states
+                if isinstance(state, bl_states.DeviceBeamlineState)
+            )
+        )
+        if len(devices) < 2:
+            return {}
+        readbacks = self.connector.mget(
+            [MessageEndpoints.device_readback(device).endpoint for device in devices]
+        )
+        return dict(zip(devices, readbacks))
 
     def update_states(self, msg: messages.AvailableBeamlineStatesMessage) -> None:
         """
@@ -51,13 +129,23 @@ class BeamlineStateManager:
             msg (messages.AvailableBeamlineStatesMessage): The update message containing state updates.
         """
 
+        if msg.states == self._last_state_configs:
+            # nothing changed since the last update
+            return
+
+        incoming_states = {state.name: state for state in msg.states}
+
         # get the states that we need to remove
-        remove_state_names = set(self._states) - set(state.name for state in msg.states)
+        remove_state_names = self._states.keys() - incoming_states.keys()
 
-        added_state_names = set(state.name for state in msg.states) - set(self._states)
-        added_states = {
-            state.name: state for state in msg.states if state.name in added_state_names
-        }
+        # split the incoming states into new ones and ones that may need to be updated
+        added_states: dict[str, messages.BeamlineStateConfig] = {}
+        existing_states: dict[str, messages.BeamlineStateConfig] = {}
+        for name, state in incoming_states.items():
+            if name in self._states:
+                existing_states[name] = state
+            else:
+                added_states[name] = state
 
         for state_name in remove_state_names:
             if hasattr(self, state_name):
@@ -75,24 +163,31 @@ class BeamlineStateManager:
                     )
                     self.connector.raise_alarm(severity=Alarms.WARNING, info=info)
 
+        new_states: dict[str, bl_states.BeamlineState] = {}
         for state_name, state in added_states.items():
             state_class = _state_class_for_state_type(state.state_type)
             model_cls = state_class.CONFIG_CLASS
             model_instance = model_cls(**state.parameters)
-            state_instance = state_class(
+            new_states[state_name] = state_class(
                 config=model_instance,
                 redis_connector=self.connector,
                 device_manager=self.device_manager,
             )
-            state_instance.start()
-            self._states[state.name] = state_instance
+
+        readbacks = self._get_device_readbacks(list(new_states.values()))
+        for state_name, state_instance in new_states.items():
+            if isinstance(state_instance, bl_states.DeviceBeamlineState):
+                state_instance.start(readback=readbacks.get(state_instance.config.device))
+            else:
+                state_instance.start()
+            self._states[state_name] = state_instance
 
         # Check if the config has changed for existing states and update them if needed
-        for state_msg in msg.states:
-            state = self._states.get(state_msg.name)
-            if state is None:
-                continue
-            if state.config.model_dump() != state_msg.parameters:
+        for state_name, state_msg in existing_states.items():
+            state = self._states[state_name]
+            if state.get_config_dump() != state_msg.parameters:
                 # The config has changed, we need to update the state
                 state.update_parameters(**state_msg.parameters)
                 state.restart()
+
+        self._last_state_configs = msg.states
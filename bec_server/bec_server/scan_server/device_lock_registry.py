@@ -27,7 +27,7 @@ class DeviceLockRegistry:
         self._owner_devices: dict[str, set[str]] = defaultdict(set)
 
         # Maps request IDs to the set of device names they are currently waiting for.
-        self._pending_device_locks: dict[str, set[str]] = defaultdict(set)
+        self._pending_device_locks: dict[str, set[str]] = {}
 
     def acquire_many(
         self,
@@ -57,15 +57,13 @@ class DeviceLockRegistry:
             return []
 
         next_log_time = 0.0
+        with self._condition:
+            waiting_devices = self._pending_device_locks.get(request_id, set())
         while True:
-            should_wait = False
-            should_queue_update = False
             blocked_owners: dict[str, str] = {}
-            waiting_devices = sorted(self._pending_device_locks.get(request_id, set()))
 
             with self._condition:
                 acquirable_devices: list[str] = []
-                blocked_devices: list[str] = []
 
                 for device in device_names:
                     current_owner = self._device_owners.get(device)
@@ -78,27 +76,28 @@ class DeviceLockRegistry:
                         continue
 
                     # the device is owned by another request, so we need to wait for it
-                    blocked_devices.append(device)
                     blocked_owners[device] = current_owner
 
                 for device in acquirable_devices:
                     self._device_owners[device] = request_id
                     self._owner_devices[request_id].add(device)
 
-                self._pending_device_locks[request_id] = set(blocked_devices)
-                if blocked_devices:
-                    should_wait = True
+                blocked_devices = set(blocked_owners)
+                should_wait = bool(blocked_devices)
+                if should_wait:
+                    self._pending_device_locks[request_id] = blocked_devices
                     next_log_time = self._log_waiting_for_device_lock(
                         request_id=request_id,
                         blocked_owners=blocked_owners,
                         next_log_time=next_log_time,
                     )
                     self._condition.wait(timeout=self.WAIT_INTERVAL_S)
+                else:
+                    # drop the entry instead of keeping an empty set for every finished request
+                    self._pending_device_locks.pop(request_id, None)
 
-                next_waiting_devices = sorted(self._pending_device_locks[request_id])
-                should_queue_update = bool(acquirable_devices) or (
-                    next_waiting_devices != waiting_devices
-                )
+            should_queue_update = bool(acquirable_devices) or blocked_devices != waiting_devices
+            waiting_devices = blocked_devices
 
             if should_queue_update and queue_update_callback is not None:
                 queue_update_callback()
@@ -152,7 +151,9 @@ class DeviceLockRegistry:
             for device in devices:
                 if self._device_owners.get(device) == request_id:
                     self._device_owners.pop(device, None)
-            self._condition.notify_all()
+            if devices:
+                # only wake up waiting requests if a device actually became available
+                self._condition.notify_all()
             return devices
 
     def get_owned_devices(self, request_id: str) -> list[str]:
@@ -1,3 +1,4 @@
+import math
 from time import perf_counter
 from typing import Literal
 
@@ -44,7 +45,9 @@ class PathOptimizerMixin:
             np.ndarray: Radial distances
         """
 
-        return np.sqrt(np.abs(pos[:, 0]) ** 2 + np.abs(pos[:, 1]) ** 2)
+        # np.hypot guards against overflow and is several times slower than the plain sum
+        xy = pos[:, :2]
+        return np.sqrt(np.einsum("ij,ij->i", xy, xy))
 
     def optimize_corridor(
         self,
@@ -104,6 +107,12 @@ class PathOptimizerMixin:
 
         slow_axis = int(not fast_axis)
         axis_vals = positions[:, slow_axis]
+        # neither the offset along the slow axis nor the order along the fast axis depend on the
+        # corridor size
+        axis_offset = axis_vals - axis_vals.min()
+        n_points = len(positions)
+        fast_axis_rank = np.empty(n_points, dtype=np.int64)
+        fast_axis_rank[np.argsort(positions[:, fast_axis], kind="stable")] = np.arange(n_points)
 
         best_length = np.inf
         best_path = positions
@@ -118,33 +127,17 @@ class PathOptimizerMixin:
                 continue
 
             # Integer corridor binning
-            min_val = axis_vals.min()
-            bin_idx = ((axis_vals - min_val) / cs).astype(int)
-            n_steps = bin_idx.max() + 1
-
-            index_sorted: list[np.ndarray] = []
-
-            for step in range(n_steps):
-                block = np.where(bin_idx == step)[0]
-                if block.size == 0:
-                    continue
-
-                # Sort within corridor along fast axis
-                block = block[np.argsort(positions[block, fast_axis])]
-
-                # Direction handling
-                direction = first_corridor_direction
-                if snaked and step % 2 == 1:
-                    direction = Direction(-direction)
-                if direction == Direction.DESCENDING:
-                    block = block[::-1]
+            bin_idx = (axis_offset / cs).astype(np.int64)
 
-                index_sorted.append(block)
+            # Direction handling
+            direction = np.full(n_points, int(first_corridor_direction), dtype=np.int64)
+            if snaked:
+                direction[bin_idx % 2 == 1] *= -1
 
-            if not index_sorted:
-                continue
-
-            path_idx = np.concatenate(index_sorted)
+            # Sort by corridor first and by the signed rank along the fast axis second; the
+            # ranks are unique and smaller than n_points, so a single key covers both
+            sort_key = bin_idx * (2 * n_points) + direction * fast_axis_rank
+            path_idx = np.argsort(sort_key)
             path = positions[path_idx]
             path_length = self.get_path_length(path)
 
@@ -167,10 +160,7 @@ class PathOptimizerMixin:
         Returns:
             float: Estimated corridor size
         """
-        dims = [
-            abs(min(positions[:, 0]) - max(positions[:, 0])),
-            abs(min(positions[:, 1]) - max(positions[:, 1])),
-        ]
+        dims = np.ptp(positions[:, :2], axis=0)
         density = np.sqrt(len(positions) / (dims[1] * dims[0]))
         corridor_size = 2 / density
         return corridor_size
@@ -218,9 +208,12 @@ class PathOptimizerMixin:
         start_time = perf_counter()
         original_path = pos
 
-        # Calculate radii once
+        # Calculate and sort the radii once for all parameter combinations
         radii = self.get_radius(pos)
-        max_rad = np.max(radii)
+        radius_order = np.argsort(radii, kind="stable")
+        sorted_radii = radii[radius_order]
+        max_rad = sorted_radii[-1]
+        angles = np.arctan2(pos[:, 0], pos[:, 1])
 
         # Set default dr if not provided
         if dr is None:
@@ -249,7 +242,7 @@ class PathOptimizerMixin:
         for current_dr in dr_values:
             for current_offset in offset_values:
                 optimized_path = self._optimize_shell_with_params(
-                    pos, radii, current_offset, current_dr, max_rad
+                    pos, radius_order, sorted_radii, angles, current_offset, current_dr, max_rad
                 )
 
                 # Analyze the quality of this path
@@ -308,14 +301,23 @@ class PathOptimizerMixin:
         return max(typical_spacing * 2.0, estimated_dr)
 
     def _optimize_shell_with_params(
-        self, pos: np.ndarray, radii: np.ndarray, offset: float, dr: float, max_rad: float
+        self,
+        pos: np.ndarray,
+        radius_order: np.ndarray,
+        sorted_radii: np.ndarray,
+        angles: np.ndarray,
+        offset: float,
+        dr: float,
+        max_rad: float,
     ) -> np.ndarray:
         """
         Helper function to optimize a path with specific parameters.
 
         Args:
             pos (np.ndarray): Array of positions
-            radii (np.ndarray): Pre-computed radii for all positions
+            radius_order (np.ndarray): Indices that sort the positions by radius
+            sorted_radii (np.ndarray): Pre-computed radii, sorted in ascending order
+            angles (np.ndarray): Pre-computed angles of all positions
             offset (float): Offset for the first shell
             dr (float): Width of each shell
             max_rad (float): Maximum radius
@@ -324,69 +326,37 @@ class PathOptimizerMixin:
             np.ndarray: Optimized positions
         """
         # Calculate number of shells needed
-        nsteps = int(np.floor(max_rad / dr) + int(bool(np.mod(max_rad, dr))))
+        nsteps = math.ceil(max_rad / dr)
 
-        shells = []
+        # Shell boundaries; the points of a shell are a contiguous slice of the radius-sorted
+        # positions, and the last slice holds the remaining points beyond the last shell
         shell_radius_min = -offset * dr
-        last_end_angle = 0.0  # Track the ending angle of the previous shell
-
-        # Process each shell
-        for shell_idx in range(nsteps + 2):
-            shell_radius_max = shell_radius_min + dr
-
-            # Find points in the current shell
-            shell_mask = (radii >= shell_radius_min) & (radii < shell_radius_max)
-            shell_points = pos[shell_mask]
-
-            if len(shell_points) > 0:
-                # Calculate angles for the current shell
-                angles = np.arctan2(shell_points[:, 0], shell_points[:, 1])
-
+        shell_edges = [shell_radius_min]
+        for _ in range(nsteps + 2):
+            shell_radius_min += dr
+            shell_edges.append(shell_radius_min)
+        bounds = [*np.searchsorted(sorted_radii, shell_edges), len(sorted_radii)]
+
+        shell_indices: list[np.ndarray] = []
+        last_end_angle = None  # Track the ending angle of the previous shell
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            if start == stop:
+                continue
+            # keep the original order of the points before sorting them by angle
+            indices = np.sort(radius_order[start:stop])
+            shell_angles = angles[indices]
+            if last_end_angle is not None:
                 # For smooth transitions, start sorting from where the previous shell ended
-                if shell_idx > 0 and len(shells) > 0 and len(shells[-1]) > 0:
-                    # Rotate angles to start from the last ending angle
-                    shifted_angles = (angles - last_end_angle) % (2 * np.pi)
-                    sorted_indices = np.argsort(shifted_angles)
-                    shell_sorted = shell_points[sorted_indices]
-
-                    # Update last_end_angle based on the actual last point in this shell
-                    last_point = shell_sorted[-1]
-                    last_end_angle = np.arctan2(last_point[0], last_point[1])
-                else:
-                    # For the first shell, just sort by angle
-                    sorted_indices = np.argsort(angles)
-                    shell_sorted = shell_points[sorted_indices]
-
-                    if len(shell_sorted) > 0:
-                        last_point = shell_sorted[-1]
-                        last_end_angle = np.arctan2(last_point[0], last_point[1])
-
-                shells.append(shell_sorted)
-
-            shell_radius_min = shell_radius_max
-
-        # Handle any remaining points beyond the last shell
-        remaining_mask = radii >= shell_radius_min
-        remaining_points = pos[remaining_mask]
-
-        if len(remaining_points) > 0:
-            angles = np.arctan2(remaining_points[:, 0], remaining_points[:, 1])
-
-            if len(shells) > 0 and len(shells[-1]) > 0:
-                # Continue from the last shell's ending angle
-                shifted_angles = (angles - last_end_angle) % (2 * np.pi)
-                remaining_sorted = remaining_points[np.argsort(shifted_angles)]
-            else:
-                # Just sort by angle if there's no previous shell
-                remaining_sorted = remaining_points[np.argsort(angles)]
-
-            shells.append(remaining_sorted)
+                shell_angles = (shell_angles - last_end_angle) % (2 * np.pi)
+            indices = indices[np.argsort(shell_angles)]
+            last_end_angle = angles[indices[-1]]
+            shell_indices.append(indices)
 
-        # Flatten the shells into a single array
-        if not shells:
+        if not shell_indices:
             return pos  # Return original if something went wrong
 
-        result = np.vstack([shell for shell in shells if len(shell) > 0])
+        # Flatten the shells into a single array
+        result = pos[np.concatenate(shell_indices)]
 
         # Validate that we haven't lost any points
         if len(result) != len(pos):
@@ -402,10 +372,22 @@ class PathOptimizerMixin:
         Returns:
             float: Total path length
         """
-        path_length = 0
-        for ii in range(len(pos) - 1):
-            path_length += np.sqrt(np.sum(abs(pos[ii + 1] - pos[ii]) ** 2))
-        return path_length
+        return float(self._get_step_lengths(pos).sum())
+
+    def _get_step_lengths(self, pos: np.ndarray) -> np.ndarray:
+        """
+        Calculate the length of each step of a path defined by a sequence of positions.
+
+        Args:
+            pos (np.ndarray): Array of positions
+        Returns:
+            np.ndarray: Step lengths
+        """
+        pos = np.asarray(pos)
+        if len(pos) < 2:
+            return np.zeros(0)
+        steps = np.diff(pos, axis=0).reshape(len(pos) - 1, -1)
+        return np.sqrt(np.einsum("ij,ij->i", steps, steps))
 
     def analyze_path_quality(self, pos: np.ndarray) -> PathQualityStats:
         """Analyze the quality of a path by looking at the distribution of step sizes.
@@ -419,16 +401,12 @@ class PathOptimizerMixin:
         if len(pos) < 2:
             return PathQualityStats(max_jump=0.0, avg_step=0.0, std_step=0.0, total_length=0.0)
 
-        steps = []
-        for ii in range(len(pos) - 1):
-            step = np.sqrt(np.sum(abs(pos[ii + 1] - pos[ii]) ** 2))
-            steps.append(step)
-
+        steps = self._get_step_lengths(pos)
         return PathQualityStats(
-            max_jump=np.max(steps),
-            avg_step=np.mean(steps),
-            std_step=np.std(steps),
-            total_length=np.sum(steps),
+            max_jump=steps.max(),
+            avg_step=steps.mean(),
+            std_step=steps.std(),
+            total_length=steps.sum(),
         )
 
     def optimize_nearest_neighbor(
@@ -456,47 +434,44 @@ class PathOptimizerMixin:
 
         n_points = len(positions)
 
-        # Use a copy to avoid modifying the original
-        positions_copy = positions.copy()
-
         # Start from the point closest to the origin if not specified
         if start_index is None:
             # Find the point closest to the origin
-            distances_to_origin = np.sum(positions_copy**2, axis=1)
+            distances_to_origin = np.einsum("ij,ij->i", positions, positions)
             start_index = int(np.argmin(distances_to_origin))
 
-        # Initialize the path with the starting point
-        path = [positions_copy[start_index]]
-
-        # Keep track of visited indices
-        remaining_indices = set(range(n_points))
-        remaining_indices.remove(start_index)
-
-        # Current position is the starting point
-        current_pos = positions_copy[start_index]
-
-        # Add points to the path one by one
-        while remaining_indices:
-            # Calculate distances to all remaining points
-            remaining_positions = positions_copy[list(remaining_indices)]
-
-            # Calculate distances from current position to all remaining points
-            distances = np.sqrt(np.sum((remaining_positions - current_pos) ** 2, axis=1))
-
-            # Find the closest point
-            closest_idx = np.argmin(distances)
-
-            # Get the actual index in the original array
-            original_idx = list(remaining_indices)[closest_idx]
-
-            # Update current position
-            current_pos = positions_copy[original_idx]
-
-            # Add to path and remove from remaining
-            path.append(current_pos)
-            remaining_indices.remove(original_idx)
-
-        result = np.array(path)
+        # Nearest neighbors are looked up in a k-d tree. As visited points are not removed from
+        # the tree, the number of queried neighbors is increased until an unvisited one is found
+        # and all points at the same distance are among the queried neighbors.
+        tree = cKDTree(positions)
+        visited = np.zeros(n_points, dtype=bool)
+        visited[start_index] = True
+        path_idx = [start_index]
+        current_idx = start_index
+
+        for _ in range(n_points - 1):
+            num_neighbors = 8
+            while True:
+                k = min(num_neighbors, n_points)
+                neighbor_dist, neighbor_idx = tree.query(positions[current_idx], k=k)
+                unvisited = ~visited[neighbor_idx]
+                if unvisited.any() and (
+                    k == n_points or not np.isclose(neighbor_dist[-1], neighbor_dist[unvisited][0])
+                ):
+                    break
+                num_neighbors *= 2
+
+            # Ties are common on grids. They are broken by the lowest index, so the path does not
+            # depend on the order in which the tree returns equidistant points.
+            candidates = np.sort(neighbor_idx[unvisited])
+            distances = np.sqrt(
+                np.sum((positions[candidates] - positions[current_idx]) ** 2, axis=1)
+            )
+            current_idx = int(candidates[np.argmin(distances)])
+            visited[current_idx] = True
+            path_idx.append(current_idx)
+
+        result = positions[path_idx]
         self._log_optimization_result(
             "nearest_neighbor", original_path, result, perf_counter() - start_time
         )
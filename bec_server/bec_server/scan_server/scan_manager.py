@@ -27,6 +27,7 @@ from bec_server.scan_server.scans.scan_argument_modifier import (
 from . import scans as scans_v4_module
 from .scans import legacy_scans as scans_module
 from .scans.scan_base import ScanBase as ScanBaseV4
+from .scans.scan_modifier import get_scan_hooks_impl
 
 if TYPE_CHECKING:
     from bec_server.scan_server.scan_server import ScanServer
@@ -138,6 +139,7 @@ class ScanManager:
     @classmethod
     def _reload_scan_discovery(cls) -> None:
         get_scan_modifier.cache_clear()
+        get_scan_hooks_impl.cache_clear()
         cls.get_available_scans.cache_clear()
         plugin_helper.reload_plugin_modules()
 
@@ -131,5 +131,6 @@ class ScanServer(BECService):
         self.builtin_actor_manager.shutdown()
         self.actor_manager.shutdown()
         self.proc_manager.shutdown()
+        self.beamline_states.shutdown()
         self.device_manager.shutdown()
         self.queue_manager.shutdown()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from fnmatch import fnmatchcase
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import TYPE_CHECKING, Annotated, Any, Literal, TypeAlias, TypedDict, get_args
 
 from bec_lib.scan_args import ScanArgument
@@ -91,6 +91,28 @@ def _get_hook_method_name(
     return hook_config["method_name"]
 
 
+def _resolve_hook_method_names(
+    scan: ScanBase, hook_name: str, hook_info: ScanHookConfigMap, scan_name: str | None
+) -> tuple[str | None, str | None, str | None]:
+    """
+    Resolve the ``before``, ``replace`` and ``after`` modifier method names of a scan hook.
+
+    Hooks such as ``at_each_point`` run for every scan point, so the resolved names are kept in
+    the scan's ``_scan_hook_dispatch`` table and only resolved again if the hook metadata or the
+    scan name changes.
+    """
+    cached = scan._scan_hook_dispatch.get(hook_name)
+    if cached is not None and cached[0] is hook_info and cached[1] == scan_name:
+        return cached[2]
+    method_names = (
+        _get_hook_method_name(hook_name, hook_info, "before", scan_name),
+        _get_hook_method_name(hook_name, hook_info, "replace", scan_name),
+        _get_hook_method_name(hook_name, hook_info, "after", scan_name),
+    )
+    scan._scan_hook_dispatch[hook_name] = (hook_info, scan_name, method_names)
+    return method_names
+
+
 def scan_hook(func):
     """
     Decorator for scan hooks. It registers the decorated method as a scan hook and thus allows
@@ -111,20 +133,20 @@ def scan_hook(func):
 
         hook_info = self._scan_modifier_hooks[func.__name__]
         scan_name = getattr(self, "scan_name", None)
+        before_method_name, replace_method_name, after_method_name = _resolve_hook_method_names(
+            self, func.__name__, hook_info, scan_name
+        )
 
-        before_method_name = _get_hook_method_name(func.__name__, hook_info, "before", scan_name)
         if before_method_name is not None:
             before_method = getattr(self._scan_modifier, before_method_name)
             before_method(*args, **kwargs)
 
-        replace_method_name = _get_hook_method_name(func.__name__, hook_info, "replace", scan_name)
         if replace_method_name is not None:
             replace_method = getattr(self._scan_modifier, replace_method_name)
             replace_method(*args, **kwargs)
         else:
             func(self, *args, **kwargs)
 
-        after_method_name = _get_hook_method_name(func.__name__, hook_info, "after", scan_name)
         if after_method_name is not None:
             after_method = getattr(self._scan_modifier, after_method_name)
             after_method(*args, **kwargs)
@@ -186,11 +208,15 @@ def scan_hook_impl(
     return decorator
 
 
+@lru_cache(maxsize=None)
 def get_scan_hooks_impl(cls) -> dict[str, ScanHookConfigMap]:
     """
     Get the scan hooks implemented by the given class. It returns
     a dictionary mapping the original scan hook names to the corresponding method names and hook types in the scan modifier.
 
+    The result is cached per class, as it is looked up for every scan. It is shared between
+    callers and must not be modified.
+
     """
     hooks: dict[str, ScanHookConfigMap] = {}
     for attr_name in dir(cls):
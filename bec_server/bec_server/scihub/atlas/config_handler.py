@@ -17,6 +17,8 @@ from bec_lib.endpoints import MessageEndpoints
 from bec_lib.logger import bec_logger
 
 if TYPE_CHECKING:  # pragma: no cover
+    from redis.client import Pipeline
+
     from bec_lib.device import DeviceBaseWithConfig
     from bec_lib.redis_connector import RedisConnector
     from bec_server.scihub.atlas.atlas_connector import AtlasConnector
@@ -115,18 +117,18 @@ class ConfigHandler:
                     accepted=False, error_msg=error_msg, metadata=msg.metadata
                 )
 
-    def send_config(self, msg: messages.DeviceConfigMessage) -> None:
+    def send_config(self, msg: messages.DeviceConfigMessage, pipe: Pipeline | None = None) -> None:
         """broadcast a new config"""
-        self.connector.send(MessageEndpoints.device_config_update(), msg)
+        self.connector.send(MessageEndpoints.device_config_update(), msg, pipe=pipe)
 
-    def send_config_request_reply(self, accepted, error_msg, metadata):
+    def send_config_request_reply(self, accepted, error_msg, metadata, pipe=None):
         """send a config request reply"""
         msg = messages.RequestResponseMessage(
             accepted=accepted, message=error_msg, metadata=metadata
         )
         request_id = metadata.get("RID")
         self.connector.set(
-            MessageEndpoints.device_config_request_response(request_id), msg, expire=60
+            MessageEndpoints.device_config_request_response(request_id), msg, pipe=pipe, expire=60
         )
 
     def _remove_active_request(self) -> None:
@@ -309,14 +311,18 @@ class ConfigHandler:
         Args:
             msg (messages.DeviceConfigMessage): Config reset message
         """
+        pipe = self.connector.pipeline()
         # set the config in redis to empty
-        self.set_config_in_redis([])
+        self.set_config_in_redis([], pipe=pipe)
 
-        self.send_config_request_reply(accepted=True, error_msg=None, metadata=msg.metadata)
+        self.send_config_request_reply(
+            accepted=True, error_msg=None, metadata=msg.metadata, pipe=pipe
+        )
 
         # tell all services to reload the config
         reload_msg = messages.DeviceConfigMessage(action="reload", config={}, metadata=msg.metadata)
-        self.send_config(reload_msg)
+        self.send_config(reload_msg, pipe=pipe)
+        pipe.execute()
 
     def _cancel_config_request(self, msg: messages.DeviceConfigMessage):
         """
@@ -505,15 +511,16 @@ class ConfigHandler:
         config = self.device_manager.connector.get(MessageEndpoints.device_config())
         return config.content["resource"]
 
-    def set_config_in_redis(self, config):
+    def set_config_in_redis(self, config, pipe=None):
         """
         Set the config in redis
 
         Args:
             config (list): List of device configs
+            pipe (Pipeline, optional): Redis pipeline to add the command to. Defaults to None.
         """
         msg = messages.AvailableResourceMessage(resource=config)
-        self.device_manager.connector.set(MessageEndpoints.device_config(), msg)
+        self.device_manager.connector.set(MessageEndpoints.device_config(), msg, pipe=pipe)
 
     def shutdown(self) -> None:
         """Shutdown the config handler, canceling any active request."""
@@ -148,6 +148,20 @@ def test_LmfitService1D_process_and_publish_current_scan(lmfit_service):
             lmfit_service.client.connector.xadd.assert_called_once()
 
 
+def test_LmfitService1D_process_and_publish_current_scan_continuous():
+    service = LmfitService1D(model="GaussianModel", continuous=True, client=mock.MagicMock())
+    with mock.patch.object(service, "get_data_from_current_scan") as get_data:
+        get_data.side_effect = [{"x": [1, 2, 3], "y": [4, 5, 6]}, {"x": [1, 2], "y": [4, 5]}]
+        with mock.patch.object(service, "process") as process:
+            process.return_value = ({"result": "result"}, {"metadata": "metadata"})
+            service._process_and_publish_current_scan()  # noqa: SLF001
+            service._process_and_publish_current_scan()  # noqa: SLF001
+            service.shutdown()
+            assert process.call_count == 2
+            assert service.data == {"x": [1, 2], "y": [4, 5]}
+            assert service.client.connector.xadd.call_count == 2
+
+
 def test_LmfitService1D_configure(lmfit_service):
     with pytest.raises(DAPError):
         lmfit_service.configure()
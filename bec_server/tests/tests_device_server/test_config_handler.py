@@ -8,7 +8,11 @@ import pytest
 import bec_lib
 from bec_lib import messages
 from bec_server.device_server.devices.config_update_handler import ConfigUpdateHandler
-from bec_server.device_server.devices.devicemanager import DeviceConfigError, DeviceManagerDS
+from bec_server.device_server.devices.devicemanager import (
+    CancelledError,
+    DeviceConfigError,
+    DeviceManagerDS,
+)
 
 dir_path = os.path.dirname(bec_lib.__file__)
 
@@ -76,16 +80,80 @@ def test_config_handler_update_config_raises(dm_with_devices):
     assert device_manager.devices.samx._config["deviceConfig"] == old_config
 
 
+@pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
+def test_config_handler_update_config_pipelines_limits(dm_with_devices):
+    device_manager = dm_with_devices
+    # the update thread publishes limit changes through set_and_publish as well
+    device_manager._shutdown_event.set()
+    device_manager._auto_monitor_update_thread.join()
+    handler = ConfigUpdateHandler(device_manager)
+    msg = messages.DeviceConfigMessage(
+        action="update",
+        config={
+            "samx": {"deviceConfig": {"limits": [-10, 10]}},
+            "samy": {"deviceConfig": {"limits": [-20, 20]}},
+        },
+    )
+    pipe = mock.MagicMock()
+    with (
+        mock.patch.object(device_manager.connector, "pipeline", return_value=pipe),
+        mock.patch.object(device_manager.connector, "set_and_publish") as set_and_publish,
+    ):
+        handler._update_config(msg, cancel_event=threading.Event())
+    assert set_and_publish.call_count == 2
+    assert all(call.kwargs["pipe"] is pipe for call in set_and_publish.call_args_list)
+    pipe.execute.assert_called_once()
+
+
+@pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
+def test_config_handler_update_config_keeps_error_if_publishing_limits_fails(dm_with_devices):
+    device_manager = dm_with_devices
+    handler = ConfigUpdateHandler(device_manager)
+    msg = messages.DeviceConfigMessage(
+        action="update", config={"samx": {"deviceConfig": {"limits": [-10, 10]}}}
+    )
+    pipe = mock.MagicMock()
+    pipe.execute.side_effect = ConnectionError("redis is gone")
+    with (
+        mock.patch.object(device_manager.connector, "pipeline", return_value=pipe),
+        mock.patch.object(device_manager, "update_config", side_effect=[ValueError("boom"), None]),
+        mock.patch.object(handler, "_update_config_snapshot") as update_config_snapshot,
+    ):
+        with pytest.raises(DeviceConfigError):
+            handler._update_config(msg, cancel_event=threading.Event())
+    pipe.execute.assert_called_once()
+    update_config_snapshot.assert_called_once_with(msg.config)
+
+
+@pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
+def test_config_handler_update_config_does_not_publish_limits_when_cancelled(dm_with_devices):
+    device_manager = dm_with_devices
+    handler = ConfigUpdateHandler(device_manager)
+    msg = messages.DeviceConfigMessage(
+        action="update", config={"samx": {"deviceConfig": {"limits": [-10, 10]}}}
+    )
+    cancel_event = threading.Event()
+    cancel_event.set()
+    pipe = mock.MagicMock()
+    with mock.patch.object(device_manager.connector, "pipeline", return_value=pipe):
+        with pytest.raises(CancelledError):
+            handler._update_config(msg, cancel_event=cancel_event)
+    pipe.execute.assert_not_called()
+
+
 @pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
 def test_reload_action(dm_with_devices):
     device_manager = dm_with_devices
     handler = ConfigUpdateHandler(device_manager)
     dm = handler.device_manager
+    dm._get_device_class("ophyd_devices.SimPositioner")
+    assert dm._get_device_class.cache_info().currsize > 0
     with mock.patch.object(dm.devices.samx.obj, "destroy") as obj_destroy:
         with mock.patch.object(dm, "_get_config") as get_config:
             handler._reload_config(cancel_event=threading.Event())
             obj_destroy.assert_called_once()
             get_config.assert_called_once()
+    assert dm._get_device_class.cache_info().currsize == 0
 
 
 @pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
@@ -373,3 +441,104 @@ def test_cancel_config_request_timeout_sends_alarm_and_flushes(dm_with_devices):
                     req_reply.assert_called_once_with(
                         accepted=True, error_msg="", metadata={"RID": "12345"}
                     )
+
+
+@pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
+def test_force_update_config_in_redis(dm_with_devices):
+    device_manager = dm_with_devices
+    handler = ConfigUpdateHandler(device_manager)
+    with mock.patch.object(device_manager.connector, "set") as set_mock:
+        handler.force_update_config_in_redis()
+    msg = set_mock.call_args.args[1]
+    names = [dev_config["name"] for dev_config in msg.resource]
+    assert names == list(device_manager.devices.keys())
+    samx_config = next(dev_config for dev_config in msg.resource if dev_config["name"] == "samx")
+    assert samx_config["deviceClass"] == device_manager.devices.samx._config["deviceClass"]
+
+
+@pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
+def test_force_update_config_in_redis_reuses_snapshot(dm_with_devices):
+    device_manager = dm_with_devices
+    handler = ConfigUpdateHandler(device_manager)
+    handler.force_update_config_in_redis()
+    samy_entry = handler._config_snapshot["samy"]
+
+    msg = messages.DeviceConfigMessage(action="update", config={"bpm4i": {"enabled": False}})
+    handler._update_config(msg, cancel_event=threading.Event())
+    with mock.patch.object(device_manager.connector, "set") as set_mock:
+        handler.force_update_config_in_redis()
+    resource = set_mock.call_args.args[1].resource
+    bpm4i_config = next(dev_config for dev_config in resource if dev_config["name"] == "bpm4i")
+    assert bpm4i_config["enabled"] is False
+    # unchanged devices are not copied again
+    assert handler._config_snapshot["samy"] is samy_entry
+
+    msg = messages.DeviceConfigMessage(action="remove", config={"bpm4i": {}})
+    handler._remove_config(msg, cancel_event=threading.Event())
+    assert "bpm4i" not in handler._config_snapshot
+
+    handler._flush_config()
+    assert handler._config_snapshot == {}
+
+
+@pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
+def test_flush_config_destroys_all_devices_before_raising(dm_with_devices):
+    device_manager = dm_with_devices
+    handler = ConfigUpdateHandler(device_manager)
+    with (
+        mock.patch.object(
+            device_manager.devices.samx.obj, "destroy", side_effect=RuntimeError("boom")
+        ),
+        mock.patch.object(device_manager.devices.samy.obj, "destroy") as samy_destroy,
+        mock.patch.object(type(device_manager.devices), "flush") as flush,
+    ):
+        with pytest.raises(RuntimeError, match="Failed to flush config"):
+            handler._flush_config()
+        samy_destroy.assert_called_once()
+        flush.assert_not_called()
+
+
+@pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
+def test_config_handler_update_config_reapplies_drifted_config(dm_with_devices):
+    device_manager = dm_with_devices
+    # the update thread publishes limit changes through set_and_publish as well
+    device_manager._shutdown_event.set()
+    device_manager._auto_monitor_update_thread.join()
+    handler = ConfigUpdateHandler(device_manager)
+    samx = device_manager.devices.samx
+    msg = messages.DeviceConfigMessage(
+        action="update", config={"samx": {"deviceConfig": {"limits": [-10, 10]}}}
+    )
+    handler._update_config(msg, cancel_event=threading.Event())
+
+    # the limits change on the device without a config update
+    samx.obj.low_limit_travel.set(-3).wait()
+    samx.obj.high_limit_travel.set(3).wait()
+
+    with mock.patch.object(device_manager.connector, "set_and_publish") as set_and_publish:
+        handler._update_config(msg, cancel_event=threading.Event())
+    assert samx.obj.low_limit_travel.get() == -10
+    assert samx.obj.high_limit_travel.get() == 10
+    set_and_publish.assert_called_once()
+    assert set_and_publish.call_args.args[1].signals == {
+        "low": {"value": -10},
+        "high": {"value": 10},
+    }
+
+
+@pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
+def test_config_handler_update_config_restores_submitted_entries(dm_with_devices):
+    device_manager = dm_with_devices
+    handler = ConfigUpdateHandler(device_manager)
+    samx = device_manager.devices.samx
+    current_limits = samx._config["deviceConfig"]["limits"]
+    msg = messages.DeviceConfigMessage(
+        action="update", config={"samx": {"deviceConfig": {"limits": [-1, 1], "doesntexist": 1}}}
+    )
+    with mock.patch.object(
+        device_manager, "update_config", side_effect=[ValueError("boom"), None]
+    ) as update_config:
+        with pytest.raises(DeviceConfigError):
+            handler._update_config(msg, cancel_event=threading.Event())
+    assert update_config.call_args_list[1] == mock.call(samx.obj, {"limits": current_limits})
+    assert samx._config["deviceConfig"]["limits"] == current_limits
@@ -1,4 +1,5 @@
 import copy
+import functools
 import time
 from types import SimpleNamespace
 from unittest import mock
@@ -12,7 +13,8 @@ from ophyd_devices.tests.utils import patched_device
 from bec_lib import messages
 from bec_lib.bec_errors import DeviceConfigError
 from bec_lib.endpoints import MessageEndpoints
-from bec_server.device_server.devices.devicemanager import DeviceManagerDS
+from bec_server.device_server.devices import devicemanager as devicemanager_module
+from bec_server.device_server.devices.devicemanager import DeviceManagerDS, DSDevice
 
 # pylint: disable=missing-function-docstring
 # pylint: disable=protected-access
@@ -161,6 +163,29 @@ def test_flyer_event_callback(dm_with_devices, connected_connector):
     assert msg.content["status"] == 20
 
 
+@pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
+def test_flyer_event_callback_publishes_each_point(dm_with_devices):
+    device_manager = dm_with_devices
+    samx = device_manager.devices.samx
+    samx.metadata = {"scan_id": "12345"}
+    samx.emitted_points = {"12345": 2}
+    data = {"idata": np.arange(5), "edata": np.arange(6) * 2}
+    # the update thread creates its own pipelines
+    device_manager._shutdown_event.set()
+    device_manager._auto_monitor_update_thread.join()
+    with mock.patch.object(device_manager, "connector") as mock_connector:
+        device_manager._obj_flyer_callback(obj=samx.obj, value={"data": data})
+
+    mock_connector.pipeline.assert_called_once_with(transaction=False)
+    calls = mock_connector.set_and_publish.call_args_list
+    assert {call.args[0] for call in calls} == {MessageEndpoints.device_read("samx")}
+    sent = [call.args[1] for call in calls]
+    assert [msg.metadata["point_id"] for msg in sent] == [2, 3, 4]
+    assert [msg.signals["edata"]["value"] for msg in sent] == [4, 6, 8]
+    assert len({msg.signals["idata"]["timestamp"] for msg in sent}) == 1
+    assert samx.emitted_points["12345"] == 5
+
+
 @pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
 def test_obj_callback_progress(dm_with_devices):
     device_manager = dm_with_devices
@@ -226,6 +251,9 @@ def test_obj_device_monitor_2d_callback(dm_with_devices, value):
 
 @pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
 def test_device_manager_ds_reset_config(dm_with_devices):
+    # the update thread creates its own pipelines
+    dm_with_devices._shutdown_event.set()
+    dm_with_devices._auto_monitor_update_thread.join()
     with mock.patch.object(dm_with_devices, "connector") as mock_connector:
         device_manager = dm_with_devices
         config = device_manager._session["devices"]
@@ -234,9 +262,22 @@ def test_device_manager_ds_reset_config(dm_with_devices):
         config_msg = messages.AvailableResourceMessage(
             resource=config, metadata=mock_connector.lpush.call_args[0][1].metadata
         )
+        pipe = mock_connector.pipeline.return_value
+        mock_connector.pipeline.assert_called_once_with(transaction=False)
         mock_connector.lpush.assert_called_once_with(
-            MessageEndpoints.device_config_history(), config_msg, max_size=50
+            MessageEndpoints.device_config_history(), config_msg, pipe=pipe, max_size=50
         )
+        mock_connector.set.assert_called_once_with(
+            MessageEndpoints.device_config(),
+            messages.AvailableResourceMessage(resource=[]),
+            pipe=pipe,
+        )
+        mock_connector.send.assert_called_once_with(
+            MessageEndpoints.device_config_update(),
+            messages.DeviceConfigMessage(action="reload", config={}),
+            pipe=pipe,
+        )
+        pipe.execute.assert_called_once()
 
 
 @pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
@@ -311,9 +352,30 @@ def test_subscribe_to_device_events(dm_with_devices):
         with mock.patch.object(dm_with_devices, callback_name) as mock_callback:
             dm_with_devices._subscribe_to_device_events(obj=obj, opaas_obj=opaas_obj)
             dm_with_devices._subscribe_to_bec_device_events(obj=obj)
-            assert obj.subscribe.call_args == mock.call(
-                mock_callback, event_type=event_type, run=False
-            )
+            callback = obj.subscribe.call_args.args[0]
+            if isinstance(callback, functools.partial):
+                # the readback callbacks are bound to their device
+                assert callback.keywords == {"ds_obj": opaas_obj}
+                callback = callback.func
+            assert callback is mock_callback
+            assert obj.subscribe.call_args.kwargs == {"event_type": event_type, "run": False}
+
+
+@pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
+def test_get_event_types_cached_per_device_type(dm_with_devices):
+    class EventDevice:
+        event_types_calls = 0
+
+        @property
+        def event_types(self):
+            type(self).event_types_calls += 1
+            return ("readback", "progress")
+
+    first = dm_with_devices._get_event_types(EventDevice())
+    second = dm_with_devices._get_event_types(EventDevice())
+
+    assert first == second == frozenset({"readback", "progress"})
+    assert EventDevice.event_types_calls == 1
 
 
 @pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
@@ -709,8 +771,9 @@ def test_auto_monitor_update_loop_batches_updates_and_skips_missing_devices(dm_w
     ):
         device_manager._auto_monitor_update_loop()
 
-        mock_readback.assert_called_once_with(obj=samx_obj, pipe=pipe)
-        mock_configuration.assert_called_once_with(obj=samx_obj, pipe=pipe)
+        samx = device_manager.devices["samx"]
+        mock_readback.assert_called_once_with(obj=samx_obj, pipe=pipe, ds_obj=samx)
+        mock_configuration.assert_called_once_with(obj=samx_obj, pipe=pipe, ds_obj=samx)
         mock_limit_change.assert_called_once_with(obj=samx_obj, pipe=pipe)
         pipe.execute.assert_called_once()
         assert not device_manager._auto_monitor_readback_updates
@@ -718,6 +781,28 @@ def test_auto_monitor_update_loop_batches_updates_and_skips_missing_devices(dm_w
         assert not device_manager._limit_change_updates
 
 
+@pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
+def test_obj_callbacks_use_bound_device(dm_with_devices):
+    device_manager = dm_with_devices
+    samx = device_manager.devices.samx
+    samx.metadata = {"scan_id": "12345"}
+    with (
+        mock.patch.object(device_manager, "connector") as mock_connector,
+        mock.patch.object(type(device_manager.devices), "get") as devices_get,
+    ):
+        device_manager._obj_callback_readback(obj=samx.obj, ds_obj=samx)
+        device_manager._obj_callback_is_moving(obj=samx.obj, value=1, ds_obj=samx)
+    devices_get.assert_not_called()
+
+    readback = mock_connector.set_and_publish.call_args
+    assert readback.args[0] is samx.readback_endpoint
+    assert readback.args[1].metadata == {"scan_id": "12345"}
+    mock_connector.set.assert_called_once_with(
+        samx.status_endpoint,
+        messages.DeviceStatusMessage(device="samx", status=1, metadata={"scan_id": "12345"}),
+    )
+
+
 @pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
 def test_device_dependency_resolution(dm_with_devices):
     devices = [
@@ -743,6 +828,68 @@ def test_device_dependency_resolution(dm_with_devices):
     assert sorted_names == ["dev1", "dev2", "dev3"]
 
 
+def test_get_init_levels():
+    devices = [
+        {"name": "dev1"},
+        {"name": "dev4", "needs": None},
+        {"name": "dev2", "needs": ["dev1"]},
+        {"name": "dev5", "needs": ["proxy"]},
+        {"name": "dev3", "needs": ["dev2", "dev4"]},
+    ]
+    levels = DeviceManagerDS._get_init_levels(devices)
+    assert [[dev["name"] for dev in level] for level in levels] == [
+        ["dev1", "dev4", "dev5"],
+        ["dev2"],
+        ["dev3"],
+    ]
+
+
+@pytest.mark.parametrize("init_workers", [1, 16])
+@pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
+def test_load_session_reports_failed_device(device_manager, session_from_test_config, init_workers):
+    device_manager.INIT_WORKERS = init_workers
+    device_manager._session = copy.deepcopy(session_from_test_config)
+    device_manager.config_update_handler = mock.MagicMock()
+
+    def init_device(dev, delayed, progress):
+        if dev["name"] == "samy":
+            raise ValueError("boom")
+
+    with (
+        mock.patch.object(device_manager, "_init_device", side_effect=init_device) as init_mock,
+        mock.patch.object(device_manager, "_reset_config") as reset_config,
+    ):
+        with pytest.raises(DeviceConfigError, match="Failed to initialize device: samy"):
+            device_manager._load_session()
+    reset_config.assert_called_once()
+    assert all(call.kwargs["delayed"] is False for call in init_mock.call_args_list)
+
+
+@pytest.mark.parametrize("init_workers", [1, 16])
+@pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
+def test_load_session_keeps_device_order(device_manager, session_from_test_config, init_workers):
+    device_manager.INIT_WORKERS = init_workers
+    device_manager._session = copy.deepcopy(session_from_test_config)
+    device_manager.config_update_handler = mock.MagicMock()
+    devices = device_manager.resolve_device_dependencies(device_manager._session["devices"])
+    names = [dev["name"] for dev in devices]
+    delays = {name: 0.001 * (len(names) - index) for index, name in enumerate(names)}
+
+    def init_device(dev, delayed, progress):
+        # later devices finish their initialization first
+        time.sleep(delays[dev["name"]])
+        device_manager.devices._add_device(dev["name"], mock.MagicMock())
+
+    with mock.patch.object(device_manager, "_init_device", side_effect=init_device) as init_mock:
+        device_manager._load_session()
+
+    immediate = [c.args[0]["name"] for c in init_mock.call_args_list if not c.kwargs["delayed"]]
+    delayed = [c.args[0]["name"] for c in init_mock.call_args_list if c.kwargs["delayed"]]
+    assert list(device_manager.devices) == [name for name in names if name not in delayed] + delayed
+    if init_workers == 1:
+        assert immediate == [name for name in names if name not in delayed]
+
+
 @pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
 def test_device_dependency_resolution_with_unknown_dependency(dm_with_devices):
     devices = [
@@ -811,3 +958,69 @@ def test_get_device_order_without_order_map(dm_with_devices):
     devices = ["samx", "eiger"]
     with pytest.raises(RuntimeError, match="Device order map is not initialized"):
         device_manager.get_device_order(devices)
+
+
+@pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
+def test_update_config_checks_class_attributes_once(dm_with_devices):
+    class ConfigDevice:
+        def __init__(self):
+            self.name = "config_device"
+            self.offset = 0
+
+        def set_speed(self, value):
+            self.speed = value
+
+    obj = ConfigDevice()
+    devicemanager_module._get_class_attributes.cache_clear()
+    with mock.patch.object(dm_with_devices.connector, "publish_metrics"):
+        dm_with_devices.update_config(obj, {"set_speed": 2, "offset": 3})
+        dm_with_devices.update_config(obj, {"set_speed": 4})
+        with pytest.raises(DeviceConfigError, match="Unknown config parameter unknown"):
+            dm_with_devices.update_config(obj, {"unknown": 1})
+
+    assert obj.speed == 4
+    assert obj.offset == 3
+    assert devicemanager_module._get_class_attributes.cache_info().misses == 1
+
+
+@pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
+def test_device_features_set_per_instance_are_found(dm_with_devices):
+    class InstanceDevice(ophyd.Device):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.low_limit_travel = ophyd.Signal(name="low", value=-5)
+            self.high_limit_travel = ophyd.Signal(name="high", value=5)
+            self._update_device_config = mock.MagicMock()
+
+    obj = InstanceDevice(name="instance_device")
+    dm_with_devices.update_config(obj, {"limits": [-1, 1]})
+    obj._update_device_config.assert_called_once_with({"limits": [-1, 1]})
+
+    connector = mock.MagicMock()
+    config = {"enabled": True, "deviceClass": "InstanceDevice", "readoutPriority": "baseline"}
+    DSDevice(name="instance_device", obj=obj, config=config).initialize_device_buffer(connector)
+    connector.set_and_publish.assert_any_call(
+        MessageEndpoints.device_limits("instance_device"),
+        messages.DeviceMessage(signals={"low": {"value": -5}, "high": {"value": 5}}),
+        pipe=connector.pipeline(),
+    )
+
+
+def test_construct_device_obj_inspects_each_class_once():
+    devicemanager_module._get_init_params.cache_clear()
+    config = {
+        "name": "sim_signal",
+        "deviceClass": "ophyd_devices.SimPositioner",
+        "deviceConfig": {"delay": 1, "tolerance": 0.01, "update_frequency": 400},
+    }
+    with mock.patch(
+        "bec_server.device_server.devices.devicemanager.inspect.signature",
+        wraps=devicemanager_module.inspect.signature,
+    ) as signature:
+        obj, _ = DeviceManagerDS.construct_device_obj(config, device_manager=None)
+        DeviceManagerDS.construct_device_obj(
+            {**config, "name": "sim_signal_2"}, device_manager=None
+        )
+    assert obj.name == "sim_signal"
+    inspected = [call.args[0] for call in signature.call_args_list]
+    assert len(inspected) == len(set(inspected))
@@ -2,10 +2,11 @@ from unittest import mock
 
 import pytest
 from ophyd import Component as Cpt
-from ophyd import Device, EpicsSignal, Signal
-from ophyd_devices import PSIDeviceBase
+from ophyd import Device, EpicsSignal, PVPositioner, Signal
+from ophyd_devices import ComputedSignal, PSIDeviceBase
 
 from bec_lib.bec_errors import DeviceConfigError
+from bec_server.device_server.devices import device_serializer
 from bec_server.device_server.devices.device_serializer import get_device_info
 
 
@@ -199,3 +200,136 @@ def test_get_device_info_raises_device_config_error_for_invalid_explicit_ownersh
         match="Invalid ownership_mode 'not-a-mode' configured on DummyInvalidOwnershipDevice",
     ):
         get_device_info(device, connect=False)
+
+
+class NestedInnerDevice(Device):
+    value = Cpt(Signal, value=0)
+
+
+class NestedMiddleDevice(Device):
+    inner = Cpt(NestedInnerDevice)
+
+
+class NestedOuterDevice(Device):
+    middle = Cpt(NestedMiddleDevice)
+
+
+def test_get_device_info_computes_nested_sub_devices_once():
+    device = NestedOuterDevice(name="outer")
+    with mock.patch(
+        "bec_server.device_server.devices.device_serializer.get_custom_user_access_info",
+        wraps=device_serializer.get_custom_user_access_info,
+    ) as user_access_info:
+        info = get_device_info(device, connect=True)
+    introspected = [call.args[0] for call in user_access_info.call_args_list]
+    assert introspected.count(device.middle.inner) == 1
+    sub_device_names = [sub["device_attr_name"] for sub in info["sub_devices"]]
+    assert sub_device_names == ["middle", "inner"]
+    assert info["sub_devices"][0]["sub_devices"][0] is info["sub_devices"][1]
+
+
+def test_get_component_docs_walks_each_device_class_once():
+    device_serializer._component_docs_cache.pop(NestedMiddleDevice, None)
+    with mock.patch.object(
+        NestedMiddleDevice, "walk_components", wraps=NestedMiddleDevice.walk_components
+    ) as walk_components:
+        first = device_serializer._get_component_docs(NestedMiddleDevice(name="first"))
+        second = device_serializer._get_component_docs(NestedMiddleDevice(name="second"))
+    walk_components.assert_called_once()
+    assert first is second
+    assert [name for name, _doc in first] == ["inner", "inner.value"]
+
+
+def test_get_device_info_describes_each_signal_once():
+    device = NestedOuterDevice(name="outer")
+    with mock.patch.object(
+        device.middle.inner.value, "describe", wraps=device.middle.inner.value.describe
+    ) as describe:
+        info = get_device_info(device, connect=True)
+    assert (
+        info["signals"]["middle.inner.value"]["describe"]["source"]
+        == "SIM:outer_middle_inner_value"
+    )
+    # the signal is a component of all three devices but the serializer describes it only once;
+    # the other three calls stem from describe() of the outer, middle and inner device
+    assert describe.call_count == 4
+
+
+@pytest.mark.parametrize(
+    "var, expected",
+    [
+        (1.5, True),
+        ("text", True),
+        (None, True),
+        (True, True),
+        (b"raw", True),
+        (2**63 - 1, True),
+        (2**64 - 1, True),
+        (2**64, False),
+        (-(2**63) - 1, False),
+        ([1, {"a": 2}], True),
+        ([1, object()], False),
+        (object(), False),
+    ],
+)
+def test_is_serializable(var, expected):
+    assert device_serializer.is_serializable(var) is expected
+
+
+class DummyPVPositioner(PVPositioner):
+    setpoint = Cpt(Signal, value=0)
+    readback = Cpt(Signal, value=0)
+    done = Cpt(Signal, value=1)
+
+
+def test_get_device_base_class():
+    assert device_serializer.get_device_base_class(DummyPVPositioner(name="pos")) == "positioner"
+    assert device_serializer.get_device_base_class(Signal(name="sig")) == "signal"
+    assert device_serializer.get_device_base_class(MyDevice(name="dev")) == "device"
+    assert device_serializer.get_device_base_class(object()) == "unknown"
+    assert device_serializer.get_device_base_class(mock.MagicMock(spec=Signal)) == "signal"
+    assert (
+        device_serializer.get_device_base_class(mock.MagicMock(spec=ComputedSignal))
+        == "computed_signal"
+    )
+    # results are cached per class
+    assert device_serializer.get_device_base_class(Signal(name="sig2")) == "signal"
+
+
+def test_get_custom_user_access_info_skips_missing_names():
+    class DummyUserAccess:
+        USER_ACCESS = ["method_b", "missing", "value", "method_a", "method_b", "dynamic"]
+        value = 5
+
+        def method_a(self):
+            """doc a"""
+
+        def method_b(self):
+            """doc b"""
+
+        def __getattr__(self, name):
+            # names that are not listed by dir() are not part of the interface
+            if name == "dynamic":
+                return 1
+            raise AttributeError(name)
+
+    info = device_serializer.get_custom_user_access_info(DummyUserAccess(), {})
+    assert list(info) == ["method_a", "method_b", "value"]
+    assert info["value"] == {"type": "int"}
+    assert info["method_a"]["doc"] == "doc a"
+
+
+def test_get_device_info_walks_sub_devices_once():
+    device = NestedOuterDevice(name="outer")
+    with mock.patch.object(
+        NestedMiddleDevice,
+        "walk_subdevices",
+        autospec=True,
+        side_effect=NestedMiddleDevice.walk_subdevices,
+    ) as middle_walk:
+        info = get_device_info(device, connect=True)
+    # only the walk of the outer device descends into the middle device
+    middle_walk.assert_called_once()
+    middle_info = info["sub_devices"][0]
+    assert [sub["device_attr_name"] for sub in middle_info["sub_devices"]] == ["inner"]
+    assert middle_info["sub_devices"][0]["sub_devices"] == []
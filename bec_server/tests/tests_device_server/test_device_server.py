@@ -1,4 +1,6 @@
+import inspect
 import threading
+import time
 from io import StringIO
 from types import SimpleNamespace
 from unittest import mock
@@ -13,12 +15,18 @@ from ophyd_devices import StatusBase
 
 from bec_lib import messages
 from bec_lib.alarm_handler import Alarms
+from bec_lib.bec_errors import ExceptionWithErrorInfo
 from bec_lib.endpoints import MessageEndpoints
 from bec_lib.messages import BECStatus
 from bec_lib.redis_connector import MessageObject
+from bec_lib.serialization import MsgpackSerialization
 from bec_lib.service_config import ServiceConfig
 from bec_lib.tests.utils import ConnectorMock
-from bec_server.device_server.device_server import DeviceServer, InvalidDeviceError
+from bec_server.device_server.device_server import (
+    DeviceServer,
+    InvalidDeviceError,
+    _StagedStatusContext,
+)
 from bec_server.device_server.devices.devicemanager import DeviceManagerDS
 
 # pylint: disable=missing-function-docstring
@@ -136,19 +144,19 @@ def test_device_server_status_callback(
     dev._kind = Kind.normal
     instr = device_instruction_message_mock
 
-    # Status object with obj=None, should use device from obj_ref
+    # Status object with obj=None, should use the device from the status info
     status_obj_None = StatusBase(obj=None)
     device_server._add_status_object_info(status_obj_None, instruction=instr, device=dev)
     with mock.patch.object(device_server, "_read_device") as mock_read_device:
         device_server.status_callback(status_obj_None)
-        mock_read_device.assert_called_once_with(instr)
+        mock_read_device.assert_called_once_with(instr, new_status=False, pipe=ANY)
 
     # Status object with obj set
     status = StatusBase(obj=dev)
     device_server._add_status_object_info(status, instruction=instr, device=dev)
     with mock.patch.object(device_server, "_read_device") as mock_read_device:
         device_server.status_callback(status)
-        mock_read_device.assert_called_once_with(instr)
+        mock_read_device.assert_called_once_with(instr, new_status=False, pipe=ANY)
 
     # Status object, but missing object_info. This should log an error and likely raises
     status_no_info = StatusBase()
@@ -197,7 +205,7 @@ def test_device_server_status_callback_response_includes_error_info(
         with mock.patch.object(device_server.connector, "xadd") as xadd_mock:
             device_server.status_callback(status)
 
-    mock_read_device.assert_called_once_with(instr)
+    mock_read_device.assert_called_once_with(instr, new_status=False, pipe=ANY)
     xadd_mock.assert_called_once()
     dev_msg = xadd_mock.call_args.args[1]["data"]
     assert isinstance(dev_msg, messages.DeviceReqStatusMessage)
@@ -413,9 +421,9 @@ def test_handle_device_instructions_set(device_server_mock, instructions):
                 with mock.patch.object(device_server, "_set_device") as set_mock:
                     device_server.handle_device_instructions(instructions)
 
-                    assert_device_is_valid_mock.assert_called_once_with(instructions)
-                    assert_device_is_enabled_mock.assert_called_once_with(instructions)
-                    update_device_metadata_mock.assert_called_once_with(instructions)
+                    assert_device_is_valid_mock.assert_called_once_with(instructions, ["samx"])
+                    assert_device_is_enabled_mock.assert_called_once_with(instructions, ["samx"])
+                    update_device_metadata_mock.assert_called_once_with(instructions, ["samx"])
 
                     set_mock.assert_called_once_with(instructions)
 
@@ -482,6 +490,32 @@ def test_handle_device_instructions_limit_error(device_server_mock, instructions
             )
 
 
+def test_handle_device_instructions_rpc_error_with_error_info_skips_traceback(device_server_mock):
+    device_server = device_server_mock
+    instructions = messages.DeviceInstructionMessage(
+        device="samx",
+        action="rpc",
+        parameter={},
+        metadata={"stream": "primary", "device_instr_id": "diid", "RID": "test"},
+    )
+    error_info = messages.ErrorInfo(
+        error_message="error", compact_error_message="error", exception_type="RuntimeError"
+    )
+
+    with (
+        mock.patch.object(device_server.requests_handler, "set_finished") as set_finished_mock,
+        mock.patch.object(device_server.rpc_handler, "send_rpc_exception") as rpc_exception_mock,
+        mock.patch.object(device_server, "_run_rpc") as rpc_mock,
+        mock.patch("bec_server.device_server.device_server.traceback") as traceback_mock,
+    ):
+        rpc_mock.side_effect = ExceptionWithErrorInfo(error_info)
+        device_server.handle_device_instructions(instructions)
+
+        traceback_mock.format_exc.assert_not_called()
+        rpc_exception_mock.assert_called_once()
+        set_finished_mock.assert_called_once_with("diid", success=False, error_info=error_info)
+
+
 @pytest.mark.parametrize(
     "instructions",
     [
@@ -526,9 +560,9 @@ def test_handle_device_instructions_rpc(device_server_mock, instructions):
                     device_server.handle_device_instructions(instructions)
                     rpc_mock.assert_called_once_with(instructions)
 
-                    assert_device_is_valid_mock.assert_called_once_with(instructions)
+                    assert_device_is_valid_mock.assert_called_once_with(instructions, ["samx"])
                     assert_device_is_enabled_mock.assert_not_called()
-                    update_device_metadata_mock.assert_called_once_with(instructions)
+                    update_device_metadata_mock.assert_called_once_with(instructions, ["samx"])
 
 
 @pytest.mark.parametrize(
@@ -770,6 +804,42 @@ def test_kickoff_device(device_server_mock, instr):
         kickoff.assert_called_once()
 
 
+def test_kickoff_accepts_args_is_cached(device_server_mock):
+    device_server = device_server_mock
+
+    class FlyerWithMetadata:
+        def kickoff(self, metadata=None, **kwargs):
+            pass
+
+    class FlyerWithoutArgs:
+        def kickoff(self):
+            pass
+
+    with mock.patch(
+        "bec_server.device_server.device_server.inspect.getfullargspec",
+        wraps=inspect.getfullargspec,
+    ) as argspec:
+        assert device_server._kickoff_accepts_args(FlyerWithMetadata()) is True
+        assert device_server._kickoff_accepts_args(FlyerWithMetadata()) is True
+        assert device_server._kickoff_accepts_args(FlyerWithoutArgs()) is False
+        assert argspec.call_count == 2
+
+
+def test_supports_staging_is_cached_per_type(device_server_mock):
+    device_server = device_server_mock
+
+    class StageableDevice:
+        def __init__(self):
+            self._staged = Staged.no
+
+    class PlainDevice:
+        pass
+
+    assert device_server._supports_staging(StageableDevice()) is True
+    assert device_server._supports_staging(PlainDevice()) is False
+    assert device_server._supports_staging_cache == {StageableDevice: True, PlainDevice: False}
+
+
 @pytest.mark.timeout(30)
 @pytest.mark.parametrize(
     "instr",
@@ -882,8 +952,9 @@ def test_read_device(device_server_mock, instr):
             for msg in device_server.connector.message_sent
             if msg["queue"] == MessageEndpoints.device_read(device).endpoint
         ]
-        assert res[-1]["msg"].metadata["RID"] == instr.metadata["RID"]
-        assert res[-1]["msg"].metadata["stream"] == "primary"
+        msg = MsgpackSerialization.loads(res[-1]["msg"])
+        assert msg.metadata["RID"] == instr.metadata["RID"]
+        assert msg.metadata["stream"] == "primary"
 
 
 @pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
@@ -903,7 +974,10 @@ def test_read_device_can_return_result(device_server_mock):
         for msg in device_server.connector.message_sent
         if msg["queue"] == MessageEndpoints.device_instructions_response()
     ]
+    assert len(responses) == 1
     response = responses[-1]
+    assert response.status == "completed"
+    assert device_server.requests_handler.get_request("diid") is None
     assert response.result is not None
     assert len(response.result) == 2
     assert response.result[0].keys() == device_server.device_manager.devices.samx.obj.read().keys()
@@ -927,6 +1001,19 @@ def test_read_config_and_update_devices(device_server_mock, devices):
         assert res[-1]["queue"] == MessageEndpoints.device_read_configuration(device).endpoint
 
 
+@pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
+def test_read_and_update_devices_uses_given_pipeline(device_server_mock):
+    device_server = device_server_mock
+    pipe = device_server.connector.pipeline()
+    device_server._read_and_update_devices(["samx"], metadata={"RID": "test"}, pipe=pipe)
+    # the caller owns the pipeline; nothing is sent before it is executed
+    assert len(pipe._pipe_buffer) == 2
+    assert not any(
+        msg["queue"] == MessageEndpoints.device_read("samx").endpoint
+        for msg in device_server.connector.message_sent
+    )
+
+
 @pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
 def test_read_and_update_devices_exception(device_server_mock):
     device_server = device_server_mock
@@ -1056,6 +1143,23 @@ def test_stage_device(device_server_mock, instr):
         assert device_server.device_manager.devices[dev].obj._staged == Staged.yes
 
 
+@pytest.mark.parametrize("device_manager_class", [DeviceManagerDS])
+def test_device_staged_callback_uses_bound_context(device_server_mock):
+    device_server = device_server_mock
+    instr = messages.DeviceInstructionMessage(
+        device="samx", action="unstage", parameter={}, metadata={"device_instr_id": "unknown"}
+    )
+    obj = device_server.device_manager.devices["samx"].obj
+    ctx = _StagedStatusContext(instr=instr, obj=obj, state=0)
+    status = StatusBase()
+    with mock.patch.object(device_server.connector, "set") as set_mock:
+        device_server._device_staged_callback(status, ctx=ctx)
+    set_mock.assert_called_once_with(
+        MessageEndpoints.device_staged("samx"),
+        messages.DeviceStatusMessage(device="samx", status=0, metadata=instr.metadata),
+    )
+
+
 @pytest.mark.parametrize(
     "instr",
     [
@@ -1087,11 +1191,26 @@ def test_stage_timeout_unstage_device(device_server_mock, instr):
         assert device_server.device_manager.devices["samx"].obj._staged == Staged.yes
         status = DeviceStatus(device=device_server.device_manager.devices["samx"].obj)
         mock_unstage.return_value = status
-        with pytest.raises(ValueError):
+        with mock.patch.object(
+            device_server.requests_handler,
+            "add_status_object",
+            wraps=device_server.requests_handler.add_status_object,
+        ) as add_status_object:
+            # the stage instruction does not block on the unstage but its status fails on timeout
             device_server._stage_device(instr, timeout_on_unstage=0.1)
-        # Change the mock to return the resolved unstage status + unstage the device
-        mock_unstage.side_effect = callback
-        device_server._stage_device(instr, timeout_on_unstage=0.1)
+            stage_status = add_status_object.call_args.args[1]
+            with pytest.raises(ValueError):
+                stage_status.wait(timeout=5)
+            # Change the mock to return the resolved unstage status + unstage the device
+            mock_unstage.side_effect = callback
+            # the failed request may still be finishing on the status callback thread
+            instr = instr.model_copy(
+                update={"metadata": {**instr.metadata, "device_instr_id": "diid2"}}
+            )
+            device_server._stage_device(instr, timeout_on_unstage=0.1)
+            stage_status = add_status_object.call_args.args[1]
+            stage_status.wait(timeout=5)
+        assert device_server.device_manager.devices["samx"].obj._staged == Staged.yes
 
 
 @pytest.mark.parametrize(
@@ -1185,6 +1304,7 @@ def test_request_handler_ignores_response_if_stop_id(device_server_mock, stop_id
     status = StatusBase()
     device_server.requests_handler.add_request(request, num_status_objects=1)
     device_server.requests_handler.add_status_object("diid", status)
+    device_server.requests_handler.flush_running_responses()
 
     with mock.patch.object(device_server.connector, "send") as send_mock:
         with mock.patch.object(device_server, "stop_devices") as stop_mock:
@@ -1199,6 +1319,86 @@ def test_request_handler_ignores_response_if_stop_id(device_server_mock, stop_id
         send_mock.assert_not_called()
 
 
+def test_request_handler_coalesces_running_responses(device_server_mock):
+    device_server = device_server_mock
+    request = messages.DeviceInstructionMessage(
+        device="samx", action="set", parameter={}, metadata={"device_instr_id": "diid"}
+    )
+    handler = device_server.requests_handler
+    # stop the flush thread so that the test controls when responses are flushed
+    handler._shutdown_event.set()
+    handler._flush_thread.join()
+
+    with mock.patch.object(device_server.connector, "send") as send_mock:
+        handler.add_request(request, num_status_objects=1)
+        handler.send_device_instruction_response(
+            "diid", success=False, done=False, is_status_obj=True
+        )
+        send_mock.assert_not_called()
+        # only the latest running state is kept; the message is built on flush
+        assert handler._pending_running == {"diid": (request, True)}
+        handler.flush_running_responses()
+        assert send_mock.call_count == 1
+        assert send_mock.call_args.args[1].status == "running"
+        assert send_mock.call_args.args[1].result_is_status is True
+        assert send_mock.call_args.args[1].metadata is request.metadata
+
+        send_mock.reset_mock()
+        handler.send_device_instruction_response("diid", success=False, done=False)
+        handler.set_finished("diid", success=True)
+        statuses = [call.args[1].status for call in send_mock.call_args_list]
+        assert statuses == ["running", "completed"]
+        assert handler._pending_running == {}
+
+
+@pytest.mark.timeout(10)
+def test_request_handler_terminal_response_waits_for_running_flush(device_server_mock):
+    device_server = device_server_mock
+    request = messages.DeviceInstructionMessage(
+        device="samx", action="set", parameter={}, metadata={"device_instr_id": "diid"}
+    )
+    handler = device_server.requests_handler
+    handler._shutdown_event.set()
+    handler._flush_thread.join()
+
+    sent, piped = [], []
+    executing, release_execute = threading.Event(), threading.Event()
+
+    def _send(_endpoint, msg, pipe=None):
+        (piped if pipe is not None else sent).append(msg.status)
+
+    def _execute():
+        executing.set()
+        release_execute.wait()
+        sent.extend(piped)
+
+    pipe = mock.MagicMock()
+    pipe.execute.side_effect = _execute
+    with (
+        mock.patch.object(device_server.connector, "send", side_effect=_send),
+        mock.patch.object(device_server.connector, "pipeline", return_value=pipe),
+    ):
+        handler.add_request(request, num_status_objects=1)
+        handler.send_device_instruction_response("diid", success=False, done=False)
+        flusher = threading.Thread(target=handler.flush_running_responses)
+        flusher.start()
+        executing.wait()
+        finisher = threading.Thread(
+            target=handler.set_finished, args=("diid",), kwargs={"success": True}
+        )
+        finisher.start()
+        finisher.join(0.2)
+        try:
+            # the completed response has to wait until the running one is out
+            assert sent == []
+        finally:
+            release_execute.set()
+            flusher.join()
+            finisher.join()
+
+    assert sent == ["running", "completed"]
+
+
 def test_request_handler_update_instruction_uses_snapshot_when_request_removed(device_server_mock):
     device_server = device_server_mock
     request = messages.DeviceInstructionMessage(
@@ -1213,6 +1413,8 @@ def test_request_handler_update_instruction_uses_snapshot_when_request_removed(d
         "num_status_objects": 1,
         "done": False,
         "is_status_obj": True,
+        "done_count": 1,
+        "first_exception": None,
     }
 
     with mock.patch.object(
@@ -1223,3 +1425,100 @@ def test_request_handler_update_instruction_uses_snapshot_when_request_removed(d
             device_server.requests_handler._update_instruction("diid", is_status_obj=True)
 
     set_finished_mock.assert_called_once_with("diid", success=True)
+
+
+@pytest.mark.timeout(10)
+def test_request_handler_finishes_once_all_status_objects_are_done(device_server_mock):
+    device_server = device_server_mock
+    handler = device_server.requests_handler
+    request = messages.DeviceInstructionMessage(
+        device="samx", action="complete", parameter={}, metadata={"device_instr_id": "diid"}
+    )
+    handler.add_request(request, num_status_objects=2)
+    status_objects = [StatusBase(), StatusBase()]
+    for status in status_objects:
+        handler.set_status_info(status, request, mock.MagicMock())
+        handler.add_status_object("diid", status)
+
+    with (
+        mock.patch.object(device_server, "status_callback"),
+        mock.patch.object(handler, "set_finished") as set_finished_mock,
+    ):
+        status_objects[0].set_exception(RuntimeError("first failed"))
+        while handler.get_request("diid")["done_count"] < 1:
+            time.sleep(0.01)
+        set_finished_mock.assert_not_called()
+        assert handler.get_request("diid")["first_exception"][1] is status_objects[0]
+
+        status_objects[1].set_finished()
+        while not set_finished_mock.called:
+            time.sleep(0.01)
+    set_finished_mock.assert_called_once_with("diid", success=False, error_info=ANY)
+
+
+def test_request_handler_set_status_info_resolves_status_device(device_server_mock):
+    handler = device_server_mock.requests_handler
+    instr = messages.DeviceInstructionMessage(
+        device="samx", action="set", parameter={}, metadata={"device_instr_id": "diid"}
+    )
+    device = mock.MagicMock()
+    other_device = mock.MagicMock()
+
+    status = StatusBase()
+    handler.set_status_info(status, instr, device)
+    assert handler.get_status_info(status)["status_device"] is device
+
+    status = StatusBase()
+    status.device = other_device
+    handler.set_status_info(status, instr, device)
+    assert handler.get_status_info(status)["status_device"] is other_device
+    assert handler.get_status_info(status)["obj"] is device
+
+
+def test_get_instruction_device_roots():
+    instr = messages.DeviceInstructionMessage(
+        device=["samx.velocity", "samy", "samx.acceleration", "samx"],
+        action="read",
+        parameter={},
+        metadata={"device_instr_id": "diid"},
+    )
+    assert DeviceServer._get_instruction_device_roots(instr) == ["samx", "samy"]
+
+
+def test_request_handler_writes_deferred_sets_before_final_response(device_server_mock):
+    device_server = device_server_mock
+    handler = device_server.requests_handler
+    request = messages.DeviceInstructionMessage(
+        device=["samx", "samy"], action="stage", parameter={}, metadata={"device_instr_id": "diid"}
+    )
+    handler.add_request(request, num_status_objects=2)
+    for dev in ["samx", "samy"]:
+        assert handler.defer_set(
+            "diid",
+            MessageEndpoints.device_staged(dev),
+            messages.DeviceStatusMessage(device=dev, status=1),
+        )
+
+    calls = mock.MagicMock()
+    pipe = mock.MagicMock()
+    pipe.execute.side_effect = calls.execute
+    with (
+        mock.patch.object(device_server.connector, "pipeline", return_value=pipe),
+        mock.patch.object(device_server.connector, "set", side_effect=calls.set) as set_mock,
+        mock.patch.object(device_server.connector, "send", side_effect=calls.send),
+    ):
+        handler.set_finished("diid", success=True)
+
+    assert [call.args[0] for call in set_mock.call_args_list] == [
+        MessageEndpoints.device_staged("samx"),
+        MessageEndpoints.device_staged("samy"),
+    ]
+    assert all(call.args[2] is pipe for call in set_mock.call_args_list)
+    call_names = [name for name, *_ in calls.mock_calls]
+    assert call_names[:3] == ["set", "set", "execute"]
+    assert set(call_names[3:]) == {"send"}
+    assert not handler.defer_set(
+        "diid",
+        MessageEndpoints.device_staged("samx"),
+        messages.DeviceStatusMessage(device="samx", status=0),
+    )
@@ -1,3 +1,4 @@
+import threading
 import time
 from unittest import mock
 
@@ -14,6 +15,7 @@ from bec_server.scan_server.beamline_state_manager import BeamlineStateManager
 def state_manager(connected_connector, dm_with_devices):
     manager = BeamlineStateManager(connected_connector, device_manager=dm_with_devices)
     yield manager
+    manager.shutdown()
 
 
 @pytest.fixture
@@ -56,6 +58,25 @@ def test_state_manager_fetches_states(dm_with_devices, fake_bl_states):
             mock.call(MessageEndpoints.device_config_update(), cb=state_manager.restart_all),
         ]
     )
+    state_manager.shutdown()
+
+
+def test_state_manager_shutdown_unregisters_callbacks(dm_with_devices):
+    connector = mock.MagicMock()
+    state_manager = BeamlineStateManager(connector, device_manager=dm_with_devices)
+    state_manager.shutdown()
+
+    connector.unregister.assert_has_calls(
+        [
+            mock.call(
+                MessageEndpoints.available_beamline_states(), cb=state_manager._handle_state_update
+            ),
+            mock.call(MessageEndpoints.device_config_update(), cb=state_manager.restart_all),
+        ]
+    )
+    # late callbacks are ignored instead of failing on the stopped executor
+    state_manager.restart_all()
+    state_manager._handle_state_update({"data": messages.AvailableBeamlineStatesMessage(states=[])})
 
 
 @pytest.mark.timeout(5)
@@ -175,3 +196,115 @@ def test_states_restarted_when_device_config_updated(
 
     while state_mock.restart.call_count == 0:
         time.sleep(0.1)
+
+
+def test_update_states_does_not_restart_new_states(state_manager, fake_bl_states):
+    msg = messages.AvailableBeamlineStatesMessage(
+        states=[
+            messages.BeamlineStateConfig(
+                name="State1",
+                state_type="DeviceWithinLimitsState",
+                parameters={"name": "State1", "device": "samx", "low_limit": 0.0},
+            )
+        ]
+    )
+
+    with mock.patch.object(fake_bl_states, "update_parameters") as update_parameters:
+        state_manager.update_states(msg)
+
+    state = state_manager._states["State1"]
+    assert state.started
+    assert state.restart_count == 0
+    update_parameters.assert_not_called()
+
+
+def test_update_states_fetches_device_readbacks_together(dm_with_devices):
+    connector = mock.MagicMock()
+    state_manager = BeamlineStateManager(connector, device_manager=dm_with_devices)
+    connector.mget.return_value = [
+        messages.DeviceMessage(signals={"samx": {"value": 1.0, "timestamp": 1.0}}),
+        messages.DeviceMessage(signals={"samy": {"value": 20.0, "timestamp": 1.0}}),
+    ]
+    msg = messages.AvailableBeamlineStatesMessage(
+        states=[
+            messages.BeamlineStateConfig(
+                name=name,
+                state_type="DeviceWithinLimitsState",
+                parameters={"name": name, "device": device, "low_limit": 0.0, "high_limit": 10.0},
+            )
+            for name, device in [("State1", "samx"), ("State2", "samy")]
+        ]
+    )
+
+    try:
+        state_manager.update_states(msg)
+    finally:
+        state_manager.shutdown()
+
+    connector.mget.assert_called_once_with(
+        [
+            MessageEndpoints.device_readback("samx").endpoint,
+            MessageEndpoints.device_readback("samy").endpoint,
+        ]
+    )
+    connector.get.assert_not_called()
+    assert all(state.started for state in state_manager._states.values())
+
+
+def test_update_states_skips_unchanged_message(state_manager, fake_bl_states):
+    msg = messages.AvailableBeamlineStatesMessage(
+        states=[
+            messages.BeamlineStateConfig(
+                name="State1",
+                state_type="DeviceWithinLimitsState",
+                parameters={"name": "State1", "device": "samx", "low_limit": 0.0},
+            )
+        ]
+    )
+    state_manager.update_states(msg)
+
+    with mock.patch.object(beamline_state_manager, "_state_class_for_state_type") as state_class:
+        state_manager.update_states(msg.model_copy(deep=True))
+
+    state_class.assert_not_called()
+    assert state_manager._states["State1"].restart_count == 0
+
+
+def test_state_updates_applied_on_worker_thread(state_manager):
+    msg = messages.AvailableBeamlineStatesMessage(states=[])
+    threads = []
+
+    with mock.patch.object(
+        state_manager,
+        "update_states",
+        side_effect=lambda _msg: threads.append(threading.current_thread().name),
+    ) as update_states:
+        state_manager._handle_state_update({"data": msg})
+        # shutting down would cancel the update if it has not started yet
+        state_manager.executor.submit(lambda: None).result()
+
+    update_states.assert_called_once_with(msg)
+    assert threads[0].startswith("BeamlineStateManager")
+
+
+def test_repeated_state_updates_are_not_submitted(state_manager):
+    msg = messages.AvailableBeamlineStatesMessage(states=[])
+
+    with mock.patch.object(state_manager, "executor") as executor:
+        state_manager._handle_state_update({"data": msg})
+        state_manager._handle_state_update({"data": msg.model_copy(deep=True)})
+
+    executor.submit.assert_called_once_with(state_manager._apply_state_update, msg)
+
+
+def test_failed_state_update_is_retried(state_manager):
+    msg = messages.AvailableBeamlineStatesMessage(states=[])
+
+    with mock.patch.object(state_manager, "update_states", side_effect=ValueError) as update:
+        state_manager._handle_state_update({"data": msg})
+        # wait for the failed update before repeating it
+        state_manager.executor.submit(lambda: None).result()
+        state_manager._handle_state_update({"data": msg})
+        state_manager.executor.submit(lambda: None).result()
+
+    assert update.call_count == 2
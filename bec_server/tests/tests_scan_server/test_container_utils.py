@@ -1,6 +1,8 @@
 from unittest.mock import ANY, MagicMock, patch
 
 import pytest
+import requests
+from podman.errors import APIError
 
 from bec_server.procedures.constants import PROCEDURE, PodmanContainerStates, ProcedureWorkerError
 from bec_server.procedures.container_utils import (
@@ -121,7 +123,7 @@ def test_api_utils_build(api_utils: tuple[PodmanApiUtils, MagicMock]):
     utils, client = api_utils
     utils.build_worker_image()
     client.assert_called_with(base_url=PROCEDURE.CONTAINER.PODMAN_URI)
-    client().__enter__().images.build.assert_called_once()
+    client().images.build.assert_called_once()
 
 
 def test_api_utils_run(api_utils: tuple[PodmanApiUtils, MagicMock]):
@@ -132,7 +134,7 @@ def test_api_utils_run(api_utils: tuple[PodmanApiUtils, MagicMock]):
         [{"source": "a", "target": "b", "read_only": True, "type": "bind"}],
         "run",
     )
-    client().__enter__().containers.run.assert_called_once_with(
+    client().containers.run.assert_called_once_with(
         "test_tag",
         "run",
         detach=True,
@@ -146,7 +148,64 @@ def test_api_utils_run(api_utils: tuple[PodmanApiUtils, MagicMock]):
 def test_api_utils_image_exists(api_utils: tuple[PodmanApiUtils, MagicMock]):
     utils, client = api_utils
     utils.image_exists("test")
-    client().__enter__().images.exists.assert_called_once_with("test")
+    client().images.exists.assert_called_once_with("test")
+
+
+def test_api_utils_reuses_client(api_utils: tuple[PodmanApiUtils, MagicMock]):
+    utils, client = api_utils
+    client.reset_mock()
+    client().containers.get().status = "running"
+    client.reset_mock()
+    utils.image_exists("test")
+    assert utils.state("test") == PodmanContainerStates.RUNNING
+    utils.kill("test")
+    client.assert_called_once_with(base_url=PROCEDURE.CONTAINER.PODMAN_URI)
+
+
+def test_api_utils_connects_lazily_and_closes(api_utils: tuple[PodmanApiUtils, MagicMock]):
+    utils, client = api_utils
+    with utils:
+        client.assert_not_called()
+        utils.image_exists("test")
+    client.assert_called_once_with(base_url=PROCEDURE.CONTAINER.PODMAN_URI)
+    client().close.assert_called_once()
+    assert utils._client is None
+
+
+@pytest.mark.parametrize("error", [BrokenPipeError, requests.exceptions.ConnectionError])
+def test_api_utils_reconnects_once_on_broken_connection(
+    api_utils: tuple[PodmanApiUtils, MagicMock], error
+):
+    utils, client = api_utils
+    broken_client = MagicMock()
+    broken_client.images.exists.side_effect = error
+    new_client = MagicMock()
+    client.side_effect = [broken_client, new_client]
+    new_client.images.exists.return_value = True
+    assert utils.image_exists("test")
+    broken_client.close.assert_called_once()
+    assert utils._client is new_client
+
+
+def test_api_utils_does_not_retry_on_api_error(api_utils: tuple[PodmanApiUtils, MagicMock]):
+    utils, client = api_utils
+    client().containers.get().kill.side_effect = APIError("internal server error")
+    client.reset_mock()
+    with pytest.raises(APIError):
+        utils.kill("test")
+    client().containers.get().kill.assert_called_once()
+
+
+def test_api_utils_waits_with_its_own_client(api_utils: tuple[PodmanApiUtils, MagicMock]):
+    utils, client = api_utils
+    utils.image_exists("test")
+    shared_client = utils._client
+    wait_client = client.return_value.__enter__.return_value
+    utils.wait("test")
+    wait_client.containers.get.assert_called_once_with("test")
+    wait_client.containers.get().wait.assert_called_once()
+    shared_client.containers.get.assert_not_called()
+    assert utils._client is shared_client
 
 
 def test_build_args_from_dict():
@@ -211,6 +270,31 @@ def test_cli_kill(cli_utils: tuple[PodmanCliUtils, MagicMock]):
     assert run_mock.call_count == 1
 
 
+def test_cli_run_named_container(cli_utils: tuple[PodmanCliUtils, MagicMock]):
+    utils, run_mock = cli_utils
+    run_mock.reset_mock()
+    assert utils.run("test_tag", {}, [], "run", container_name="test") == "success"
+    assert run_mock.call_count == 1
+    assert run_mock.call_args.args[0][:2] == ["podman", "run"]
+
+
+def test_cli_run_removes_leftover_container_on_failure(cli_utils: tuple[PodmanCliUtils, MagicMock]):
+    utils, run_mock = cli_utils
+    run_mock.reset_mock()
+    failed, succeeded = MagicMock(returncode=1), MagicMock(returncode=0, stdout=b"id\n")
+    run_mock.side_effect = [failed, succeeded, succeeded]
+    assert utils.run("test_tag", {}, [], "run", container_name="test") == "id"
+    commands = [c.args[0][:2] for c in run_mock.call_args_list]
+    assert commands == [["podman", "run"], ["podman", "rm"], ["podman", "run"]]
+
+
+def test_cli_wait(cli_utils: tuple[PodmanCliUtils, MagicMock]):
+    utils, run_mock = cli_utils
+    run_mock.reset_mock()
+    utils.wait("test")
+    run_mock.assert_called_once_with(["podman", "wait", "test"], capture_output=True)
+
+
 def test_cli_get_state(cli_utils_with_fake_container_json: PodmanCliUtils):
     assert cli_utils_with_fake_container_json.state(
         "13826d25a737b733a5d87975b50a9c1efb5d087365d956cb7db2ccbe6aca07c4"
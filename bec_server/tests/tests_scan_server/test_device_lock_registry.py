@@ -156,3 +156,15 @@ def test_device_lock_registry_acquire_many_bundles_queue_update_callback():
 
     assert acquired == ["samx", "samy", "samz"]
     assert wait_states == [["samx", "samy"], []]
+    assert "request-3" not in registry._pending_device_locks
+
+
+def test_device_lock_registry_release_all_only_notifies_on_release():
+    registry = DeviceLockRegistry()
+    registry.acquire("scan-1", "samx")
+
+    with mock.patch.object(registry._condition, "notify_all") as notify_all:
+        assert registry.release_all("scan-2") == []
+        notify_all.assert_not_called()
+        assert registry.release_all("scan-1") == ["samx"]
+        notify_all.assert_called_once()
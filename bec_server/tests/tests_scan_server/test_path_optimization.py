@@ -274,3 +274,58 @@ def test_optimize_corridor_respects_first_corridor_direction_and_snaking():
     np.testing.assert_allclose(
         non_snaked, np.asarray([[0.0, 0.0], [0.0, 1.0], [1.0, 0.0], [1.0, 1.0]])
     )
+
+
+def test_path_length_and_quality_use_step_lengths():
+    optim = PathOptimizerMixin()
+    positions = np.asarray([[0.0, 0.0], [3.0, 4.0], [3.0, 4.0], [3.0, 5.0]])
+
+    assert optim.get_path_length(positions) == pytest.approx(6.0)
+    assert optim.get_path_length(positions[:1]) == 0.0
+    assert optim.get_path_length(np.asarray([0.0, 2.0, -1.0])) == pytest.approx(5.0)
+
+    quality = optim.analyze_path_quality(positions)
+    assert quality.max_jump == pytest.approx(5.0)
+    assert quality.avg_step == pytest.approx(2.0)
+    assert quality.std_step == pytest.approx(np.std([5.0, 0.0, 1.0]))
+    assert quality.total_length == pytest.approx(6.0)
+
+
+def test_optimize_nearest_neighbor_matches_greedy_search():
+    optim = PathOptimizerMixin()
+    positions = np.random.default_rng(42).uniform(-10, 10, size=(500, 2))
+
+    remaining = list(range(len(positions)))
+    current = int(np.argmin(np.sum(positions**2, axis=1)))
+    remaining.remove(current)
+    expected = [current]
+    while remaining:
+        distances = np.linalg.norm(positions[remaining] - positions[current], axis=1)
+        current = remaining.pop(int(np.argmin(distances)))
+        expected.append(current)
+
+    np.testing.assert_array_equal(optim.optimize_nearest_neighbor(positions), positions[expected])
+
+
+def test_optimize_nearest_neighbor_breaks_ties_by_lowest_index():
+    optim = PathOptimizerMixin()
+    x, y = np.meshgrid(np.arange(-7, 8), np.arange(-7, 8))
+    positions = np.column_stack([x.ravel(), y.ravel()]).astype(float)
+
+    remaining = list(range(len(positions)))
+    current = int(np.argmin(np.sum(positions**2, axis=1)))
+    remaining.remove(current)
+    expected = [current]
+    while remaining:
+        distances = np.sqrt(np.sum((positions[remaining] - positions[current]) ** 2, axis=1))
+        current = remaining.pop(int(np.argmin(distances)))
+        expected.append(current)
+
+    np.testing.assert_array_equal(optim.optimize_nearest_neighbor(positions), positions[expected])
+
+
+def test_get_radius():
+    optim = PathOptimizerMixin()
+    positions = np.asarray([[3.0, -4.0, 1.0], [-1.0, 0.0, 5.0], [0.0, 0.0, 0.0]])
+
+    np.testing.assert_allclose(optim.get_radius(positions), [5.0, 1.0, 0.0])
@@ -1,7 +1,7 @@
 import os
 import time
 from itertools import repeat
-from threading import Thread
+from threading import Event, Thread
 from time import sleep
 from unittest.mock import MagicMock, call, patch
 
@@ -9,7 +9,7 @@ import pytest
 
 from bec_lib.messages import ProcedureWorkerStatus, ProcedureWorkerStatusMessage
 from bec_server.procedures import procedure_registry
-from bec_server.procedures.constants import PodmanContainerStates
+from bec_server.procedures.constants import PROCEDURE, NoPodman, ProcedureWorkerError
 from bec_server.procedures.container_worker import ContainerProcedureWorker
 from bec_server.procedures.oop_worker_base import main as container_worker_main
 from bec_server.procedures.protocol import ContainerCommandBackend
@@ -31,15 +31,15 @@ def test_container_worker_init(redis_mock):
     }
 
 
-@patch(
-    "bec_server.procedures.container_worker.get_backend",
-    MagicMock(return_value=MagicMock(spec=ContainerCommandBackend)),
-)
 @patch("bec_server.procedures.oop_worker_base.logger")
 @patch("bec_server.procedures.worker_base.RedisConnector")
-def test_container_worker_work(redis_mock, logger_mock):
+@patch("bec_server.procedures.container_worker.get_backend")
+def test_container_worker_work(get_backend_mock, redis_mock, logger_mock):
     redis_mock().host = "server"
     redis_mock().port = "port"
+    container_exit = Event()
+    get_backend_mock.return_value = MagicMock(spec=ContainerCommandBackend)
+    get_backend_mock.return_value.wait.side_effect = lambda _: container_exit.wait()
 
     msgs = [
         ProcedureWorkerStatusMessage(
@@ -65,7 +65,7 @@ def test_container_worker_work(redis_mock, logger_mock):
     t = Thread(target=worker.work)
 
     def cleanup():
-        worker._backend.state.return_value = PodmanContainerStates.EXITED
+        container_exit.set()
         t.join()
 
     t.start()
@@ -94,6 +94,123 @@ def test_container_worker_work(redis_mock, logger_mock):
     cleanup()
 
 
+@patch(
+    "bec_server.procedures.container_worker.get_backend",
+    MagicMock(return_value=MagicMock(spec=ContainerCommandBackend)),
+)
+@patch("bec_server.procedures.oop_worker_base.logger", MagicMock())
+@patch("bec_server.procedures.worker_base.RedisConnector")
+def test_container_worker_work_backs_off_status_polling(redis_mock):
+    msg = ProcedureWorkerStatusMessage(
+        worker_queue="test_queue", status=ProcedureWorkerStatus.RUNNING, current_execution_id="test"
+    )
+    redis_mock().blocking_list_pop.side_effect = [None, None, None, msg, None, None, None, None]
+    worker = ContainerProcedureWorker(server="server:port", queue="test_queue", lifetime_s=1)
+    worker._ending_or_ended = MagicMock(side_effect=[False] * 7 + [True])
+
+    worker.work()
+
+    timeouts = [c.kwargs["timeout_s"] for c in redis_mock().blocking_list_pop.call_args_list]
+    assert timeouts == [0.2, 0.4, 0.4, 0.4, 0.2, 0.4, 0.4, 0.4]
+    assert worker.status == ProcedureWorkerStatus.DEAD
+
+
+@patch(
+    "bec_server.procedures.container_worker.get_backend",
+    MagicMock(return_value=MagicMock(spec=ContainerCommandBackend)),
+)
+@patch("bec_server.procedures.oop_worker_base.logger", MagicMock())
+@patch("bec_server.procedures.worker_base.RedisConnector")
+def test_container_worker_work_checks_liveness_every_n_updates(redis_mock):
+    msg = ProcedureWorkerStatusMessage(
+        worker_queue="test_queue", status=ProcedureWorkerStatus.RUNNING, current_execution_id="test"
+    )
+    n = PROCEDURE.WORKER.LIVENESS_POLL_EVERY_N
+    redis_mock().blocking_list_pop.side_effect = [msg] * (2 * n) + [None]
+    worker = ContainerProcedureWorker(server="server:port", queue="test_queue", lifetime_s=1)
+    worker._ending_or_ended = MagicMock(side_effect=[False] * 3 + [True])
+
+    worker.work()
+
+    assert redis_mock().blocking_list_pop.call_count == 2 * n + 1
+    assert worker._ending_or_ended.call_count == 4
+
+
+@patch("bec_server.procedures.container_worker.logger")
+@patch("bec_server.procedures.worker_base.RedisConnector", MagicMock())
+@patch("bec_server.procedures.container_worker.get_backend")
+def test_container_worker_waits_for_container_exit(get_backend_mock, logger_mock):
+    container_exit = Event()
+    backend = get_backend_mock.return_value = MagicMock(spec=ContainerCommandBackend)
+    backend.run.return_value = "container_id"
+    backend.wait.side_effect = lambda _: container_exit.wait()
+    worker = ContainerProcedureWorker(server="server:port", queue="test_queue", lifetime_s=1)
+    assert not worker._ending_or_ended()
+
+    # interrupting the worker lets the container exit cleanly, so it should not be killed
+    backend.interrupt.side_effect = lambda _: container_exit.set()
+    worker._kill_process()
+
+    assert worker._ending_or_ended()
+    assert not worker._exit_watcher.is_alive()
+    backend.wait.assert_called_once_with("container_id")
+    backend.state.assert_not_called()
+    backend.kill.assert_not_called()
+    backend.close.assert_called_once()
+
+
+@patch("bec_server.procedures.container_worker.logger")
+@patch("bec_server.procedures.worker_base.RedisConnector", MagicMock())
+@patch("bec_server.procedures.container_worker.get_backend")
+def test_container_worker_assumes_exit_if_wait_fails(get_backend_mock, logger_mock):
+    backend = get_backend_mock.return_value = MagicMock(spec=ContainerCommandBackend)
+    backend.wait.side_effect = ProcedureWorkerError("no such container")
+    worker = ContainerProcedureWorker(server="server:port", queue="test_queue", lifetime_s=1)
+    worker._exit_watcher.join()
+    assert worker._ending_or_ended()
+    logger_mock.error.assert_called_once()
+
+
+@patch("bec_server.procedures.container_worker.logger", MagicMock())
+@patch("bec_server.procedures.worker_base.RedisConnector", MagicMock())
+@patch("bec_server.procedures.container_worker.get_backend")
+def test_container_worker_abort_closes_replaced_backend(get_backend_mock):
+    old_backend, new_backend = (MagicMock(spec=ContainerCommandBackend) for _ in range(2))
+    old_backend.run.return_value = "old_container"
+    get_backend_mock.side_effect = [old_backend, new_backend]
+    worker = ContainerProcedureWorker(server="server:port", queue="test_queue", lifetime_s=1)
+    worker._helper = MagicMock()
+    worker._current_execution_id = "test"
+
+    worker.abort_execution("test")
+
+    old_backend.kill.assert_called_once_with("old_container")
+    old_backend.close.assert_called_once()
+    new_backend.close.assert_not_called()
+    assert worker._backend is new_backend
+
+
+@patch("bec_server.procedures.container_worker.get_backend")
+def test_container_worker_warm_up_builds_missing_image(get_backend_mock):
+    backend = get_backend_mock.return_value = MagicMock(spec=ContainerCommandBackend)
+    backend.image_exists.return_value = False
+    ContainerProcedureWorker.warm_up()
+    backend.build_worker_image.assert_called_once()
+    backend.close.assert_called_once()
+
+    backend.reset_mock()
+    backend.image_exists.return_value = True
+    ContainerProcedureWorker.warm_up()
+    backend.build_worker_image.assert_not_called()
+
+
+@patch("bec_server.procedures.container_worker.logger")
+@patch("bec_server.procedures.container_worker.get_backend", side_effect=NoPodman)
+def test_container_worker_warm_up_without_podman(_, logger_mock):
+    ContainerProcedureWorker.warm_up()
+    logger_mock.error.assert_called_once()
+
+
 @patch("bec_server.procedures.oop_worker_base.logger")
 def test_main_exits_without_env_variables(logger_mock):
     with patch.dict(os.environ, clear=True), pytest.raises(SystemExit):
@@ -135,12 +252,16 @@ class MockItem:
     "bec_server.procedures.container_worker.get_backend",
     MagicMock(return_value=MagicMock(spec=ContainerCommandBackend)),
 )
-@patch("bec_server.procedures.oop_worker_base.BECIPythonClient", MagicMock())
+@patch("bec_server.procedures.oop_worker_base.BECIPythonClient")
 @patch("bec_server.procedures.oop_worker_base.logger")
 @patch("bec_server.procedures.oop_worker_base.RedisConnector")
 @patch("bec_server.procedures.oop_worker_base.procedure_registry")
-def test_main_running(registry_mock, redis_mock, logger_mock):
-    redis_mock().blocking_list_pop_to_set_add.side_effect = [MockItem("1"), MockItem("2"), None]
+def test_main_running(registry_mock, redis_mock, logger_mock, client_mock):
+    client_mock().connector.blocking_list_pop_to_set_add.side_effect = [
+        MockItem("1"),
+        MockItem("2"),
+        None,
+    ]
     function_recorder = MagicMock()
     registry_mock.callable_from_execution_message.return_value = lambda *args, **kwargs: (
         function_recorder(*args, **kwargs)
@@ -154,6 +275,8 @@ def test_main_running(registry_mock, redis_mock, logger_mock):
     logger_mock.debug.assert_has_calls(
         [call("running task 1"), call("running task 2")], any_order=True
     )
+    # the worker uses the client's connector, only the output diverter opens its own
+    assert redis_mock.call_args_list.count(call("host:1111")) == 1
     logger_mock.success.assert_called_with("Procedure runner shutting down")
 
 
@@ -161,13 +284,13 @@ def test_main_running(registry_mock, redis_mock, logger_mock):
     "bec_server.procedures.container_worker.get_backend",
     MagicMock(return_value=MagicMock(spec=ContainerCommandBackend)),
 )
-@patch("bec_server.procedures.oop_worker_base.BECIPythonClient", MagicMock())
+@patch("bec_server.procedures.oop_worker_base.BECIPythonClient")
 @patch("bec_server.procedures.oop_worker_base.logger")
 @patch("bec_server.procedures.oop_worker_base.RedisConnector")
-def test_main_running_newly_registered_proc(redis_mock, logger_mock):
+def test_main_running_newly_registered_proc(redis_mock, logger_mock, client_mock):
     PROC_NAME = "new_test_procedure"
 
-    redis_mock().blocking_list_pop_to_set_add.side_effect = [
+    client_mock().connector.blocking_list_pop_to_set_add.side_effect = [
         MockItem(PROC_NAME, ("a",), {"b": "c"}),
         None,
     ]
@@ -133,8 +133,9 @@ class InlineWorker(SubProcessWorker):
                     "client_class": "BECIPythonClient",
                 },
             ),
-            patch("bec_server.procedures.oop_worker_base.RedisConnector", mock_redis_conn(tasks)),
+            patch("bec_server.procedures.oop_worker_base.RedisConnector", mock_redis_conn()),
         ):
+            client.return_value.connector = mock_redis_conn(tasks)(self._redis_server)
             oop_worker_main()
             return client
 
@@ -180,6 +181,33 @@ def test_procedure_manager_authenticates_with_forwarded_credentials():
     manager.shutdown()
 
 
+def test_procedure_manager_warms_up_worker_type():
+    worker_type = MagicMock()
+    worker_type.__name__ = "MockWorker"
+    with (
+        patch("bec_server.procedures.manager.RedisConnector", return_value=MagicMock()),
+        patch("bec_server.procedures.manager.BackendProcedureHelper", return_value=MagicMock()),
+    ):
+        manager = ProcedureManager(f"{FAKEREDIS_HOST}:{FAKEREDIS_PORT}", worker_type)
+    manager.shutdown()
+    worker_type.warm_up.assert_called_once()
+
+
+def test_procedure_manager_dispatches_messages_by_topic(procedure_manager: ProcedureManager):
+    abort_ep, clear_ep = (
+        MessageEndpoints.procedure_abort(),
+        MessageEndpoints.procedure_clear_unhandled(),
+    )
+    process_abort, process_clear = MagicMock(), MagicMock()
+    procedure_manager._dispatch_table[abort_ep.endpoint] = process_abort
+    procedure_manager._dispatch_table[clear_ep.endpoint] = process_clear
+
+    procedure_manager._conn.send(abort_ep, ProcedureAbortMessage(abort_all=True))
+    wait_until(lambda: process_abort.called, timeout_s=5)
+    assert process_abort.call_args.args[0].value == ProcedureAbortMessage(abort_all=True)
+    process_clear.assert_not_called()
+
+
 @pytest.mark.parametrize(["accepted", "msg"], zip([True, False], ["test true", "test false"]))
 def test_ack(procedure_manager: ProcedureManager, accepted: bool, msg: str):
     ps = procedure_manager._conn._managed_connection._redis_conn.pubsub()
@@ -239,17 +267,19 @@ def process_request_manager(procedure_manager: ProcedureManager):
 def test_process_request_happy_paths(
     process_request_manager, message: MessageObject[ProcedureRequestMessage]
 ):
-    process_request_manager._process_queue_request(message)
+    queue = message.value.queue or PROCEDURE.WORKER.DEFAULT_QUEUE
+    # hold the lock so the worker can't be cleaned up again before we check it was registered
+    with process_request_manager.lock:
+        process_request_manager._process_queue_request(message)
+        assert queue in process_request_manager._active_workers.keys()
     process_request_manager._ack.assert_called_with(
         True, f"Running procedure {message.value.identifier}", message.value.execution_id
     )
     process_request_manager._conn.rpush.assert_called()
     endpoint, execution_msg = process_request_manager._conn.rpush.call_args.args
-    queue = message.value.queue or PROCEDURE.WORKER.DEFAULT_QUEUE
     assert queue in endpoint.endpoint
     assert execution_msg.identifier == message.value.identifier
-    process_request_manager.spawn.assert_called()
-    assert queue in process_request_manager._active_workers.keys()
+    wait_until(lambda: process_request_manager.spawn.called)
 
 
 def test_process_request_failure(process_request_manager):
@@ -450,6 +480,38 @@ def test_manager_status_api(_conn, procedure_manager):
     wait_until(lambda: procedure_manager.active_workers() == [])
 
 
+@patch(
+    "bec_server.procedures.worker_base.RedisConnector",
+    side_effect=lambda *_: MagicMock(
+        blocking_list_pop_to_set_add=MagicMock(side_effect=_yield_once())
+    ),
+)
+def test_manager_status_api_does_not_wait_for_lock(_conn, procedure_manager):
+    procedure_manager._worker_cls = UnlockableWorker
+    procedure_manager._process_queue_request(PROCESS_REQUEST_TEST_CASES[0])
+    wait_until(lambda: procedure_manager.worker_status("primary") == ProcedureWorkerStatus.RUNNING)
+
+    lock_held, release_lock = threading.Event(), threading.Event()
+
+    def _hold_lock():
+        with procedure_manager.lock:
+            lock_held.set()
+            release_lock.wait()
+
+    holder = threading.Thread(target=_hold_lock)
+    holder.start()
+    lock_held.wait()
+    try:
+        assert procedure_manager.active_workers() == ["primary"]
+        assert procedure_manager.worker_statuses() == {"primary": ProcedureWorkerStatus.RUNNING}
+    finally:
+        release_lock.set()
+        holder.join()
+    procedure_manager._active_workers["primary"]["worker"].event_1.set()
+    procedure_manager._active_workers["primary"]["worker"].event_2.set()
+    wait_until(lambda: procedure_manager.active_workers() == [])
+
+
 _ManagerWithMsgs = tuple[ProcedureManager, list[ProcedureExecutionMessage]]
 
 
@@ -560,6 +622,23 @@ def test_abort_individual(manager_with_test_msgs: _ManagerWithMsgs):
     assert _all_eq_except_id(q2_execution_list, [q2_expected[0]])
 
 
+def test_abort_running_execution_only_notifies_its_queue_worker(procedure_manager):
+    msg = ProcedureExecutionMessage(identifier="sleep", queue="queue1", execution_id="running")
+    procedure_manager._messages_by_ids["running"] = msg
+    queue1_worker, queue2_worker = MagicMock(), MagicMock()
+    procedure_manager._active_workers = {
+        "queue1": {"worker": queue1_worker, "future": MagicMock()},
+        "queue2": {"worker": queue2_worker, "future": MagicMock()},
+    }
+
+    procedure_manager._abort_execution("running")
+    procedure_manager._active_workers = {}
+
+    queue1_worker.abort_execution.assert_called_once_with("running")
+    queue2_worker.abort_execution.assert_not_called()
+    assert "running" not in procedure_manager._messages_by_ids
+
+
 @patch("bec_server.procedures.oop_worker_base.BECIPythonClient", MagicMock)
 def test_abort_all(manager_with_test_msgs: _ManagerWithMsgs):
     procedure_manager, expected = manager_with_test_msgs
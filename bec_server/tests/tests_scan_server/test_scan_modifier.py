@@ -4,6 +4,7 @@ from unittest import mock
 
 import pytest
 
+from bec_server.scan_server.scans import scan_modifier as scan_modifier_module
 from bec_server.scan_server.scans.scan_base import ScanBase
 from bec_server.scan_server.scans.scan_modifier import (
     ScanModifier,
@@ -151,6 +152,11 @@ def test_scan_hook_impl_registers_hook_metadata():
     }
 
 
+def test_scan_hook_impl_is_cached_per_class():
+    assert get_scan_hooks_impl(_DummyModifier) is get_scan_hooks_impl(_DummyModifier)
+    assert get_scan_hooks_impl(_DummyModifier) is not get_scan_hooks_impl(_ScopedModifier)
+
+
 def test_scan_hook_impl_registers_scan_name_filters():
     hooks = get_scan_hooks_impl(_ScopedModifier)
 
@@ -290,3 +296,25 @@ def test_scan_modifier_hook_filters_raise_on_ambiguous_match(test_scan):
 
     with pytest.raises(ValueError, match="Multiple scan modifier implementations matched hook"):
         test_scan.post_scan()
+
+
+def test_scan_modifier_hook_methods_are_resolved_once_per_scan_name(test_scan):
+    test_scan._scan_modifier_hooks = get_scan_hooks_impl(_ScanNameFilteringModifier)
+    test_scan._scan_modifier = _ScanNameFilteringModifier(test_scan)
+
+    with mock.patch(
+        "bec_server.scan_server.scans.scan_modifier._get_hook_method_name",
+        wraps=scan_modifier_module._get_hook_method_name,
+    ) as get_method_name:
+        test_scan.at_each_point(1, [1, 2])
+        test_scan.at_each_point(2, [1, 2])
+        assert get_method_name.call_count == 3
+
+        test_scan.scan_name = "_v4_other_scan"
+        test_scan.at_each_point(3, [1, 2])
+        assert get_method_name.call_count == 6
+
+    assert test_scan.modifier_calls == [
+        ("replace_exact_match", 1, [1, 2]),
+        ("replace_exact_match", 2, [1, 2]),
+    ]
@@ -482,7 +482,7 @@ def test_config_helper_set_config_in_redis(config_handler):
         config = [{"name": "samx", "config": {}}]
         config_handler.set_config_in_redis(config)
         msg = messages.AvailableResourceMessage(resource=config)
-        set.assert_called_once_with(MessageEndpoints.device_config(), msg)
+        set.assert_called_once_with(MessageEndpoints.device_config(), msg, pipe=None)
 
 
 def test_config_handler_add_devices_to_redis(config_handler):
@@ -562,13 +562,23 @@ def test_config_handler_remove_from_config(config_handler):
 
 def test_config_handler_reset_config(config_handler):
     msg = messages.DeviceConfigMessage(action="reset", config=None, metadata={"RID": "12345"})
-    with mock.patch.object(config_handler, "set_config_in_redis") as set_config:
-        with mock.patch.object(config_handler, "send_config_request_reply") as req_reply:
-            config_handler._reset_config(msg)
-            set_config.assert_called_once_with([])
-            req_reply.assert_called_once_with(
-                accepted=True, error_msg=None, metadata={"RID": "12345"}
-            )
+    with (
+        mock.patch.object(config_handler, "connector") as connector,
+        mock.patch.object(config_handler, "set_config_in_redis") as set_config,
+        mock.patch.object(config_handler, "send_config_request_reply") as req_reply,
+        mock.patch.object(config_handler, "send_config") as send_config,
+    ):
+        config_handler._reset_config(msg)
+        pipe = connector.pipeline.return_value
+        set_config.assert_called_once_with([], pipe=pipe)
+        req_reply.assert_called_once_with(
+            accepted=True, error_msg=None, metadata={"RID": "12345"}, pipe=pipe
+        )
+        send_config.assert_called_once_with(
+            messages.DeviceConfigMessage(action="reload", config={}, metadata={"RID": "12345"}),
+            pipe=pipe,
+        )
+        pipe.execute.assert_called_once()
 
 
 def test_handle_config_request_callback_normal_request(config_handler):